@@ -0,0 +1,104 @@
+"""Nearest-airport and radius queries: a scan measuring every airport, the same scan
+vectorised with NumPy, and `AirportIndex`.
+
+Run from the root of the repository:
+
+    python -m benchmarks.airport_index [airports] [queries]
+
+Airports and query points are spread evenly over the globe. Each query asks for the 5
+nearest airports, then for those within 150 km.
+"""
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+from duffel_api import AirportIndex
+from duffel_api.airport_index import EARTH_RADIUS_KM, haversine_km
+
+RADIUS_KM = 150
+
+
+def random_point(rng):
+    """A latitude and longitude, uniformly distributed on the sphere"""
+    return math.degrees(math.asin(rng.uniform(-1, 1))), rng.uniform(-180, 180)
+
+
+def distance_km(latitude1, longitude1, latitude2, longitude2):
+    """Haversine distance between two points"""
+    lat1, lon1, lat2, lon2 = map(
+        math.radians, (latitude1, longitude1, latitude2, longitude2)
+    )
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def python_scan(airports, points):
+    """Measure every airport from every point"""
+    for latitude, longitude in points:
+        distances = sorted(
+            (distance_km(latitude, longitude, airport[0], airport[1]), index)
+            for index, airport in enumerate(airports)
+        )
+        distances[:5]
+        [index for distance, index in distances if distance <= RADIUS_KM]
+
+
+def numpy_scan(airports, points):
+    """Measure every airport from every point, all airports at once"""
+    latitudes = np.array([airport[0] for airport in airports])
+    longitudes = np.array([airport[1] for airport in airports])
+    for latitude, longitude in points:
+        distances = haversine_km(latitude, longitude, latitudes, longitudes)
+        nearest = np.argpartition(distances, 5)[:5]
+        nearest[np.argsort(distances[nearest])]
+        np.flatnonzero(distances <= RADIUS_KM)
+
+
+def indexed(index, points):
+    """Ask the k-d tree"""
+    for latitude, longitude in points:
+        index.nearest(latitude, longitude, k=5)
+        index.within(latitude, longitude, RADIUS_KM)
+
+
+def timed(function, *args):
+    """Seconds `function` takes"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = random.Random(1)
+    airports = [random_point(rng) for _ in range(count)]
+    points = [random_point(rng) for _ in range(queries)]
+
+    build = timed(
+        AirportIndex,
+        [
+            {"latitude": latitude, "longitude": longitude}
+            for latitude, longitude in airports
+        ],
+    )
+    index = AirportIndex(
+        [
+            {"latitude": latitude, "longitude": longitude}
+            for latitude, longitude in airports
+        ]
+    )
+    print(f"airports={count} queries={queries} index_build={build * 1000:.0f}ms")
+    for name, function, data in (
+        ("python_scan", python_scan, airports),
+        ("numpy_scan", numpy_scan, airports),
+        ("kd_tree", indexed, index),
+    ):
+        seconds = timed(function, data, points)
+        print(f"{name:<12} {seconds / queries * 1e6:.0f}us per query")
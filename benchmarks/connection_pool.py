@@ -0,0 +1,83 @@
+"""Count the connections opened by a search, book and seat map workflow.
+
+Run from the root of the repository:
+
+    python -m benchmarks.connection_pool [iterations]
+
+The workflow is run twice against a local stub server: once with clients that build
+their own transport (how every `Duffel` sub-client used to behave) and once through a
+single `Duffel` instance sharing one transport.
+"""
+import sys
+import time
+
+from duffel_api import Duffel
+from duffel_api.api import OfferClient, OfferRequestClient, OrderClient, SeatMapClient
+from tests.stub_server import fixture_body, stub_server
+
+ROUTES = {
+    ("POST", "/air/offer_requests"): (201, fixture_body("create-offer-request")),
+    ("GET", "/air/offers/off_00009htYpSCXrwaB9DnUm0"): (
+        200,
+        fixture_body("get-offer-by-id"),
+    ),
+    ("GET", "/air/seat_maps"): (200, fixture_body("get-seat-maps")),
+    ("POST", "/air/orders"): (201, fixture_body("create-instant-order")),
+}
+
+
+def workflow(offer_requests, offers, seat_maps, orders):
+    """Search, look at the offer and its seat map, then book it"""
+    offer_request = (
+        offer_requests.create()
+        .passengers([{"type": "adult"}])
+        .slices(
+            [{"origin": "LHR", "destination": "JFK", "departure_date": "2030-01-01"}]
+        )
+        .return_offers()
+        .execute()
+    )
+    offer = offers.get(offer_request.offers[0].id)
+    seat_maps.get(offer.id)
+    orders.create().selected_offers([offer.id]).passengers(
+        [{"id": offer.passengers[0].id, "given_name": "Amelia"}]
+    ).payments(
+        [{"type": "balance", "currency": "GBP", "amount": offer.total_amount}]
+    ).execute()
+
+
+def run(label, iterations, make_clients):
+    """Run the workflow `iterations` times and report connections opened"""
+    with stub_server(ROUTES) as server:
+        clients = make_clients(server.url)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            workflow(*clients)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<24} requests={len(server.requests):<5} "
+            f"connections={server.connections:<4} time={elapsed * 1000:.1f}ms"
+        )
+
+
+def separate_transports(url):
+    """One transport (and connection pool) per client"""
+    kwargs = {"access_token": "some_token", "api_url": url}
+    return (
+        OfferRequestClient(**kwargs),
+        OfferClient(**kwargs),
+        SeatMapClient(**kwargs),
+        OrderClient(**kwargs),
+    )
+
+
+def shared_transport(url):
+    """All clients going through one `Duffel` instance"""
+    client = Duffel(access_token="some_token", api_url=url)
+    return (client.offer_requests, client.offers, client.seat_maps, client.orders)
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    run("separate transports", iterations, separate_transports)
+    run("shared transport", iterations, shared_transport)
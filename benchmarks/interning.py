@@ -0,0 +1,54 @@
+"""Memory and CPU time of parsing a large search response with and without sharing
+reference models (airports, airlines, aircraft, cities) between offers.
+
+Run from the root of the repository:
+
+    python -m benchmarks.interning [offers]
+
+The synthetic response has `offers` copies of the offer fixture, decoded from text so
+that, like in a real response, no two offers share any JSON object.
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from duffel_api.models import REFERENCE_POOL, Offer
+from tests.stub_server import fixture_body
+
+
+def synthetic_offers(count):
+    """`count` copies of the offer fixture, with distinct IDs"""
+    offer = json.loads(fixture_body("get-offer-by-id"))["data"]
+    return json.loads(json.dumps([dict(offer, id=f"off_{i}") for i in range(count)]))
+
+
+def parse(data):
+    """Build every offer"""
+    return [Offer.from_json(entry) for entry in data]
+
+
+def measure(data):
+    """CPU time (ms) to parse `data`, then the memory (KiB) held by the offers"""
+    REFERENCE_POOL.clear()
+    start = time.process_time()
+    parse(data)
+    cpu = (time.process_time() - start) * 1000
+
+    REFERENCE_POOL.clear()
+    tracemalloc.start()
+    offers = parse(data)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del offers
+    return cpu, size / 1024
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    maxsize = REFERENCE_POOL.maxsize
+    for label, size in (("before (no pool)", 0), ("after (pool)", maxsize)):
+        REFERENCE_POOL.maxsize = size
+        cpu, memory = measure(synthetic_offers(count))
+        print(f"{label:<17} offers={count} cpu={cpu:.0f}ms memory={memory:.0f}KiB")
+    REFERENCE_POOL.maxsize = maxsize
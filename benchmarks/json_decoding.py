@@ -0,0 +1,49 @@
+"""Decoding time of large responses with the stdlib and orjson codecs.
+
+Run from the root of the repository:
+
+    python -m benchmarks.json_decoding [copies]
+
+Besides the fixtures themselves, each one is also decoded with its offers repeated
+`copies` times, which is closer to what a `return_offers` search sends back.
+"""
+import json
+import sys
+import timeit
+
+from duffel_api import JsonCodec, OrjsonCodec
+from tests.stub_server import fixture_body
+
+
+def scaled(name, copies):
+    """The fixture `name` with its list of offers repeated `copies` times"""
+    body = json.loads(fixture_body(name))
+    data = body["data"]
+    if isinstance(data, list):
+        body["data"] = data * copies
+    else:
+        data["offers"] = data["offers"] * copies
+    return json.dumps(body).encode()
+
+
+def codecs():
+    """The codecs available in this environment"""
+    available = [JsonCodec()]
+    try:
+        available.append(OrjsonCodec())
+    except ImportError:
+        print("orjson is not installed, only the stdlib codec is measured")
+    return available
+
+
+if __name__ == "__main__":
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for name in ("get-offers", "create-offer-request"):
+        bodies = {name: fixture_body(name), f"{name} x{copies}": scaled(name, copies)}
+        for label, body in bodies.items():
+            for codec in codecs():
+                runs, total = timeit.Timer(lambda: codec.loads(body)).autorange()
+                print(
+                    f"{label:<30} {len(body) / 1024:>8.0f}KiB "
+                    f"{codec.name:<7} {total / runs * 1e6:>10.1f}us"
+                )
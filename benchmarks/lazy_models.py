@@ -0,0 +1,63 @@
+"""CPU time and memory of eager `Offer`s against `LazyOffer`s.
+
+Run from the root of the repository:
+
+    python -m benchmarks.lazy_models [offers]
+
+Builds a synthetic response of `offers` copies of the offer fixture and reads what a
+typical ranking does: the total amount, the owner and the first slice's duration. The
+memory is what the models add on top of the decoded JSON, which both keep around.
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from duffel_api.models import LazyOffer, Offer
+from tests.stub_server import fixture_body
+
+
+def synthetic_offers(count):
+    """`count` copies of the offer fixture, with distinct IDs and amounts"""
+    offer = json.loads(fixture_body("get-offer-by-id"))["data"]
+    body = json.dumps(
+        [dict(offer, id=f"off_{i}", total_amount=f"{i}.00") for i in range(count)]
+    )
+    # Decode from text so that no two offers share nested objects
+    return json.loads(body)
+
+
+def rank(model, data):
+    """Build the offers and read the fields used for ranking them"""
+    offers = [model.from_json(entry) for entry in data]
+    for offer in offers:
+        (offer.total_amount, offer.owner.iata_code, offer.slices[0].duration)
+    return offers
+
+
+def cpu_time(model, data):
+    """CPU time (ms) taken by `rank`"""
+    start = time.process_time()
+    rank(model, data)
+    return (time.process_time() - start) * 1000
+
+
+def memory(model, data):
+    """Memory (KiB) held by the offers built by `rank`"""
+    tracemalloc.start()
+    offers = rank(model, data)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del offers
+    return size / 1024
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    for model in (Offer, LazyOffer):
+        # Measured separately as tracemalloc slows allocations down
+        cpu = cpu_time(model, synthetic_offers(count))
+        size = memory(model, synthetic_offers(count))
+        print(
+            f"{model.__name__:<10} offers={count} cpu={cpu:.0f}ms memory={size:.0f}KiB"
+        )
@@ -0,0 +1,40 @@
+"""Memory held by parsed models, in bytes per `Offer` and per `SeatMap`.
+
+Run from the root of the repository:
+
+    python -m benchmarks.model_memory [copies]
+
+Each fixture is copied `copies` times and decoded from text, so that the models don't
+share any JSON, then parsed while tracemalloc counts what the models hold on to.
+"""
+import json
+import sys
+import tracemalloc
+
+from duffel_api.models import REFERENCE_POOL, Offer, SeatMap
+from tests.stub_server import fixture_body
+
+
+def copies_of(name, count):
+    """`count` copies of the first entry of the fixture `name`"""
+    data = json.loads(fixture_body(name))["data"]
+    entry = data[0] if isinstance(data, list) else data
+    return json.loads(json.dumps([entry] * count))
+
+
+def bytes_per_model(model, data):
+    """Average memory held by each model built from `data`"""
+    REFERENCE_POOL.clear()
+    tracemalloc.start()
+    models = [model.from_json(entry) for entry in data]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    return size / len(data)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    for model, fixture in ((Offer, "get-offer-by-id"), (SeatMap, "get-seat-maps")):
+        size = bytes_per_model(model, copies_of(fixture, count))
+        print(f"{model.__name__:<8} copies={count} bytes={size:.0f}")
@@ -0,0 +1,59 @@
+"""Time taken by `from_json` on the fixtures, scaled up to thousands of records.
+
+Run from the root of the repository:
+
+    python -m benchmarks.model_parsing [records]
+
+Each fixture is repeated until there are `records` of them, decoded from text so that
+no record shares JSON with another, and parsed with its model.
+"""
+import json
+import sys
+import time
+
+from duffel_api.models import (
+    REFERENCE_POOL,
+    Offer,
+    OfferRequest,
+    Order,
+    OrderChangeOffer,
+    SeatMap,
+)
+from tests.stub_server import fixture_body
+
+FIXTURES = (
+    (Offer, "get-offer-by-id"),
+    (Order, "get-order-by-id"),
+    (OfferRequest, "create-offer-request"),
+    (SeatMap, "get-seat-maps"),
+    (OrderChangeOffer, "get-order-change-offer-by-id"),
+)
+
+
+def records(name, count):
+    """`count` copies of the first record of the fixture `name`"""
+    data = json.loads(fixture_body(name))["data"]
+    record = data[0] if isinstance(data, list) else data
+    return json.loads(json.dumps([record] * count))
+
+
+def parse_time(model, data):
+    """Seconds taken to parse every record, the best of three runs"""
+    best = float("inf")
+    for _ in range(3):
+        REFERENCE_POOL.clear()
+        start = time.perf_counter()
+        for record in data:
+            model.from_json(record)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    for model, name in FIXTURES:
+        elapsed = parse_time(model, records(name, count))
+        print(
+            f"{model.__name__:<17} records={count} time={elapsed * 1000:.0f}ms "
+            f"per_record={elapsed / count * 1e6:.1f}us"
+        )
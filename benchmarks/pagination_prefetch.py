@@ -0,0 +1,57 @@
+"""Wall-clock time of a full /air/airports walk with and without page prefetching.
+
+Run from the root of the repository:
+
+    python -m benchmarks.pagination_prefetch [pages] [latency_ms]
+
+The stub server adds a fixed latency to every page and the consumer does a small amount
+of work per airport, so prefetching overlaps the two instead of paying for both.
+"""
+import json
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from duffel_api import Duffel
+from tests.stub_server import fixture_body, stub_server
+
+PAGE_SIZE = 200
+WORK_PER_ITEM = 0.0002
+
+
+def airports_route(pages):
+    """Route serving `pages` pages of `PAGE_SIZE` copies of the airport fixture"""
+    airport = json.loads(fixture_body("get-airport-by-id"))["data"]
+
+    def route(handler):
+        """Answer the page the `after` cursor points to"""
+        query = parse_qs(urlsplit(handler.path).query)
+        page = int(query.get("after", ["0"])[0])
+        after = str(page + 1) if page + 1 < pages else None
+        data = [dict(airport, id=f"arp_{page}_{i}") for i in range(PAGE_SIZE)]
+        return 200, {"meta": {"after": after, "limit": PAGE_SIZE}, "data": data}
+
+    return route
+
+
+def walk(url, prefetch):
+    """Consume every airport, spending `WORK_PER_ITEM` seconds on each"""
+    client = Duffel(access_token="some_token", api_url=url)
+    count = 0
+    for _ in client.airports.list(limit=PAGE_SIZE, prefetch=prefetch):
+        time.sleep(WORK_PER_ITEM)
+        count += 1
+    client.close()
+    return count
+
+
+if __name__ == "__main__":
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.1
+    routes = {("GET", "/air/airports"): airports_route(pages)}
+    with stub_server(routes, delay=latency) as server:
+        for prefetch in (0, 1, 2):
+            start = time.perf_counter()
+            count = walk(server.url, prefetch)
+            elapsed = time.perf_counter() - start
+            print(f"prefetch={prefetch} airports={count} time={elapsed * 1000:.0f}ms")
@@ -0,0 +1,98 @@
+"""Autocompleting city and airport names: a scan comparing the query with every name,
+and `PlaceIndex`.
+
+Run from the root of the repository:
+
+    python -m benchmarks.place_index [airports] [queries]
+
+Airports get made-up names of two words, three airports to a city. Queries are the
+first letters of a name, half of them with a typo in the first word.
+"""
+import random
+import string
+import sys
+import time
+
+from duffel_api import PlaceIndex
+from duffel_api.place_index import normalise
+
+
+def random_word(rng):
+    """A made-up word of 4 to 10 letters"""
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+
+
+def random_airports(count, seed=5):
+    """JSON of `count` airports with made-up names and codes"""
+    rng = random.Random(seed)
+    airports = []
+    for index in range(count):
+        city = index // 3
+        airports.append(
+            {
+                "id": f"arp_{index}",
+                "name": f"{random_word(rng).title()} {random_word(rng).title()}",
+                "iata_code": f"A{index:05}",
+                "icao_code": f"I{index:05}",
+                "iata_country_code": f"C{city % 200}",
+                "latitude": 0.0,
+                "longitude": 0.0,
+                "time_zone": "UTC",
+                "city": {
+                    "id": f"cit_{city}",
+                    "name": random_word(rng).title(),
+                    "iata_code": f"B{city:05}",
+                    "iata_country_code": f"C{city % 200}",
+                },
+            }
+        )
+    return airports
+
+
+def query(rng, airport):
+    """What a user might have typed so far to find `airport`"""
+    first, second = normalise(airport["name"])
+    if rng.random() < 0.5:
+        position = rng.randrange(len(first))
+        first = first[:position] + first[position + 1 :]  # noqa: E203
+    return f"{first} {second[:3]}"
+
+
+def scan(airports, text):
+    """Airports whose words start with those of `text`, no typo allowed"""
+    words = normalise(text)
+    return [
+        airport
+        for airport in airports
+        if all(
+            any(name.startswith(word) for name in normalise(airport["name"]))
+            for word in words
+        )
+    ]
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    rng = random.Random(7)
+    airports = random_airports(count)
+    texts = [query(rng, airport) for airport in rng.sample(airports, queries)]
+
+    start = time.perf_counter()
+    for text in texts[:20]:
+        scan(airports, text)
+    scanned = (time.perf_counter() - start) / 20
+
+    start = time.perf_counter()
+    index = PlaceIndex(airports)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    found = sum(bool(index.search(text, limit=5)) for text in texts)
+    searched = (time.perf_counter() - start) / queries
+
+    print(f"airports={count} queries={queries}")
+    print(f"scan        {scanned * 1e6:.0f}us per query (no typos)")
+    print(
+        f"PlaceIndex  build={built * 1000:.0f}ms {searched * 1e6:.0f}us per query, "
+        f"{found}/{queries} found"
+    )
@@ -0,0 +1,79 @@
+"""Startup cost of resolving airport codes: listing every airport from the API against
+opening a local snapshot.
+
+Run from the root of the repository:
+
+    python -m benchmarks.reference_snapshot [airports] [latency_ms]
+
+The stub server serves `airports` copies of the airport fixture 200 per page, each
+page after `latency_ms`, as the API would. Both ways then resolve 1000 IATA codes.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from duffel_api import Duffel, ReferenceSnapshot
+from duffel_api.reference_data import refresh
+from tests.stub_server import fixture_body, stub_server
+
+PAGE_SIZE = 200
+
+
+def airports_route(count):
+    """Route serving `count` airports, `PAGE_SIZE` per page"""
+    airport = json.loads(fixture_body("get-airport-by-id"))["data"]
+
+    def route(handler):
+        """Answer the page the `after` cursor points to"""
+        start = int(parse_qs(urlsplit(handler.path).query).get("after", ["0"])[0])
+        stop = min(start + PAGE_SIZE, count)
+        data = [
+            dict(airport, id=f"arp_{index}", iata_code=f"{index:05}")
+            for index in range(start, stop)
+        ]
+        after = str(stop) if stop < count else None
+        return 200, {"meta": {"after": after, "limit": PAGE_SIZE}, "data": data}
+
+    return route
+
+
+def empty(handler):
+    """An empty list"""
+    return 200, {"meta": {"after": None, "limit": PAGE_SIZE}, "data": []}
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.05
+    codes = [f"{index:05}" for index in range(0, count, max(count // 1000, 1))]
+    routes = {
+        ("GET", "/air/airports"): airports_route(count),
+        ("GET", "/air/airlines"): empty,
+        ("GET", "/air/aircraft"): empty,
+    }
+    path = os.path.join(tempfile.mkdtemp(), "reference.sqlite")
+    with stub_server(routes, delay=latency) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+
+        start = time.perf_counter()
+        airports = {airport.iata_code: airport for airport in client.airports.list(200)}
+        found = [airports[code] for code in codes]
+        listed = time.perf_counter() - start
+
+        refresh(path, client)
+
+    start = time.perf_counter()
+    snapshot = ReferenceSnapshot(path)
+    opened = time.perf_counter() - start
+    found = [snapshot.airports.by_iata[code] for code in codes]
+    looked_up = time.perf_counter() - start - opened
+
+    print(f"airports={count} latency={latency * 1000:.0f}ms")
+    print(f"list      startup={listed * 1000:.0f}ms")
+    print(
+        f"snapshot  open={opened * 1000:.1f}ms "
+        f"lookups={looked_up / len(codes) * 1e6:.0f}us each"
+    )
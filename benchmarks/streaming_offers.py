@@ -0,0 +1,86 @@
+"""Peak memory and time to the first offer of a large offer request response, read
+whole against streamed.
+
+Run from the root of the repository:
+
+    python -m benchmarks.streaming_offers [offers]
+
+Builds a synthetic `return_offers` response of `offers` copies of the offer fixture
+and hands it over in 64 KiB chunks, as the network would. Both ways keep only the
+cheapest offer, as a search page would, so the peak is what reading the response
+costs.
+"""
+import json
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+
+from duffel_api.models import Offer, OfferRequest
+from duffel_api.streaming import iter_json_array
+from tests.stub_server import fixture_body
+
+CHUNK = 65536
+
+
+def synthetic_body(count):
+    """Response to an offer request with `count` copies of the offer fixture"""
+    document = json.loads(fixture_body("create-offer-request"))
+    offer = json.loads(fixture_body("get-offer-by-id"))["data"]
+    document["data"]["offers"] = [
+        dict(offer, id=f"off_{i}", total_amount=f"{count - i}.00") for i in range(count)
+    ]
+    return json.dumps(document).encode()
+
+
+def chunks(body):
+    """The body cut in network sized chunks"""
+    for start in range(0, len(body), CHUNK):
+        yield body[start : start + CHUNK]  # noqa: E203
+
+
+def whole(body, on_first):
+    """What `execute()` does: read the body, decode it and build every offer"""
+    data = json.loads(b"".join(chunks(body)))["data"]
+    offers = OfferRequest.from_json(data).offers
+    on_first()
+    return min(offers, key=lambda offer: Decimal(offer.total_amount))
+
+
+def streamed(body, on_first):
+    """What `stream()` does: build the offers one at a time as they are received"""
+    cheapest = None
+    for entry in iter_json_array(chunks(body), ("data", "offers")):
+        offer = Offer.from_json(entry)
+        if cheapest is None:
+            on_first()
+            cheapest = offer
+        elif Decimal(offer.total_amount) < Decimal(cheapest.total_amount):
+            cheapest = offer
+    return cheapest
+
+
+def measure(read, body):
+    """Time (ms) to the first offer, total time (ms) and peak memory (MiB)"""
+    first = []
+    start = time.perf_counter()
+    read(body, lambda: first.append(time.perf_counter()))
+    total = time.perf_counter() - start
+
+    tracemalloc.start()
+    read(body, lambda: None)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (first[0] - start) * 1000, total * 1000, peak / 2**20
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    body = synthetic_body(count)
+    print(f"offers={count} body={len(body) / 2**20:.1f}MiB")
+    for read in (whole, streamed):
+        first, total, peak = measure(read, body)
+        print(
+            f"{read.__name__:<9} first_offer={first:.0f}ms total={total:.0f}ms "
+            f"peak={peak:.1f}MiB"
+        )
@@ -1,5 +1,51 @@
 """Python library for the Duffel API"""
+from .airport_index import AirportIndex, NearbyAirport
+from .async_client import AsyncDuffel
+from .batch import BatchResult
+from .calendar import CalendarFare, FareCalendar
 from .client import Duffel
 from .http_client import ApiError, ClientError
+from .json_codec import JsonCodec, OrjsonCodec
+from .offer_index import OfferIndex
+from .offer_selection import deduplicate_offers, pareto_front
+from .offer_table import OfferTable
+from .place_index import PlaceIndex
+from .rate_limit import RateLimiter, TokenBucket
+from .reference_data import ReferenceSnapshot
+from .retry import RetryPolicy
+from .seat_grid import SeatChoice, SeatGrid
+from .search_cache import (
+    CacheBackend,
+    SearchCache,
+    SeatMapCache,
+    SqliteCacheBackend,
+)
 
-__all__ = ["Duffel", "ClientError", "ApiError"]
+__all__ = [
+    "AirportIndex",
+    "AsyncDuffel",
+    "CacheBackend",
+    "BatchResult",
+    "CalendarFare",
+    "Duffel",
+    "ClientError",
+    "ApiError",
+    "FareCalendar",
+    "JsonCodec",
+    "NearbyAirport",
+    "OrjsonCodec",
+    "OfferIndex",
+    "OfferTable",
+    "PlaceIndex",
+    "RateLimiter",
+    "ReferenceSnapshot",
+    "RetryPolicy",
+    "SearchCache",
+    "SeatChoice",
+    "SeatGrid",
+    "SeatMapCache",
+    "SqliteCacheBackend",
+    "TokenBucket",
+    "deduplicate_offers",
+    "pareto_front",
+]
@@ -0,0 +1,193 @@
+"""Finding the airports near a point without measuring the distance to every airport"""
+import heapq
+import math
+from typing import Any, NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
+
+from .http_client import ClientError
+
+# Mean radius of the Earth
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(latitude1, longitude1, latitude2, longitude2):
+    """Great-circle distance in kilometres between points given in degrees.
+
+    Arguments may be NumPy arrays (or lists), which are broadcast against each other,
+    e.g. to get the distance from one point to many at once. Requires numpy.
+    """
+    if np is None:
+        raise ClientError(
+            "numpy is required for haversine_km: pip install duffel-api[numpy]"
+        )
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(value, dtype=np.float64))
+        for value in (latitude1, longitude1, latitude2, longitude2)
+    )
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _unit_vector(latitude, longitude):
+    """Point of the unit sphere at a latitude and longitude in degrees"""
+    lat, lon = math.radians(latitude), math.radians(longitude)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat))
+
+
+def _chord_to_km(squared_chord):
+    """Great-circle distance between two points of the unit sphere, in kilometres,
+    from the square of the straight line between them
+    """
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(squared_chord) / 2))
+
+
+def _coordinates(airport):
+    """Latitude and longitude of an `Airport` or of its JSON"""
+    if isinstance(airport, dict):
+        return airport.get("latitude"), airport.get("longitude")
+    return airport.latitude, airport.longitude
+
+
+class NearbyAirport(NamedTuple):
+    """An airport found near a point, and how far it is from it"""
+
+    airport: Any
+    distance_km: float
+
+
+class AirportIndex:
+    """k-d tree of airports, answering "the k nearest airports" and "the airports
+    within this distance" of a point in logarithmic time on average.
+
+    Built from `Airport`s or their JSON, e.g. `client.airports.list(200)` or the
+    `airports` of a `ReferenceSnapshot` (see `from_snapshot`). Airports without
+    coordinates are left out. Points are placed on a sphere, where the straight
+    distance between two of them grows with the great-circle distance, so distances
+    are exact whatever the latitude and there is no edge at the antimeridian.
+    """
+
+    def __init__(self, airports):
+        self.airports = []
+        self._points = []
+        for airport in airports:
+            latitude, longitude = _coordinates(airport)
+            if latitude is None or longitude is None:
+                continue
+            self.airports.append(airport)
+            self._points.append(_unit_vector(latitude, longitude))
+        # The tree is implicit: each range of `_order` has its node in the middle,
+        # the points on either side of it along `_axes[middle]` in the two halves
+        self._order = list(range(len(self._points)))
+        self._axes = [0] * len(self._points)
+        self._build(0, len(self._order))
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Index the airports of a `ReferenceSnapshot`"""
+        return cls(snapshot.airports.values())
+
+    def __len__(self):
+        """Number of airports indexed"""
+        return len(self.airports)
+
+    def _build(self, start, stop):
+        """Arrange `_order[start:stop]` as a subtree"""
+        while stop - start > 1:
+            positions = self._order[start:stop]
+            spreads = [
+                max(self._points[p][axis] for p in positions)
+                - min(self._points[p][axis] for p in positions)
+                for axis in range(3)
+            ]
+            axis = spreads.index(max(spreads))
+            positions.sort(key=lambda p: self._points[p][axis])
+            self._order[start:stop] = positions
+            middle = (start + stop) // 2
+            self._axes[middle] = axis
+            self._build(start, middle)
+            start = middle + 1
+
+    def nearest(self, latitude, longitude, k=1):
+        """The `k` airports nearest to a point, nearest first"""
+        if k < 1:
+            return []
+        query = _unit_vector(latitude, longitude)
+        # Max-heap of the best candidates so far, as (-squared chord, position)
+        best = []
+
+        def visit(start, stop):
+            """Look for candidates in a subtree"""
+            while start < stop:
+                middle = (start + stop) // 2
+                position = self._order[middle]
+                point = self._points[position]
+                distance = _squared_distance(query, point)
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, position))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, position))
+
+                offset = query[self._axes[middle]] - point[self._axes[middle]]
+                if offset < 0:
+                    near, far = (start, middle), (middle + 1, stop)
+                else:
+                    near, far = (middle + 1, stop), (start, middle)
+                visit(*near)
+                if len(best) == k and offset * offset >= -best[0][0]:
+                    return
+                start, stop = far
+
+        visit(0, len(self._order))
+        return [
+            NearbyAirport(self.airports[position], _chord_to_km(distance))
+            for distance, position in sorted((-negative, p) for negative, p in best)
+        ]
+
+    def within(self, latitude, longitude, radius_km):
+        """The airports at most `radius_km` from a point, nearest first"""
+        query = _unit_vector(latitude, longitude)
+        angle = min(radius_km / EARTH_RADIUS_KM, math.pi)
+        limit = (2 * math.sin(angle / 2)) ** 2
+        found = []
+
+        def visit(start, stop):
+            """Collect the airports in range in a subtree"""
+            while start < stop:
+                middle = (start + stop) // 2
+                position = self._order[middle]
+                point = self._points[position]
+                distance = _squared_distance(query, point)
+                if distance <= limit:
+                    found.append((distance, position))
+
+                offset = query[self._axes[middle]] - point[self._axes[middle]]
+                if offset < 0:
+                    near, far = (start, middle), (middle + 1, stop)
+                else:
+                    near, far = (middle + 1, stop), (start, middle)
+                visit(*near)
+                if offset * offset > limit:
+                    return
+                start, stop = far
+
+        visit(0, len(self._order))
+        return [
+            NearbyAirport(self.airports[position], _chord_to_km(distance))
+            for distance, position in sorted(found)
+        ]
+
+    def nearest_many(self, points, k=1):
+        """`nearest` for each `(latitude, longitude)` of `points`"""
+        return [self.nearest(latitude, longitude, k) for latitude, longitude in points]
+
+
+def _squared_distance(a, b):
+    """Square of the straight distance between two points"""
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
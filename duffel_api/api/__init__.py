@@ -1,27 +1,82 @@
-from .booking.offer_requests import OfferRequestClient, OfferRequestCreate
-from .booking.offers import OfferClient
-from .booking.orders import OrderClient, OrderCreate, OrderUpdate
-from .booking.order_cancellations import OrderCancellationClient
-from .booking.order_changes import OrderChangeClient
-from .booking.order_change_offers import OrderChangeOfferClient
-from .booking.order_change_requests import OrderChangeRequestClient
+from .booking.offer_requests import (
+    AsyncOfferRequestClient,
+    AsyncOfferRequestCreate,
+    OfferRequestClient,
+    OfferRequestCreate,
+)
+from .booking.offers import AsyncOfferClient, OfferClient
+from .booking.orders import (
+    AsyncOrderClient,
+    AsyncOrderCreate,
+    AsyncOrderUpdate,
+    OrderClient,
+    OrderCreate,
+    OrderUpdate,
+)
+from .booking.order_cancellations import (
+    AsyncOrderCancellationClient,
+    OrderCancellationClient,
+)
+from .booking.order_changes import AsyncOrderChangeClient, OrderChangeClient
+from .booking.order_change_offers import (
+    AsyncOrderChangeOfferClient,
+    OrderChangeOfferClient,
+)
+from .booking.order_change_requests import (
+    AsyncOrderChangeRequestClient,
+    OrderChangeRequestClient,
+)
 from .booking.partial_offer_requests import (
+    AsyncPartialOfferRequestClient,
+    AsyncPartialOfferRequestCreate,
     PartialOfferRequestClient,
     PartialOfferRequestCreate,
 )
-from .booking.payments import PaymentClient
-from .booking.seat_maps import SeatMapClient
-from .duffel_payments.payment_intents import PaymentIntentClient, PaymentIntentCreate
-from .links.sessions import LinksSessionClient, LinksSessionCreate
-from .notifications.webhooks import WebhookClient
-from .supporting.aircraft import AircraftClient
-from .supporting.airports import AirportClient
-from .supporting.airlines import AirlineClient
+from .booking.payments import AsyncPaymentClient, PaymentClient
+from .booking.seat_maps import AsyncSeatMapClient, SeatMapClient
+from .duffel_payments.payment_intents import (
+    AsyncPaymentIntentClient,
+    AsyncPaymentIntentCreate,
+    PaymentIntentClient,
+    PaymentIntentCreate,
+)
+from .links.sessions import (
+    AsyncLinksSessionClient,
+    AsyncLinksSessionCreate,
+    LinksSessionClient,
+    LinksSessionCreate,
+)
+from .notifications.webhooks import AsyncWebhookClient, WebhookClient
+from .supporting.aircraft import AircraftClient, AsyncAircraftClient
+from .supporting.airports import AirportClient, AsyncAirportClient
+from .supporting.airlines import AirlineClient, AsyncAirlineClient
 
 __all__ = [
     "AircraftClient",
     "AirportClient",
     "AirlineClient",
+    "AsyncAircraftClient",
+    "AsyncAirportClient",
+    "AsyncAirlineClient",
+    "AsyncLinksSessionClient",
+    "AsyncLinksSessionCreate",
+    "AsyncOfferRequestClient",
+    "AsyncOfferRequestCreate",
+    "AsyncOfferClient",
+    "AsyncOrderChangeClient",
+    "AsyncOrderChangeOfferClient",
+    "AsyncOrderChangeRequestClient",
+    "AsyncOrderClient",
+    "AsyncOrderCreate",
+    "AsyncOrderUpdate",
+    "AsyncOrderCancellationClient",
+    "AsyncPartialOfferRequestClient",
+    "AsyncPartialOfferRequestCreate",
+    "AsyncPaymentClient",
+    "AsyncPaymentIntentClient",
+    "AsyncPaymentIntentCreate",
+    "AsyncSeatMapClient",
+    "AsyncWebhookClient",
     "LinksSessionClient",
     "LinksSessionCreate",
     "OfferRequestClient",
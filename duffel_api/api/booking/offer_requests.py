@@ -1,5 +1,13 @@
+from ...async_http_client import AsyncHttpClient, AsyncPagination
+from ...batch import run_batch, run_batch_async
+from ...calendar import FareCalendar
 from ...http_client import HttpClient, Pagination
-from ...models import OfferRequest
+from ...models import LazyOffer, Offer, OfferRequest, projection
+from ...search_cache import client_identity, search_key
+from ...streaming import aiter_json_array, iter_json_array
+
+# Where the offers are in the response to an offer request
+OFFERS = ("data", "offers")
 
 
 class OfferRequestClient(HttpClient):
@@ -11,23 +19,91 @@ class OfferRequestClient(HttpClient):
 
     def __init__(self, **kwargs):
         self._url = "/air/offer_requests"
+        # A `SearchCache` of the offer requests created, see `OfferRequestCreate`
+        self._search_cache = kwargs.pop("search_cache", None)
         super().__init__(**kwargs)
 
-    def get(self, id_):
-        """GET /air/offer_requests/:id"""
+    def get(self, id_, fields=None):
+        """GET /air/offer_requests/:id
+
+        With `fields` (e.g. `("id", "slices")`), returns a record holding only those
+        fields, without parsing the rest (such as the offers).
+        """
         response = self.do_get(f"{self._url}/{id_}")
 
         if response is not None:
-            return OfferRequest.from_json(response["data"])
+            model = OfferRequest if fields is None else projection(OfferRequest, fields)
+            return model.from_json(response["data"])
 
-    def list(self, limit=50):
+    def list(self, limit=50, prefetch=0):
         """GET /air/offer_requests"""
-        return Pagination(self, OfferRequest, {"limit": limit})
+        return Pagination(self, OfferRequest, {"limit": limit}, prefetch=prefetch)
 
     def create(self):
         """Initiate creation of an Offer Request"""
         return OfferRequestCreate(self)
 
+    def create_many(self, searches, max_concurrency=8):
+        """Create many offer requests concurrently.
+
+        `searches` are prepared `OfferRequestCreate`s (e.g.
+        `client.offer_requests.create().passengers(...).slices(...)`), executed by up
+        to `max_concurrency` threads sharing the connection pool and rate limiter of
+        the client. Yields a `BatchResult` per search as soon as it is done, in no
+        particular order; a failed search is reported in its result's `error` and
+        doesn't stop the others.
+
+        Keep `max_concurrency` within the connection pool size (`pool_maxsize`).
+        """
+        return run_batch(searches, OfferRequestCreate.execute, max_concurrency)
+
+    def calendar(
+        self,
+        origin,
+        destination,
+        passengers,
+        departure_dates,
+        return_dates=None,
+        cabin_class="economy",
+        max_connections=1,
+        max_concurrency=8,
+        currency=None,
+        stop_when=None,
+    ):
+        """Search the cheapest fare of every pair of departure and return dates (or
+        every departure date for one-way trips) and return them as a `FareCalendar`.
+
+        One offer request per pair is created, `max_concurrency` at a time. Only the
+        cheapest offer of each is kept, as the responses come in, and only offers in
+        `currency` (see `FareCalendar`). A failed search leaves its error in
+        `FareCalendar.errors` and doesn't stop the others.
+
+        `stop_when` is called with the calendar after each search. Once it returns
+        true, no more searches are sent and those in flight are dropped, e.g.
+        `stop_when=lambda calendar: len(calendar.fares) >= 3`.
+        """
+        calendar = FareCalendar(departure_dates, return_dates, currency)
+
+        def search(cell):
+            """Create the offer request of one cell"""
+            return (
+                self.create()
+                .passengers(passengers)
+                .slices(FareCalendar.slices(origin, destination, cell))
+                .cabin_class(cabin_class)
+                .max_connections(max_connections)
+                .return_offers()
+                .lazy_offers()
+                .execute()
+            )
+
+        results = run_batch(calendar.cells, search, max_concurrency)
+        for result in results:
+            calendar.add(result)
+            if stop_when is not None and stop_when(calendar):
+                results.close()
+        return calendar
+
 
 class OfferRequestCreate(object):
     """Auxiliary class to provide methods for offer request creation related data"""
@@ -53,10 +129,12 @@ class OfferRequestCreate(object):
     def __init__(self, client):
         self._client = client
         self._return_offers = "false"
+        self._lazy_offers = False
         self._cabin_class = "economy"
         self._passengers = []
         self._slices = []
         self._max_connections = 1
+        self._idempotency_key = None
 
     @staticmethod
     def _validate_cabin_class(cabin_class):
@@ -100,6 +178,13 @@ class OfferRequestCreate(object):
         self._return_offers = "true"
         return self
 
+    def lazy_offers(self):
+        """Return the offers as `LazyOffer`s, which only build the fields that are
+        read
+        """
+        self._lazy_offers = True
+        return self
+
     def cabin_class(self, cabin_class):
         """Set cabin_class - defaults to 'economy'"""
         OfferRequestCreate._validate_cabin_class(cabin_class)
@@ -124,20 +209,188 @@ class OfferRequestCreate(object):
         self._max_connections = max_connections
         return self
 
-    def execute(self):
-        """POST /air/offer_requests - trigger the call to create the offer_request"""
+    def idempotency_key(self, idempotency_key):
+        """Set a key unique to this search, which makes it safe to retry the request"""
+        self._idempotency_key = idempotency_key
+        return self
+
+    def _build_payload(self):
+        """Validate and build the request payload"""
         OfferRequestCreate._validate_passengers(self._passengers)
         OfferRequestCreate._validate_slices(self._slices)
-        res = self._client.do_post(
+        return {
+            "data": {
+                "cabin_class": self._cabin_class,
+                "passengers": self._passengers,
+                "max_connections": self._max_connections,
+                "slices": self._slices,
+            }
+        }
+
+    def _cached(self, query_params, body):
+        """Key of the search in the client's search cache and the data cached under it,
+        if any. The key is `None` without a cache.
+        """
+        cache = self._client._search_cache
+        if cache is None:
+            return None, None
+        key = search_key(query_params, body, client_identity(self._client))
+        return key, cache.get(key)
+
+    def execute(self):
+        """POST /air/offer_requests - trigger the call to create the offer_request
+
+        When the client has a `search_cache`, an identical search made recently is
+        answered from it.
+        """
+        query_params = {"return_offers": self._return_offers}
+        body = self._build_payload()
+        key, data = self._cached(query_params, body)
+        if data is None:
+            res = self._client.do_post(
+                self._client._url,
+                query_params=query_params,
+                body=body,
+                idempotency_key=self._idempotency_key,
+            )
+            data = res["data"]
+            if key is not None:
+                self._client._search_cache.set(key, data)
+        return OfferRequest.from_json(data, lazy_offers=self._lazy_offers)
+
+    def stream(self):
+        """POST /air/offer_requests - create the offer request and yield its offers one
+        at a time, as the response is received.
+
+        The response is never held in memory as a whole, which keeps memory use flat
+        and gives the first offers sooner on large searches. The search cache is not
+        used.
+        """
+        chunks = self._client.do_stream(
             self._client._url,
-            query_params={"return_offers": self._return_offers},
-            body={
-                "data": {
-                    "cabin_class": self._cabin_class,
-                    "passengers": self._passengers,
-                    "max_connections": self._max_connections,
-                    "slices": self._slices,
-                }
-            },
+            query_params={"return_offers": "true"},
+            body=self._build_payload(),
+            idempotency_key=self._idempotency_key,
         )
-        return OfferRequest.from_json(res["data"])
+        offer_class = LazyOffer if self._lazy_offers else Offer
+        return (
+            offer_class.from_json(offer) for offer in iter_json_array(chunks, OFFERS)
+        )
+
+
+class AsyncOfferRequestClient(AsyncHttpClient):
+    """Async version of `OfferRequestClient`"""
+
+    def __init__(self, **kwargs):
+        self._url = "/air/offer_requests"
+        # A `SearchCache` of the offer requests created, see `OfferRequestCreate`
+        self._search_cache = kwargs.pop("search_cache", None)
+        super().__init__(**kwargs)
+
+    async def get(self, id_, fields=None):
+        """GET /air/offer_requests/:id
+
+        With `fields`, returns a record holding only those fields.
+        """
+        response = await self.do_get(f"{self._url}/{id_}")
+
+        if response is not None:
+            model = OfferRequest if fields is None else projection(OfferRequest, fields)
+            return model.from_json(response["data"])
+
+    def list(self, limit=50):
+        """GET /air/offer_requests"""
+        return AsyncPagination(self, OfferRequest, {"limit": limit})
+
+    def create(self):
+        """Initiate creation of an Offer Request"""
+        return AsyncOfferRequestCreate(self)
+
+    def create_many(self, searches, max_concurrency=8):
+        """Create many offer requests concurrently, yielding a `BatchResult` per
+        search as soon as it is done. Use with `async for`.
+
+        `searches` are prepared `AsyncOfferRequestCreate`s, see
+        `OfferRequestClient.create_many`.
+        """
+        return run_batch_async(
+            searches, AsyncOfferRequestCreate.execute, max_concurrency
+        )
+
+    async def calendar(
+        self,
+        origin,
+        destination,
+        passengers,
+        departure_dates,
+        return_dates=None,
+        cabin_class="economy",
+        max_connections=1,
+        max_concurrency=8,
+        currency=None,
+        stop_when=None,
+    ):
+        """Search the cheapest fare of every pair of dates, see
+        `OfferRequestClient.calendar`. Stopping cancels the searches in flight.
+        """
+        calendar = FareCalendar(departure_dates, return_dates, currency)
+
+        async def search(cell):
+            """Create the offer request of one cell"""
+            return await (
+                self.create()
+                .passengers(passengers)
+                .slices(FareCalendar.slices(origin, destination, cell))
+                .cabin_class(cabin_class)
+                .max_connections(max_connections)
+                .return_offers()
+                .lazy_offers()
+                .execute()
+            )
+
+        results = run_batch_async(calendar.cells, search, max_concurrency)
+        async for result in results:
+            calendar.add(result)
+            if stop_when is not None and stop_when(calendar):
+                await results.aclose()
+        return calendar
+
+
+class AsyncOfferRequestCreate(OfferRequestCreate):
+    """Async version of `OfferRequestCreate`"""
+
+    async def execute(self):
+        """POST /air/offer_requests - trigger the call to create the offer_request"""
+        query_params = {"return_offers": self._return_offers}
+        body = self._build_payload()
+        key, data = self._cached(query_params, body)
+        if data is None:
+            res = await self._client.do_post(
+                self._client._url,
+                query_params=query_params,
+                body=body,
+                idempotency_key=self._idempotency_key,
+            )
+            data = res["data"]
+            if key is not None:
+                self._client._search_cache.set(key, data)
+        return OfferRequest.from_json(data, lazy_offers=self._lazy_offers)
+
+    def stream(self):
+        """POST /air/offer_requests - yield the offers of the offer request as the
+        response is received, see `OfferRequestCreate.stream`. Use with `async for`.
+        """
+        chunks = self._client.do_stream(
+            self._client._url,
+            query_params={"return_offers": "true"},
+            body=self._build_payload(),
+            idempotency_key=self._idempotency_key,
+        )
+        offer_class = LazyOffer if self._lazy_offers else Offer
+
+        async def offers():
+            """Parse the offers as they come"""
+            async for offer in aiter_json_array(chunks, OFFERS):
+                yield offer_class.from_json(offer)
+
+        return offers()
@@ -1,5 +1,6 @@
+from ...async_http_client import AsyncHttpClient, AsyncPagination
 from ...http_client import HttpClient, Pagination
-from ...models import Offer, OfferPassenger
+from ...models import LazyOffer, Offer, OfferPassenger
 
 
 class OfferClient(HttpClient):
@@ -74,14 +75,56 @@ class OfferClient(HttpClient):
         if response is not None:
             return Offer.from_json(response["data"])
 
-    def list(self, offer_request_id, sort=None, max_connections=None, limit=50):
-        """GET /air/offers"""
+    @staticmethod
+    def _list_params(offer_request_id, sort, max_connections, limit):
+        """Query parameters for GET /air/offers"""
         params = {"limit": limit, "offer_request_id": offer_request_id}
         if sort:
             params["sort"] = sort
         if max_connections:
             params["max_connections"] = max_connections
-        return Pagination(self, Offer, params)
+        return params
+
+    @staticmethod
+    def _update_passenger_body(family_name, given_name, loyalty_programme_accounts):
+        """Request body for PATCH /air/offers/:offer_id/passengers/:passenger_id"""
+        return {
+            "data": {
+                "loyalty_programme_accounts": [
+                    {
+                        "airline_iata_code": loyalty_programme_account[
+                            "airline_iata_code"
+                        ],
+                        "account_number": loyalty_programme_account["account_number"],
+                    }
+                    for loyalty_programme_account in loyalty_programme_accounts
+                ],
+                "given_name": given_name,
+                "family_name": family_name,
+            }
+        }
+
+    def list(
+        self,
+        offer_request_id,
+        sort=None,
+        max_connections=None,
+        limit=50,
+        prefetch=0,
+        lazy=False,
+        fields=None,
+    ):
+        """GET /air/offers
+
+        With `lazy`, yields `LazyOffer`s which only build the fields that are read.
+        With `fields` (e.g. `("id", "total_amount")`), yields records holding only
+        those fields and nothing else of the offers is parsed.
+        """
+        params = OfferClient._list_params(
+            offer_request_id, sort, max_connections, limit
+        )
+        model = LazyOffer if lazy and fields is None else Offer
+        return Pagination(self, model, params, prefetch=prefetch, fields=fields)
 
     def update_passenger(
         self,
@@ -102,22 +145,89 @@ class OfferClient(HttpClient):
         )
 
         url = f"{self._url}/{offer_id}/passengers/{offer_passenger_id}"
-        body = {
-            "data": {
-                "loyalty_programme_accounts": [
-                    {
-                        "airline_iata_code": loyalty_programme_account[
-                            "airline_iata_code"
-                        ],
-                        "account_number": loyalty_programme_account["account_number"],
-                    }
-                    for loyalty_programme_account in loyalty_programme_accounts
-                ],
-                "given_name": given_name,
-                "family_name": family_name,
-            }
-        }
+        body = OfferClient._update_passenger_body(
+            family_name, given_name, loyalty_programme_accounts
+        )
 
         res = self.do_patch(url, body=body)
         if res is not None:
             return OfferPassenger.from_json(res["data"])
+
+
+class AsyncOfferClient(AsyncHttpClient):
+    """Async version of `OfferClient`"""
+
+    InvalidOfferId = OfferClient.InvalidOfferId
+    InvalidOfferPassengerId = OfferClient.InvalidOfferPassengerId
+    InvalidFamilyName = OfferClient.InvalidFamilyName
+    InvalidGivenName = OfferClient.InvalidGivenName
+    MissingLoyaltyProgrammeAccountValue = (
+        OfferClient.MissingLoyaltyProgrammeAccountValue
+    )
+    InvalidLoyaltyProgrammeAirlineIataCode = (
+        OfferClient.InvalidLoyaltyProgrammeAirlineIataCode
+    )
+    InvalidLoyaltyProgrammeAccountNumber = (
+        OfferClient.InvalidLoyaltyProgrammeAccountNumber
+    )
+
+    def __init__(self, **kwargs):
+        self._url = "/air/offers"
+        super().__init__(**kwargs)
+
+    async def get(self, id_, return_available_services=False):
+        """GET /air/offers/:id"""
+        params = {}
+        if return_available_services:
+            params["return_available_services"] = "true"
+
+        response = await self.do_get(f"{self._url}/{id_}", query_params=params)
+        if response is not None:
+            return Offer.from_json(response["data"])
+
+    def list(
+        self,
+        offer_request_id,
+        sort=None,
+        max_connections=None,
+        limit=50,
+        lazy=False,
+        fields=None,
+    ):
+        """GET /air/offers
+
+        With `lazy`, yields `LazyOffer`s which only build the fields that are read.
+        With `fields`, yields records holding only those fields.
+        """
+        params = OfferClient._list_params(
+            offer_request_id, sort, max_connections, limit
+        )
+        model = LazyOffer if lazy and fields is None else Offer
+        return AsyncPagination(self, model, params, fields=fields)
+
+    async def update_passenger(
+        self,
+        offer_id,
+        offer_passenger_id,
+        family_name,
+        given_name,
+        loyalty_programme_accounts,
+    ):
+        """PATCH /air/offers/:offer_id/passengers/:passenger_id"""
+
+        OfferClient._validate_update_passenger_args(
+            offer_id,
+            offer_passenger_id,
+            family_name,
+            given_name,
+            loyalty_programme_accounts,
+        )
+
+        url = f"{self._url}/{offer_id}/passengers/{offer_passenger_id}"
+        body = OfferClient._update_passenger_body(
+            family_name, given_name, loyalty_programme_accounts
+        )
+
+        res = await self.do_patch(url, body=body)
+        if res is not None:
+            return OfferPassenger.from_json(res["data"])
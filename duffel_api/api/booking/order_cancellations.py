@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient, AsyncPagination
 from ...http_client import HttpClient, Pagination
 from ...models import OrderCancellation
 
@@ -24,10 +25,10 @@ class OrderCancellationClient(HttpClient):
         if res is not None:
             return OrderCancellation.from_json(res["data"])
 
-    def list(self, order_id, limit=50):
+    def list(self, order_id, limit=50, prefetch=0):
         """Retrieve a paginated list of order cancellations."""
         params = {"limit": limit, "order_id": order_id}
-        return Pagination(self, OrderCancellation, params)
+        return Pagination(self, OrderCancellation, params, prefetch=prefetch)
 
     def create(self, order_id):
         """Create an order cancellation.
@@ -60,3 +61,36 @@ class OrderCancellationClient(HttpClient):
         res = self.do_post(url)
         if res is not None:
             return OrderCancellation.from_json(res["data"])
+
+
+class AsyncOrderCancellationClient(AsyncHttpClient):
+    """Async version of `OrderCancellationClient`."""
+
+    def __init__(self, **kwargs):
+        """Instantiate an async order cancellation client."""
+        self._url = "/air/order_cancellations"
+        super().__init__(**kwargs)
+
+    async def get(self, id_):
+        """GET /air/order_cancellations/:id."""
+        res = await self.do_get(f"{self._url}/{id_}")
+        if res is not None:
+            return OrderCancellation.from_json(res["data"])
+
+    def list(self, order_id, limit=50):
+        """Retrieve a paginated list of order cancellations."""
+        params = {"limit": limit, "order_id": order_id}
+        return AsyncPagination(self, OrderCancellation, params)
+
+    async def create(self, order_id):
+        """Create an order cancellation. See `OrderCancellationClient.create`."""
+        res = await self.do_post(self._url, body={"data": {"order_id": order_id}})
+        if res is not None:
+            return OrderCancellation.from_json(res["data"])
+
+    async def confirm(self, id_):
+        """Confirm an order cancellation. See `OrderCancellationClient.confirm`."""
+        url = f"{self._url}/{id_}/actions/confirm"
+        res = await self.do_post(url)
+        if res is not None:
+            return OrderCancellation.from_json(res["data"])
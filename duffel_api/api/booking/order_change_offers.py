@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient, AsyncPagination
 from ...http_client import HttpClient, Pagination
 from ...models import OrderChangeOffer
 
@@ -15,11 +16,47 @@ class OrderChangeOfferClient(HttpClient):
         if res is not None:
             return OrderChangeOffer.from_json(res["data"])
 
-    def list(self, order_change_request_id, sort=None, max_connections=None, limit=50):
-        """GET /air/order_change_offers"""
+    @staticmethod
+    def _list_params(order_change_request_id, sort, max_connections, limit):
+        """Query parameters for GET /air/order_change_offers"""
         params = {"limit": limit, "order_change_request_id": order_change_request_id}
         if sort:
             params["sort"] = sort
         if max_connections:
             params["max_connections"] = max_connections
-        return Pagination(self, OrderChangeOffer, params)
+        return params
+
+    def list(
+        self,
+        order_change_request_id,
+        sort=None,
+        max_connections=None,
+        limit=50,
+        prefetch=0,
+    ):
+        """GET /air/order_change_offers"""
+        params = OrderChangeOfferClient._list_params(
+            order_change_request_id, sort, max_connections, limit
+        )
+        return Pagination(self, OrderChangeOffer, params, prefetch=prefetch)
+
+
+class AsyncOrderChangeOfferClient(AsyncHttpClient):
+    """Async version of `OrderChangeOfferClient`"""
+
+    def __init__(self, **kwargs):
+        self._url = "/air/order_change_offers"
+        super().__init__(**kwargs)
+
+    async def get(self, id_):
+        """GET /air/order_change_offers/:id"""
+        res = await self.do_get(f"{self._url}/{id_}")
+        if res is not None:
+            return OrderChangeOffer.from_json(res["data"])
+
+    def list(self, order_change_request_id, sort=None, max_connections=None, limit=50):
+        """GET /air/order_change_offers"""
+        params = OrderChangeOfferClient._list_params(
+            order_change_request_id, sort, max_connections, limit
+        )
+        return AsyncPagination(self, OrderChangeOffer, params)
@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient
 from ...http_client import HttpClient
 from ...models import OrderChangeRequest
 
@@ -58,14 +59,44 @@ class OrderChangeRequestCreate:
     def execute(self):
         """POST /air/order_change_requests - trigger the call to create the
         order change request"""
+        res = self._client.do_post(self._client._url, body=self._build_payload())
+        return OrderChangeRequest.from_json(res["data"])
+
+    def _build_payload(self):
+        """Validate and build the request payload"""
         OrderChangeRequestCreate._validate_slices(self._slices)
-        res = self._client.do_post(
-            self._client._url,
-            body={
-                "data": {
-                    "order_id": self._order_id,
-                    "slices": self._slices,
-                }
-            },
-        )
+        return {
+            "data": {
+                "order_id": self._order_id,
+                "slices": self._slices,
+            }
+        }
+
+
+class AsyncOrderChangeRequestClient(AsyncHttpClient):
+    """Async version of `OrderChangeRequestClient`"""
+
+    def __init__(self, **kwargs):
+        """Instantiate an async order change request client."""
+        self._url = "/air/order_change_requests"
+        super().__init__(**kwargs)
+
+    def create(self, order_id):
+        """POST /air/order_change_requests"""
+        return AsyncOrderChangeRequestCreate(self, order_id)
+
+    async def get(self, id_):
+        """GET /air/order_change_requests/:id"""
+        res = await self.do_get(f"{self._url}/{id_}")
+        if res is not None:
+            return OrderChangeRequest.from_json(res["data"])
+
+
+class AsyncOrderChangeRequestCreate(OrderChangeRequestCreate):
+    """Async version of `OrderChangeRequestCreate`"""
+
+    async def execute(self):
+        """POST /air/order_change_requests - trigger the call to create the
+        order change request"""
+        res = await self._client.do_post(self._client._url, body=self._build_payload())
         return OrderChangeRequest.from_json(res["data"])
@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient
 from ...http_client import HttpClient
 from ...models import OrderChange
 
@@ -63,21 +64,57 @@ class OrderChangeClient(HttpClient):
         then need to refund your customer (e.g. back to their credit/debit
         card).
         """
-        OrderChangeClient._validate_payment(payment_)
-
         url = f"{self._url}/{id_}/actions/confirm"
 
-        res = self.do_post(
-            url,
-            body={
-                "data": {
-                    "payment": {
-                        "amount": payment_["amount"],
-                        "currency": payment_["currency"],
-                        "type": payment_["type"],
-                    }
+        res = self.do_post(url, body=OrderChangeClient._confirm_body(payment_))
+        if res is not None:
+            return OrderChange.from_json(res["data"])
+
+    @staticmethod
+    def _confirm_body(payment_):
+        """Validate the payment and build the body to confirm an order change"""
+        OrderChangeClient._validate_payment(payment_)
+        return {
+            "data": {
+                "payment": {
+                    "amount": payment_["amount"],
+                    "currency": payment_["currency"],
+                    "type": payment_["type"],
                 }
-            },
+            }
+        }
+
+
+class AsyncOrderChangeClient(AsyncHttpClient):
+    """Async version of `OrderChangeClient`."""
+
+    InvalidPayment = OrderChangeClient.InvalidPayment
+    InvalidPaymentType = OrderChangeClient.InvalidPaymentType
+
+    def __init__(self, **kwargs):
+        """Instantiate an async order change client."""
+        self._url = "/air/order_changes"
+        super().__init__(**kwargs)
+
+    async def get(self, id_):
+        """GET /air/order_changes/:id."""
+        res = await self.do_get(f"{self._url}/{id_}")
+        if res is not None:
+            return OrderChange.from_json(res["data"])
+
+    async def create(self, selected_order_change_offer):
+        """Create a pending order change. See `OrderChangeClient.create`."""
+        res = await self.do_post(
+            self._url,
+            body={"data": {"selected_order_change_offer": selected_order_change_offer}},
         )
         if res is not None:
             return OrderChange.from_json(res["data"])
+
+    async def confirm(self, id_, payment_):
+        """Confirm an order change. See `OrderChangeClient.confirm`."""
+        url = f"{self._url}/{id_}/actions/confirm"
+
+        res = await self.do_post(url, body=OrderChangeClient._confirm_body(payment_))
+        if res is not None:
+            return OrderChange.from_json(res["data"])
@@ -1,7 +1,8 @@
 from typing import Any, Dict
 
+from ...async_http_client import AsyncHttpClient, AsyncPagination
 from ...http_client import HttpClient, Pagination
-from ...models import Order
+from ...models import LazyOrder, Order
 
 
 class OrderClient(HttpClient):
@@ -21,8 +22,9 @@ class OrderClient(HttpClient):
         if res is not None:
             return Order.from_json(res["data"])
 
-    def list(self, awaiting_payment=False, sort=None, limit=50):
-        """GET /air/orders."""
+    @staticmethod
+    def _list_params(awaiting_payment, sort, limit):
+        """Validate and build the query parameters for GET /air/orders."""
         params: Dict[str, Any] = {"limit": limit}
         if sort:
             if sort not in ["pay_by", "-pay_by"]:
@@ -30,7 +32,26 @@ class OrderClient(HttpClient):
             params["sort"] = sort
         if awaiting_payment:
             params["awaiting_payment"] = "true"
-        return Pagination(self, Order, params)
+        return params
+
+    def list(
+        self,
+        awaiting_payment=False,
+        sort=None,
+        limit=50,
+        prefetch=0,
+        lazy=False,
+        fields=None,
+    ):
+        """GET /air/orders.
+
+        With `lazy`, yields `LazyOrder`s which only build the fields that are read.
+        With `fields` (e.g. `("id", "booking_reference")`), yields records holding
+        only those fields and nothing else of the orders is parsed.
+        """
+        params = OrderClient._list_params(awaiting_payment, sort, limit)
+        model = LazyOrder if lazy and fields is None else Order
+        return Pagination(self, model, params, prefetch=prefetch, fields=fields)
 
     def create(self):
         """Initiate creation of an Order."""
@@ -72,6 +93,7 @@ class OrderCreate:
         self._selected_offers = []
         self._services = []
         self._payment_type = "instant"
+        self._idempotency_key = None
 
     @staticmethod
     def _validate_payments(payments):
@@ -170,16 +192,26 @@ class OrderCreate:
         self._passengers = passengers
         return self
 
-    def execute(self):
-        """POST /air/orders - trigger the call to create the order"""
+    def idempotency_key(self, idempotency_key):
+        """Set a key unique to this order, which makes it safe to retry the request"""
+        self._idempotency_key = idempotency_key
+        return self
+
+    def _validated_order_payload(self):
+        """Validate all the order data and build the payload"""
         OrderCreate._validate_passengers(self._passengers)
         if self._instant_order():
             OrderCreate._validate_payments(self._payments)
         OrderCreate._validate_services(self._services)
         OrderCreate._validate_selected_offers(self._selected_offers)
+        return self._build_order_payload()
+
+    def execute(self):
+        """POST /air/orders - trigger the call to create the order"""
         res = self._client.do_post(
             self._client._url,
-            body={"data": self._build_order_payload()},
+            body={"data": self._validated_order_payload()},
+            idempotency_key=self._idempotency_key,
         )
         return Order.from_json(res["data"])
 
@@ -219,3 +251,70 @@ class OrderUpdate:
         )
         if res is not None:
             return Order.from_json(res["data"])
+
+
+class AsyncOrderClient(AsyncHttpClient):
+    """Async version of `OrderClient`."""
+
+    InvalidSort = OrderClient.InvalidSort
+
+    def __init__(self, **kwargs):
+        """Instantiate an async Order client."""
+        self._url = "/air/orders"
+        super().__init__(**kwargs)
+
+    async def get(self, id_):
+        """GET /air/orders/:id."""
+        res = await self.do_get(f"{self._url}/{id_}")
+        if res is not None:
+            return Order.from_json(res["data"])
+
+    def list(
+        self, awaiting_payment=False, sort=None, limit=50, lazy=False, fields=None
+    ):
+        """GET /air/orders.
+
+        With `lazy`, yields `LazyOrder`s which only build the fields that are read.
+        With `fields`, yields records holding only those fields.
+        """
+        params = OrderClient._list_params(awaiting_payment, sort, limit)
+        model = LazyOrder if lazy and fields is None else Order
+        return AsyncPagination(self, model, params, fields=fields)
+
+    def create(self):
+        """Initiate creation of an Order."""
+        return AsyncOrderCreate(self)
+
+    def update(self, id_):
+        """Initiate updating of an Order."""
+        return AsyncOrderUpdate(self, id_)
+
+
+class AsyncOrderCreate(OrderCreate):
+    """Async version of `OrderCreate`"""
+
+    async def execute(self):
+        """POST /air/orders - trigger the call to create the order"""
+        res = await self._client.do_post(
+            self._client._url,
+            body={"data": self._validated_order_payload()},
+            idempotency_key=self._idempotency_key,
+        )
+        return Order.from_json(res["data"])
+
+
+class AsyncOrderUpdate(OrderUpdate):
+    """Async version of `OrderUpdate`"""
+
+    async def execute(self):
+        """PATCH /air/orders/{:id} - trigger the call to update the order."""
+        OrderUpdate._validate_metadata(self._metadata)
+
+        url = f"{self._client._url}/{self._id}"
+
+        res = await self._client.do_patch(
+            url,
+            body={"data": {"metadata": self._metadata}},
+        )
+        if res is not None:
+            return Order.from_json(res["data"])
@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient
 from ...http_client import HttpClient
 from ...models import OfferRequest
 
@@ -25,14 +26,10 @@ class PartialOfferRequestClient(HttpClient):
         Retrieves a partial offers request by its ID, only including partial offers for
         the current slice of multi-step search flow.
         """  # noqa: E501
-        response = None
-        if selected_partial_offer is None:
-            response = self.do_get(f"{self._url}/{id_}")
-        else:
-            response = self.do_get(
-                f"{self._url}/{id_}",
-                query_params={"selected_partial_offer[]": selected_partial_offer},
-            )
+        response = self.do_get(
+            f"{self._url}/{id_}",
+            query_params=PartialOfferRequestClient._get_params(selected_partial_offer),
+        )
 
         if response is not None:
             return OfferRequest.from_json(response["data"])
@@ -53,6 +50,13 @@ class PartialOfferRequestClient(HttpClient):
         """Initiate creation of a Partial Offer Request"""
         return PartialOfferRequestCreate(self)
 
+    @staticmethod
+    def _get_params(selected_partial_offer):
+        """Query parameters for GET /air/partial_offer_requests/:id"""
+        if selected_partial_offer is None:
+            return None
+        return {"selected_partial_offer[]": selected_partial_offer}
+
 
 class PartialOfferRequestCreate(object):
     """Auxiliary class to provide methods for partial offer request creation related data"""  # noqa: E501
@@ -145,17 +149,61 @@ class PartialOfferRequestCreate(object):
 
     def execute(self):
         """POST /air/partial_offer_requests - trigger the call to create the offer_request"""  # noqa: E501
+        res = self._client.do_post(self._client._url, body=self._build_payload())
+        return OfferRequest.from_json(res["data"])
+
+    def _build_payload(self):
+        """Validate and build the request payload"""
         PartialOfferRequestCreate._validate_passengers(self._passengers)
         PartialOfferRequestCreate._validate_slices(self._slices)
-        res = self._client.do_post(
-            self._client._url,
-            body={
-                "data": {
-                    "cabin_class": self._cabin_class,
-                    "passengers": self._passengers,
-                    "max_connections": self._max_connections,
-                    "slices": self._slices,
-                }
-            },
+        return {
+            "data": {
+                "cabin_class": self._cabin_class,
+                "passengers": self._passengers,
+                "max_connections": self._max_connections,
+                "slices": self._slices,
+            }
+        }
+
+
+class AsyncPartialOfferRequestClient(AsyncHttpClient):
+    """Async version of `PartialOfferRequestClient`"""
+
+    def __init__(self, **kwargs):
+        self._url = "/air/partial_offer_requests"
+        super().__init__(**kwargs)
+
+    async def get(self, id_, selected_partial_offer=None):
+        """GET /air/partial_offer_requests/:id
+
+        See `PartialOfferRequestClient.get`.
+        """
+        response = await self.do_get(
+            f"{self._url}/{id_}",
+            query_params=PartialOfferRequestClient._get_params(selected_partial_offer),
         )
+
+        if response is not None:
+            return OfferRequest.from_json(response["data"])
+
+    async def fares(self, id_, selected_partial_offers=[]):
+        """GET /air/partial_offer_requests/:id/fares"""
+        response = await self.do_get(
+            f"{self._url}/{id_}/fares",
+            query_params={"selected_partial_offer[]": selected_partial_offers},
+        )
+        if response is not None:
+            return OfferRequest.from_json(response["data"])
+
+    def create(self):
+        """Initiate creation of a Partial Offer Request"""
+        return AsyncPartialOfferRequestCreate(self)
+
+
+class AsyncPartialOfferRequestCreate(PartialOfferRequestCreate):
+    """Async version of `PartialOfferRequestCreate`"""
+
+    async def execute(self):
+        """POST /air/partial_offer_requests - trigger the call to create the offer_request"""  # noqa: E501
+        res = await self._client.do_post(self._client._url, body=self._build_payload())
         return OfferRequest.from_json(res["data"])
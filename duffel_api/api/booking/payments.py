@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient
 from ...http_client import HttpClient
 from ...models import Payment
 
@@ -27,6 +28,7 @@ class PaymentCreate:
         self._client = client
         self._order_id = None
         self._payment = None
+        self._idempotency_key = None
 
     @staticmethod
     def _validate_payment(payment):
@@ -46,11 +48,49 @@ class PaymentCreate:
         self._payment = payment
         return self
 
+    def idempotency_key(self, idempotency_key):
+        """Set a key unique to this payment, which makes it safe to retry the request"""
+        self._idempotency_key = idempotency_key
+        return self
+
     def execute(self):
         """POST /air/payments."""
-        PaymentCreate._validate_payment(self._payment)
         res = self._client.do_post(
             self._client._url,
-            body={"data": {"order_id": self._order_id, "payment": self._payment}},
+            body=self._build_payload(),
+            idempotency_key=self._idempotency_key,
+        )
+        return Payment.from_json(res["data"])
+
+    def _build_payload(self):
+        """Validate and build the request payload"""
+        PaymentCreate._validate_payment(self._payment)
+        return {"data": {"order_id": self._order_id, "payment": self._payment}}
+
+
+class AsyncPaymentClient(AsyncHttpClient):
+    """Async version of `PaymentClient`."""
+
+    InvalidPayment = PaymentClient.InvalidPayment
+    InvalidPaymentType = PaymentClient.InvalidPaymentType
+
+    def __init__(self, **kwargs):
+        self._url = "/air/payments"
+        super().__init__(**kwargs)
+
+    def create(self):
+        """Initiate creation of a Payment."""
+        return AsyncPaymentCreate(self)
+
+
+class AsyncPaymentCreate(PaymentCreate):
+    """Async version of `PaymentCreate`"""
+
+    async def execute(self):
+        """POST /air/payments."""
+        res = await self._client.do_post(
+            self._client._url,
+            body=self._build_payload(),
+            idempotency_key=self._idempotency_key,
         )
         return Payment.from_json(res["data"])
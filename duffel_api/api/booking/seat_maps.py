@@ -1,5 +1,14 @@
+from ...async_http_client import AsyncHttpClient
+from ...batch import run_batch, run_batch_async
 from ...http_client import HttpClient
-from ...models import SeatMap
+from ...models import LazySeatMap, SeatMap
+from ...search_cache import SeatMapCache
+
+
+def _seat_maps(data, lazy):
+    """Build the seat maps of an offer from the JSON of the response"""
+    model = LazySeatMap if lazy else SeatMap
+    return [model.from_json(m) for m in data]
 
 
 class SeatMapClient(HttpClient):
@@ -7,10 +16,94 @@ class SeatMapClient(HttpClient):
 
     def __init__(self, **kwargs):
         self._url = "/air/seat_maps"
+        # A `SeatMapCache`, `get()` fetches seat maps every time without one
+        self._seat_map_cache = kwargs.pop("seat_map_cache", None)
         super().__init__(**kwargs)
+        # Where `get_many` keeps seat maps: the client's cache, else one of its own
+        self._batch_cache = self._seat_map_cache
+        if self._batch_cache is None:
+            self._batch_cache = SeatMapCache()
+
+    def get(self, offer_id, lazy=False, cache=None):
+        """GET /air/seat_maps
+
+        Seat maps are fetched every time, unless the client was given a
+        `seat_map_cache` or a `SeatMapCache` is passed as `cache`: those fetched less
+        than its `ttl` ago (five minutes by default) are not fetched again. With
+        `lazy`, returns `LazySeatMap`s, which only build the cabins when they are
+        read.
+        """
+        if cache is None:
+            cache = self._seat_map_cache
+        data = cache.get(offer_id) if cache is not None else None
+        if data is None:
+            res = self.do_get(self._url, query_params={"offer_id": offer_id})
+            if res is None:
+                return None
+            data = res["data"]
+            if cache is not None:
+                cache.set(offer_id, data)
+        return _seat_maps(data, lazy)
+
+    def get_many(self, offer_ids, max_concurrency=8, lazy=False, cache=None):
+        """Get the seat maps of many offers concurrently.
+
+        Up to `max_concurrency` threads share the connection pool of the client.
+        Seat maps are kept in `cache`, else in the client's `seat_map_cache`, else in
+        a `SeatMapCache` of the client's own, and those in it are not fetched again.
+        Yields a `BatchResult` per offer ID as soon as its seat maps are there, in no
+        particular order; a failed call is reported in its result's `error` and
+        doesn't stop the others.
+
+        Keep `max_concurrency` within the connection pool size (`pool_maxsize`).
+        """
+        if cache is None:
+            cache = self._batch_cache
+        return run_batch(
+            offer_ids,
+            lambda offer_id: self.get(offer_id, lazy=lazy, cache=cache),
+            max_concurrency,
+        )
+
+
+class AsyncSeatMapClient(AsyncHttpClient):
+    """Async version of `SeatMapClient`"""
+
+    def __init__(self, **kwargs):
+        self._url = "/air/seat_maps"
+        # A `SeatMapCache`, `get()` fetches seat maps every time without one
+        self._seat_map_cache = kwargs.pop("seat_map_cache", None)
+        super().__init__(**kwargs)
+        # Where `get_many` keeps seat maps: the client's cache, else one of its own
+        self._batch_cache = self._seat_map_cache
+        if self._batch_cache is None:
+            self._batch_cache = SeatMapCache()
+
+    async def get(self, offer_id, lazy=False, cache=None):
+        """GET /air/seat_maps, see `SeatMapClient.get`"""
+        if cache is None:
+            cache = self._seat_map_cache
+        data = cache.get(offer_id) if cache is not None else None
+        if data is None:
+            res = await self.do_get(self._url, query_params={"offer_id": offer_id})
+            if res is None:
+                return None
+            data = res["data"]
+            if cache is not None:
+                cache.set(offer_id, data)
+        return _seat_maps(data, lazy)
+
+    def get_many(self, offer_ids, max_concurrency=8, lazy=False, cache=None):
+        """Get the seat maps of many offers concurrently, yielding a `BatchResult` per
+        offer ID as soon as it is done. Use with `async for`.
+
+        See `SeatMapClient.get_many`.
+        """
+        if cache is None:
+            cache = self._batch_cache
+
+        async def get(offer_id):
+            """Get the seat maps of one offer"""
+            return await self.get(offer_id, lazy=lazy, cache=cache)
 
-    def get(self, offer_id):
-        """GET /air/seat_maps"""
-        res = self.do_get(self._url, query_params={"offer_id": offer_id})
-        if res is not None:
-            return [SeatMap.from_json(m) for m in res["data"]]
+        return run_batch_async(offer_ids, get, max_concurrency)
@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient
 from ...http_client import HttpClient
 from ...models import PaymentIntent
 
@@ -73,19 +74,53 @@ class PaymentIntentCreate:
 
     def execute(self):
         """POST /payments/payment_intents"""
+        res = self._client.do_post(self._client._url, body=self._build_payload())
+        return PaymentIntent.from_json(res["data"])
+
+    def _build_payload(self):
+        """Validate and build the request payload"""
         if self._amount is None:
             raise PaymentIntentCreate.InvalidPayment()
 
         if self._currency is None:
             raise PaymentIntentCreate.InvalidPayment()
 
-        res = self._client.do_post(
-            self._client._url,
-            body={
-                "data": {
-                    "amount": self._amount,
-                    "currency": self._currency,
-                }
-            },
-        )
+        return {
+            "data": {
+                "amount": self._amount,
+                "currency": self._currency,
+            }
+        }
+
+
+class AsyncPaymentIntentClient(AsyncHttpClient):
+    """Async version of `PaymentIntentClient`"""
+
+    def __init__(self, **kwargs):
+        self._url = "/payments/payment_intents"
+        super().__init__(**kwargs)
+
+    def create(self):
+        """Initiate creation of a Payment Intent"""
+        return AsyncPaymentIntentCreate(self)
+
+    async def get(self, id_):
+        """Get a single Payment Intent. See `PaymentIntentClient.get`."""
+        res = await self.do_get(f"{self._url}/{id_}")
+        if res is not None:
+            return PaymentIntent.from_json(res["data"])
+
+    async def confirm(self, id_):
+        """Confirm a Payment Intent. See `PaymentIntentClient.confirm`."""
+        res = await self.do_post(f"{self._url}/{id_}/actions/confirm")
+        if res is not None:
+            return PaymentIntent.from_json(res["data"])
+
+
+class AsyncPaymentIntentCreate(PaymentIntentCreate):
+    """Async version of `PaymentIntentCreate`"""
+
+    async def execute(self):
+        """POST /payments/payment_intents"""
+        res = await self._client.do_post(self._client._url, body=self._build_payload())
         return PaymentIntent.from_json(res["data"])
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from ...async_http_client import AsyncHttpClient
 from ...http_client import HttpClient
 from ...models import Session
 
@@ -206,6 +207,11 @@ class LinksSessionCreate(object):
 
     def execute(self):
         """POST /links/sessions - trigger the call to create the session"""
+        res = self._client.do_post(self._client._url, body=self._build_payload())
+        return Session.from_json(res["data"])
+
+    def _build_payload(self):
+        """Validate and build the request payload"""
         self._validate_mandatory()
 
         body_data = {
@@ -233,5 +239,25 @@ class LinksSessionCreate(object):
         else:
             self._validate_markup()
 
-        res = self._client.do_post(self._client._url, body={"data": body_data})
+        return {"data": body_data}
+
+
+class AsyncLinksSessionClient(AsyncHttpClient):
+    """Async version of `LinksSessionClient`"""
+
+    def __init__(self, **kwargs):
+        self._url = "/links/sessions"
+        super().__init__(**kwargs)
+
+    def create(self):
+        """Initiate creation of a Session"""
+        return AsyncLinksSessionCreate(self)
+
+
+class AsyncLinksSessionCreate(LinksSessionCreate):
+    """Async version of `LinksSessionCreate`"""
+
+    async def execute(self):
+        """POST /links/sessions - trigger the call to create the session"""
+        res = await self._client.do_post(self._client._url, body=self._build_payload())
         return Session.from_json(res["data"])
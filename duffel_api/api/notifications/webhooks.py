@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient
 from ...http_client import HttpClient
 from ...models import Webhook
 
@@ -80,3 +81,52 @@ class WebhookUpdate(object):
         )
 
         return Webhook.from_json(res["data"])
+
+
+class AsyncWebhookClient(AsyncHttpClient):
+    """Async version of `WebhookClient`"""
+
+    def __init__(self, **kwargs):
+        self._url = "/air/webhooks"
+        super().__init__(**kwargs)
+
+    def create(self):
+        """Initiate creation of a Webhook"""
+        return AsyncWebhookCreate(self)
+
+    def update(self, id_):
+        """Initiate updating of a Webhook"""
+        return AsyncWebhookUpdate(self, id_)
+
+    async def ping(self, id_):
+        """Ping a webhook. See `WebhookClient.ping`."""
+        url = f"{self._url}/{id_}/actions/ping"
+        await self.do_post(url)
+        return None
+
+
+class AsyncWebhookCreate(WebhookCreate):
+    """Async version of `WebhookCreate`"""
+
+    async def execute(self):
+        """POST /air/webhooks"""
+        res = await self._client.do_post(
+            self._client._url,
+            body={"data": {"events": self._events, "url": self._url}},
+        )
+        return Webhook.from_json(res["data"])
+
+
+class AsyncWebhookUpdate(WebhookUpdate):
+    """Async version of `WebhookUpdate`"""
+
+    async def execute(self):
+        """PATCH /air/webhooks/{id}"""
+        url = f"{self._client._url}/{self._id}"
+
+        res = await self._client.do_patch(
+            url,
+            body={"data": {"active": self._active}},
+        )
+
+        return Webhook.from_json(res["data"])
@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient, AsyncPagination
 from ...http_client import HttpClient, Pagination
 from ...models import Aircraft
 
@@ -15,6 +16,24 @@ class AircraftClient(HttpClient):
         if res is not None:
             return Aircraft.from_json(res["data"])
 
+    def list(self, limit=50, prefetch=0):
+        """GET /air/aircraft"""
+        return Pagination(self, Aircraft, {"limit": limit}, prefetch=prefetch)
+
+
+class AsyncAircraftClient(AsyncHttpClient):
+    """Async version of `AircraftClient`"""
+
+    def __init__(self, **kwargs):
+        self._url = "/air/aircraft"
+        super().__init__(**kwargs)
+
+    async def get(self, id_):
+        """GET /air/aircraft/:id"""
+        res = await self.do_get(f"{self._url}/{id_}")
+        if res is not None:
+            return Aircraft.from_json(res["data"])
+
     def list(self, limit=50):
         """GET /air/aircraft"""
-        return Pagination(self, Aircraft, {"limit": limit})
+        return AsyncPagination(self, Aircraft, {"limit": limit})
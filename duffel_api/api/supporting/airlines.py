@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient, AsyncPagination
 from ...http_client import HttpClient, Pagination
 from ...models import Airline
 
@@ -15,6 +16,24 @@ class AirlineClient(HttpClient):
         if res is not None:
             return Airline.from_json(res["data"])
 
+    def list(self, limit=50, prefetch=0):
+        """GET /air/airlines"""
+        return Pagination(self, Airline, {"limit": limit}, prefetch=prefetch)
+
+
+class AsyncAirlineClient(AsyncHttpClient):
+    """Async version of `AirlineClient`"""
+
+    def __init__(self, **kwargs):
+        self._url = "/air/airlines"
+        super().__init__(**kwargs)
+
+    async def get(self, id_):
+        """GET /air/airlines/:id"""
+        res = await self.do_get(f"{self._url}/{id_}")
+        if res is not None:
+            return Airline.from_json(res["data"])
+
     def list(self, limit=50):
         """GET /air/airlines"""
-        return Pagination(self, Airline, {"limit": limit})
+        return AsyncPagination(self, Airline, {"limit": limit})
@@ -1,3 +1,4 @@
+from ...async_http_client import AsyncHttpClient, AsyncPagination
 from ...http_client import HttpClient, Pagination
 from ...models import Airport
 
@@ -15,6 +16,24 @@ class AirportClient(HttpClient):
         if res is not None:
             return Airport.from_json(res["data"])
 
+    def list(self, limit=50, prefetch=0):
+        """GET /air/airports"""
+        return Pagination(self, Airport, {"limit": limit}, prefetch=prefetch)
+
+
+class AsyncAirportClient(AsyncHttpClient):
+    """Async version of `AirportClient`"""
+
+    def __init__(self, **kwargs):
+        self._url = "/air/airports"
+        super().__init__(**kwargs)
+
+    async def get(self, id_):
+        """GET /air/airports/:id"""
+        res = await self.do_get(f"{self._url}/{id_}")
+        if res is not None:
+            return Airport.from_json(res["data"])
+
     def list(self, limit=50):
         """GET /air/airports"""
-        return Pagination(self, Airport, {"limit": limit})
+        return AsyncPagination(self, Airport, {"limit": limit})
@@ -0,0 +1,152 @@
+"""Asyncio entry point to the library"""
+from .api import (
+    AsyncAircraftClient,
+    AsyncAirportClient,
+    AsyncAirlineClient,
+    AsyncOfferRequestClient,
+    AsyncOfferClient,
+    AsyncOrderCancellationClient,
+    AsyncOrderChangeRequestClient,
+    AsyncOrderClient,
+    AsyncOrderChangeClient,
+    AsyncOrderChangeOfferClient,
+    AsyncPartialOfferRequestClient,
+    AsyncPaymentClient,
+    AsyncPaymentIntentClient,
+    AsyncLinksSessionClient,
+    AsyncSeatMapClient,
+    AsyncWebhookClient,
+)
+from .async_http_client import AsyncHttpTransport
+from .client import lazy_property
+
+
+class AsyncDuffel:
+    """Asyncio client to the entire API
+
+    It mirrors `Duffel`, but every call that reaches the API has to be awaited and
+    list() calls are iterated with `async for`. Use it as an async context manager, or
+    call `aclose()`, to release its connections.
+    """
+
+    # Settings that configure the shared connection pool rather than each request
+    TRANSPORT_SETTINGS = (
+        "max_connections",
+        "max_keepalive_connections",
+        "keepalive_expiry",
+    )
+
+    def __init__(self, **kwargs):
+        self._transport_settings = {
+            key: kwargs.pop(key) for key in self.TRANSPORT_SETTINGS if key in kwargs
+        }
+        # Caches given only to the clients which use them
+        self._search_cache = kwargs.pop("search_cache", None)
+        self._seat_map_cache = kwargs.pop("seat_map_cache", None)
+        self._kwargs = kwargs
+
+    async def __aenter__(self):
+        """Enter the async context, returning the client itself"""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Close the shared transport when leaving the async context"""
+        await self.aclose()
+
+    @lazy_property
+    def transport(self):
+        """Connection pool shared by all the clients below"""
+        return AsyncHttpTransport(
+            self._kwargs.get("access_token"),
+            self._kwargs.get("api_version"),
+            **self._transport_settings,
+        )
+
+    def _client(self, client_class, **kwargs):
+        """Instantiate `client_class` on top of the shared transport"""
+        return client_class(transport=self.transport, **self._kwargs, **kwargs)
+
+    async def aclose(self):
+        """Close the connections held by the shared transport, if it was created"""
+        if hasattr(self, "_lazy_transport"):
+            await self.transport.close()
+
+    @lazy_property
+    def aircraft(self):
+        """Aircraft API - /air/aircraft"""
+        return self._client(AsyncAircraftClient)
+
+    @lazy_property
+    def airports(self):
+        """Airports API - /air/airports"""
+        return self._client(AsyncAirportClient)
+
+    @lazy_property
+    def airlines(self):
+        """Airlines API - /air/airlines"""
+        return self._client(AsyncAirlineClient)
+
+    @lazy_property
+    def offer_requests(self):
+        """Offer Requests API - /air/offer_requests"""
+        return self._client(AsyncOfferRequestClient, search_cache=self._search_cache)
+
+    @lazy_property
+    def offers(self):
+        """Offers API - /air/offers"""
+        return self._client(AsyncOfferClient)
+
+    @lazy_property
+    def orders(self):
+        """Orders API - /air/orders"""
+        return self._client(AsyncOrderClient)
+
+    @lazy_property
+    def order_cancellations(self):
+        """Order Cancellations API - /air/order_cancellations"""
+        return self._client(AsyncOrderCancellationClient)
+
+    @lazy_property
+    def order_changes(self):
+        """Order Changes API - /air/order_changes"""
+        return self._client(AsyncOrderChangeClient)
+
+    @lazy_property
+    def order_change_offers(self):
+        """Order Change Offers API - /air/order_change_offers"""
+        return self._client(AsyncOrderChangeOfferClient)
+
+    @lazy_property
+    def order_change_requests(self):
+        """Order Change Requests API - /air/order_change_requests"""
+        return self._client(AsyncOrderChangeRequestClient)
+
+    @lazy_property
+    def partial_offer_requests(self):
+        """Partial Offer Requests API - /air/partial_offer_requests"""
+        return self._client(AsyncPartialOfferRequestClient)
+
+    @lazy_property
+    def payment_intents(self):
+        """Payment Intents API - /payments/payment_intents"""
+        return self._client(AsyncPaymentIntentClient)
+
+    @lazy_property
+    def payments(self):
+        """Payments API - /air/payments"""
+        return self._client(AsyncPaymentClient)
+
+    @lazy_property
+    def seat_maps(self):
+        """Seat Maps API - /air/seat_maps"""
+        return self._client(AsyncSeatMapClient, seat_map_cache=self._seat_map_cache)
+
+    @lazy_property
+    def sessions(self):
+        """Links Sessions API - /links/sessions"""
+        return self._client(AsyncLinksSessionClient)
+
+    @lazy_property
+    def webhooks(self):
+        """Webhooks API - /air/webhooks (Preview)"""
+        return self._client(AsyncWebhookClient)
@@ -0,0 +1,265 @@
+"""Asyncio counterpart of the Http Client, backed by httpx"""
+import asyncio
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the environment
+    httpx = None  # type: ignore[assignment]
+
+from .http_client import ApiError, ClientError, HttpClient, default_headers
+from .http_client import handle_response
+from .json_codec import default_codec
+from .models import projection
+
+
+class AsyncHttpTransport:
+    """Connection pool and default headers shared by every client of an `AsyncDuffel`
+    instance.
+    """
+
+    def __init__(
+        self,
+        access_token=None,
+        api_version=None,
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=5.0,
+    ):
+        """Create the shared `httpx.AsyncClient`.
+
+        `max_connections` caps the number of concurrent connections,
+        `max_keepalive_connections` the number of idle ones kept around and
+        `keepalive_expiry` how long (in seconds) an idle connection is kept.
+        """
+        if httpx is None:
+            raise ClientError(
+                "httpx is required for the async client: pip install duffel-api[async]"
+            )
+
+        self.session = httpx.AsyncClient(
+            headers=default_headers(access_token, api_version),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    async def send(
+        self, method, url, query_params=None, content=None, stream=False, **settings
+    ):
+        """Send a request, with an already encoded body, through the shared client.
+
+        With `stream`, the response is returned before its body is read, and must be
+        closed with `aclose()`.
+        """
+        if not stream:
+            return await self.session.request(
+                method, url, params=query_params, content=content, **settings
+            )
+        request = self.session.build_request(
+            method, url, params=query_params, content=content, **settings
+        )
+        return await self.session.send(request, stream=True)
+
+    async def close(self):
+        """Close all the pooled connections"""
+        await self.session.aclose()
+
+
+class AsyncPagination:
+    """A way to do pagination on list() calls with `async for`
+
+    If fetching a page fails, iterating again resumes from that page instead of
+    starting over. With `fields`, only those fields of each item are parsed.
+    """
+
+    def __init__(self, client, caller, params, fields=None):
+        self._client = client
+        self._caller = caller if fields is None else projection(caller, fields)
+
+        if params["limit"] > 200:
+            # We're vaguely faking the structure of the error structure returned
+            # from the API.
+            raise ApiError([], {"errors": [{"message": "limit exceeds 200"}]})
+        self._params = params
+        # Cursor of the page being consumed, `None` for the first one
+        self._after = None
+
+    async def __aiter__(self):
+        """Iterate over the response items and yield one by one"""
+        try:
+            async for page in self._pages():
+                for entry in page["data"]:
+                    yield self._caller.from_json(entry)
+                self._after = page["meta"]["after"]
+        except GeneratorExit:
+            # The caller stopped on purpose, the next iteration starts over
+            self._after = None
+            raise
+        self._after = None
+
+    async def _pages(self):
+        """Fetch the pages one after the other, following the `after` cursor"""
+        params = dict(self._params)
+        if self._after is not None:
+            params["after"] = self._after
+        response = await self._client.do_get(
+            self._client._url,
+            query_params=params,
+        )
+
+        while "meta" in response:
+            yield response
+
+            after = response["meta"]["after"]
+            if after is None:
+                break
+
+            params["after"] = after
+            response = await self._client.do_get(
+                self._client._url,
+                query_params=params,
+            )
+
+
+class AsyncHttpClient:
+    """Async Http Client to manage all calls to the Duffel API"""
+
+    def __init__(
+        self,
+        access_token=None,
+        api_url=None,
+        api_version=None,
+        transport=None,
+        retry=None,
+        rate_limiter=None,
+        json_codec=None,
+        **settings,
+    ):
+        if api_url is not None:
+            self._api_url = api_url
+        else:
+            self._api_url = HttpClient.URL
+        if api_version is not None:
+            self._api_version = api_version
+        else:
+            self._api_version = HttpClient.VERSION
+
+        if transport is None:
+            transport = AsyncHttpTransport(access_token, self._api_version)
+        self._transport = transport
+        # A `RetryPolicy`, failed requests are not retried without one
+        self._retry = retry
+        # A `RateLimiter` pacing the requests, usually shared with other clients
+        self._rate_limiter = rate_limiter
+        # Encodes request bodies and decodes responses, orjson when available
+        self._json_codec = json_codec if json_codec is not None else default_codec()
+        self._settings = settings
+
+    def _request(self, query_params, body, idempotency_key):
+        """Query parameters, encoded body and settings of a request"""
+        headers = {}
+        content = None
+        if body is not None:
+            content = self._json_codec.dumps(body)
+            headers["Content-Type"] = "application/json"
+        if idempotency_key is not None:
+            headers["Idempotency-Key"] = idempotency_key
+        return dict(
+            self._settings, query_params=query_params, content=content, headers=headers
+        )
+
+    async def _http_call(
+        self, endpoint, method, query_params=None, body=None, idempotency_key=None
+    ):
+        """Perform the http call and wrap the response in a ApiError in case an error
+        occurred
+
+        """
+        request = self._request(query_params, body, idempotency_key)
+        return await self._send(endpoint, method, request, idempotency_key)
+
+    async def _send(self, endpoint, method, request, idempotency_key, stream=False):
+        """Send the request, retrying as configured, and return the decoded body.
+
+        With `stream`, return the response itself as soon as its headers say it
+        succeeded, leaving the body to be read.
+        """
+
+        async def send():
+            """Send the request once"""
+            if self._rate_limiter is not None:
+                delay = self._rate_limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            response = await self._transport.send(
+                method, self._api_url + endpoint, stream=stream, **request
+            )
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(response.headers)
+            if stream:
+                if response.status_code in (200, 201):
+                    return response
+                await response.aread()
+                await response.aclose()
+            return handle_response(response, self._json_codec)
+
+        if self._retry is None:
+            return await send()
+        return await self._retry.call_async(
+            send, method, idempotency_key, retry_on=(httpx.TransportError,)
+        )
+
+    async def do_stream(
+        self,
+        endpoint,
+        method="POST",
+        query_params=None,
+        body=None,
+        idempotency_key=None,
+    ):
+        """Issue a request to `endpoint` and yield the chunks of the response body as
+        they are received. Use with `async for`.
+        """
+        request = self._request(query_params, body, idempotency_key)
+        response = await self._send(
+            endpoint, method, request, idempotency_key, stream=True
+        )
+        try:
+            async for chunk in response.aiter_bytes():
+                yield chunk
+        finally:
+            await response.aclose()
+
+    async def do_get(self, endpoint, method="GET", query_params=None, body=None):
+        """Issue a GET request to `endpoint`"""
+        return await self._http_call(endpoint, method, query_params, body)
+
+    async def do_post(
+        self,
+        endpoint,
+        method="POST",
+        query_params=None,
+        body=None,
+        idempotency_key=None,
+    ):
+        """Issue a POST request to `endpoint`
+
+        With an `idempotency_key` the request is safe to retry.
+        """
+        return await self._http_call(
+            endpoint, method, query_params, body, idempotency_key
+        )
+
+    async def do_delete(self, endpoint, method="DELETE", query_params=None, body=None):
+        """Issue a DELETE request to `endpoint`"""
+        return await self._http_call(endpoint, method, query_params, body)
+
+    async def do_put(self, endpoint, method="PUT", query_params=None, body=None):
+        """Issue a PUT request to `endpoint`"""
+        return await self._http_call(endpoint, method, query_params, body)
+
+    async def do_patch(self, endpoint, method="PATCH", query_params=None, body=None):
+        """Issue a PATCH request to `endpoint`"""
+        return await self._http_call(endpoint, method, query_params, body)
@@ -0,0 +1,104 @@
+"""Sending many requests at once and collecting their outcomes as they finish"""
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, NamedTuple, Optional
+
+from .http_client import ClientError
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one request of a batch.
+
+    `position` is that of the request in the batch, `request` what was given for
+    it (e.g. an `OfferRequestCreate`). Exactly one of `result` and `error` is set.
+    """
+
+    position: int
+    request: Any
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self):
+        """Whether the request succeeded"""
+        return self.error is None
+
+
+def _validate_concurrency(max_concurrency):
+    """Check `max_concurrency` is a positive number"""
+    if not isinstance(max_concurrency, int) or max_concurrency < 1:
+        raise ClientError("max_concurrency must be a positive integer")
+
+
+def _call(index, request, send):
+    """Send one request, turning its exception (if any) into the result"""
+    try:
+        return BatchResult(index, request, result=send(request))
+    except Exception as err:
+        return BatchResult(index, request, error=err)
+
+
+def run_batch(requests, send, max_concurrency):
+    """Call `send` on every request from `max_concurrency` threads, yielding a
+    `BatchResult` for each as soon as it is done.
+
+    Requests are only taken from `requests` when a thread is free, so it can be a
+    long-running generator. A failed request doesn't stop the others. If the caller
+    stops iterating, the requests in flight finish but no new one is sent.
+    """
+    _validate_concurrency(max_concurrency)
+    return _run_batch(enumerate(requests), send, max_concurrency)
+
+
+def _run_batch(requests, send, max_concurrency):
+    """`run_batch` once its arguments are checked"""
+    with ThreadPoolExecutor(max_concurrency) as executor:
+        pending = set()
+        while True:
+            for index, request in requests:
+                pending.add(executor.submit(_call, index, request, send))
+                if len(pending) >= max_concurrency:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+async def _call_async(index, request, send):
+    """Same as `_call` for a coroutine function `send`"""
+    try:
+        return BatchResult(index, request, result=await send(request))
+    except Exception as err:
+        return BatchResult(index, request, error=err)
+
+
+def run_batch_async(requests, send, max_concurrency):
+    """Same as `run_batch` for a coroutine function `send`, with tasks instead of
+    threads, to be used with `async for`. Stopping early cancels the requests in
+    flight.
+    """
+    _validate_concurrency(max_concurrency)
+    return _run_batch_async(enumerate(requests), send, max_concurrency)
+
+
+async def _run_batch_async(requests, send, max_concurrency):
+    """`run_batch_async` once its arguments are checked"""
+    pending = set()
+    try:
+        while True:
+            for index, request in requests:
+                pending.add(asyncio.ensure_future(_call_async(index, request, send)))
+                if len(pending) >= max_concurrency:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,122 @@
+"""Cheapest fares over ranges of dates, for flexible-date searches"""
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import NamedTuple
+
+
+class CalendarFare(NamedTuple):
+    """The cheapest offer found for a pair of dates"""
+
+    offer_id: str
+    total_amount: Decimal
+    total_currency: str
+
+
+def date_window(center: date, days: int = 3):
+    """The dates from `days` before `center` to `days` after it"""
+    return [center + timedelta(days=offset) for offset in range(-days, days + 1)]
+
+
+class FareCalendar:
+    """Cheapest fare of every departure and return date pair.
+
+    Each cell of the calendar is a `(departure_date, return_date)` pair, with
+    `return_date` set to `None` for one-way trips. Returns before departures are left
+    out. Only a `CalendarFare` is kept per cell, not the offers it was picked from.
+
+    Amounts are only compared in one `currency`, by default that of the first offer
+    added. Offers in any other currency are left out and counted in `skipped`.
+    """
+
+    def __init__(self, departure_dates, return_dates=None, currency=None):
+        self.currency = currency
+        # Number of offers left out for being in another currency
+        self.skipped = 0
+        self.departure_dates = sorted(set(departure_dates))
+        self.return_dates = None if return_dates is None else sorted(set(return_dates))
+        if self.return_dates is None:
+            self.cells = [(departure, None) for departure in self.departure_dates]
+        else:
+            self.cells = [
+                (departure, return_)
+                for departure in self.departure_dates
+                for return_ in self.return_dates
+                if return_ >= departure
+            ]
+        # Cell to its cheapest fare, `None` when no offer was found
+        self.fares = {}
+        # Cell to the exception raised when searching it
+        self.errors = {}
+
+    @staticmethod
+    def slices(origin, destination, cell):
+        """Slices of the offer request searching `cell`"""
+        departure_date, return_date = cell
+        slices = [
+            {
+                "origin": origin,
+                "destination": destination,
+                "departure_date": departure_date.isoformat(),
+            }
+        ]
+        if return_date is not None:
+            slices.append(
+                {
+                    "origin": destination,
+                    "destination": origin,
+                    "departure_date": return_date.isoformat(),
+                }
+            )
+        return slices
+
+    @property
+    def complete(self):
+        """Whether every cell has been searched"""
+        return len(self.fares) + len(self.errors) == len(self.cells)
+
+    def add(self, result):
+        """Fill the cell of a `BatchResult` whose request is the cell and result the
+        offer request searching it
+        """
+        cell = result.request
+        if not result.ok:
+            self.errors[cell] = result.error
+            return
+
+        cheapest = None
+        for offer in result.result.offers:
+            if self.currency is None:
+                self.currency = offer.total_currency
+            elif offer.total_currency != self.currency:
+                self.skipped += 1
+                continue
+            amount = Decimal(offer.total_amount)
+            if cheapest is None or amount < cheapest.total_amount:
+                cheapest = CalendarFare(offer.id, amount, offer.total_currency)
+        self.fares[cell] = cheapest
+
+    def cheapest(self, departure_date, return_date=None):
+        """The cheapest fare for a pair of dates, `None` if there isn't any"""
+        return self.fares.get((departure_date, return_date))
+
+    def matrix(self):
+        """Cheapest total amounts as a list of rows, one per departure date, of one
+        column per return date (a single one for one-way trips). Cells without a fare
+        are `None`.
+        """
+        return_dates = self.return_dates if self.return_dates is not None else [None]
+        rows = []
+        for departure in self.departure_dates:
+            row = []
+            for return_ in return_dates:
+                fare = self.fares.get((departure, return_))
+                row.append(None if fare is None else fare.total_amount)
+            rows.append(row)
+        return rows
+
+    def __repr__(self):
+        """Only show how many cells are filled"""
+        return (
+            f"FareCalendar(cells={len(self.cells)}, fares={len(self.fares)}, "
+            f"errors={len(self.errors)})"
+        )
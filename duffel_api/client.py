@@ -17,6 +17,7 @@ from .api import (
     SeatMapClient,
     WebhookClient,
 )
+from .http_client import HttpTransport
 
 
 def lazy_property(func):
@@ -44,92 +45,119 @@ def lazy_property(func):
 class Duffel:
     """Client to the entire API"""
 
-    def __init__(self, **kwargs):
-        # TODO(nlopes): I really don't like how I've built this- we shouldn't keep
-        # instantiating the HttpClient through class inheritance.
-        # We should (maybe!) have a singleton pattern on HttpClient and use
-        # composition in all of these instead.
+    # Settings that configure the shared connection pool rather than each request
+    TRANSPORT_SETTINGS = (
+        "pool_connections",
+        "pool_maxsize",
+        "pool_block",
+        "keep_alive",
+    )
 
+    def __init__(self, **kwargs):
+        self._transport_settings = {
+            key: kwargs.pop(key) for key in self.TRANSPORT_SETTINGS if key in kwargs
+        }
+        # Caches given only to the clients which use them
+        self._search_cache = kwargs.pop("search_cache", None)
+        self._seat_map_cache = kwargs.pop("seat_map_cache", None)
         # Keep this as we use it when doing the lazy-evaluation of the different
         # clients
         self._kwargs = kwargs
 
+    @lazy_property
+    def transport(self):
+        """Connection pool shared by all the clients below"""
+        return HttpTransport(
+            self._kwargs.get("access_token"),
+            self._kwargs.get("api_version"),
+            **self._transport_settings,
+        )
+
+    def _client(self, client_class, **kwargs):
+        """Instantiate `client_class` on top of the shared transport"""
+        return client_class(transport=self.transport, **self._kwargs, **kwargs)
+
+    def close(self):
+        """Close the connections held by the shared transport, if it was created"""
+        if hasattr(self, "_lazy_transport"):
+            self.transport.close()
+
     @lazy_property
     def aircraft(self):
         """Aircraft API - /air/aircraft"""
-        return AircraftClient(**self._kwargs)
+        return self._client(AircraftClient)
 
     @lazy_property
     def airports(self):
         """Airports API - /air/airports"""
-        return AirportClient(**self._kwargs)
+        return self._client(AirportClient)
 
     @lazy_property
     def airlines(self):
         """Airlines API - /air/airlines"""
-        return AirlineClient(**self._kwargs)
+        return self._client(AirlineClient)
 
     @lazy_property
     def offer_requests(self):
         """Offer Requests API - /air/offer_requests"""
-        return OfferRequestClient(**self._kwargs)
+        return self._client(OfferRequestClient, search_cache=self._search_cache)
 
     @lazy_property
     def offers(self):
         """Offers API - /air/offers"""
-        return OfferClient(**self._kwargs)
+        return self._client(OfferClient)
 
     @lazy_property
     def orders(self):
         """Orders API - /air/orders"""
-        return OrderClient(**self._kwargs)
+        return self._client(OrderClient)
 
     @lazy_property
     def order_cancellations(self):
         """Order Cancellations API - /air/order_cancellations"""
-        return OrderCancellationClient(**self._kwargs)
+        return self._client(OrderCancellationClient)
 
     @lazy_property
     def order_changes(self):
         """Order Changes API - /air/order_changes"""
-        return OrderChangeClient(**self._kwargs)
+        return self._client(OrderChangeClient)
 
     @lazy_property
     def order_change_offers(self):
         """Order Change Offers API - /air/order_change_offers"""
-        return OrderChangeOfferClient(**self._kwargs)
+        return self._client(OrderChangeOfferClient)
 
     @lazy_property
     def order_change_requests(self):
         """Order Change Requests API - /air/order_change_requests"""
-        return OrderChangeRequestClient(**self._kwargs)
+        return self._client(OrderChangeRequestClient)
 
     @lazy_property
     def partial_offer_requests(self):
         """Partial Offer Requests API - /air/partial_offer_requests"""
-        return PartialOfferRequestClient(**self._kwargs)
+        return self._client(PartialOfferRequestClient)
 
     @lazy_property
     def payment_intents(self):
         """Payment Intents API - /payments/payment_intents"""
-        return PaymentIntentClient(**self._kwargs)
+        return self._client(PaymentIntentClient)
 
     @lazy_property
     def payments(self):
         """Payments API - /air/payments"""
-        return PaymentClient(**self._kwargs)
+        return self._client(PaymentClient)
 
     @lazy_property
     def seat_maps(self):
         """Seat Maps API - /air/seat_maps"""
-        return SeatMapClient(**self._kwargs)
+        return self._client(SeatMapClient, seat_map_cache=self._seat_map_cache)
 
     @lazy_property
     def sessions(self):
         """Links Sessions API - /links/sessions"""
-        return LinksSessionClient(**self._kwargs)
+        return self._client(LinksSessionClient)
 
     @lazy_property
     def webhooks(self):
         """Webhooks API - /air/webhooks (Preview)"""
-        return WebhookClient(**self._kwargs)
+        return self._client(WebhookClient)
@@ -1,9 +1,15 @@
 """Http Client, api response and error management"""
 import os
+import queue
+import threading
 
 from requests import Request, Session
 from requests import codes as http_codes
+from requests.exceptions import ConnectionError, Timeout
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
 
+from .json_codec import JsonCodec, default_codec
+from .models import projection
 from .utils import version
 
 
@@ -14,9 +20,12 @@ class ClientError(Exception):
 class ApiError(Exception):
     """An error originated from the API"""
 
-    def __init__(self, headers, json):
+    def __init__(self, headers, json, status_code=None):
         self._headers = headers
         self.meta = json["meta"]
+        if status_code is None:
+            status_code = self.meta.get("status")
+        self.status_code = status_code
         self.errors = json["errors"]
         # We always only print the first error message
         self.message = self.errors[0]["message"]
@@ -33,45 +42,238 @@ class ApiError(Exception):
         return self._headers
 
 
+def default_headers(access_token=None, api_version=None):
+    """Headers sent along with every request to the API"""
+    if api_version is None:
+        api_version = HttpClient.VERSION
+    if not access_token:
+        access_token = os.getenv("DUFFEL_ACCESS_TOKEN")
+        if not access_token:
+            raise ClientError("must set DUFFEL_ACCESS_TOKEN")
+
+    return {
+        "User-Agent": f"Duffel/{api_version} duffel_api_python/{version()}",
+        "Accept": "application/json",
+        "Duffel-Version": api_version,
+        "Authorization": f"Bearer {access_token}",
+    }
+
+
+def handle_response(response, json_codec=None):
+    """Return the decoded body of a response or raise an ApiError in case an error
+    occurred
+
+    This works with both `requests` and `httpx` responses. The body is decoded from
+    the raw bytes with `json_codec`, or the stdlib decoder if not given.
+    """
+    if json_codec is None:
+        json_codec = JsonCodec()
+
+    if response.status_code in [
+        http_codes.ok,
+        http_codes.created,
+    ]:
+        try:
+            return json_codec.loads(response.content)
+        except ValueError as err:
+            raise Exception(f"something bad happened: {response.text}") from err
+    elif response.status_code == http_codes.no_content:
+        return None
+    else:
+        try:
+            raise ApiError(
+                response.headers,
+                json_codec.loads(response.content),
+                response.status_code,
+            )
+        except ValueError as err:
+            raise Exception(f"something bad happened: {response.text}") from err
+        raise response.raise_for_status()
+
+
 # TODO(nlopes): I don't like this. Pagination in this way means the user will be
 # constrained by this flow.  A better way would be to return a ListObject that contains
 # the first list of objects and then if the user wants auto pagination, they can call
 # something like `auto_paginate` or something along those lines.  We also don't provide
 # good mechanisms for the user to react to rate limiting when auto paginating.
 class Pagination:
-    """A way to do pagination on list() calls"""
+    """A way to do pagination on list() calls
+
+    With `prefetch` set to a positive number, pages are fetched by a background thread
+    while the current one is being consumed. At most `prefetch` pages wait in the
+    buffer, so memory use stays bounded no matter how many pages there are.
+
+    If fetching a page fails (e.g. after the client ran out of retries), iterating
+    again resumes from that page instead of starting over.
 
-    def __init__(self, client, caller, params):
+    With `fields`, only those fields of each item are parsed, into records made by
+    `projection`.
+    """
+
+    def __init__(self, client, caller, params, prefetch=0, fields=None):
         self._client = client
-        self._caller = caller
+        self._caller = caller if fields is None else projection(caller, fields)
 
         if params["limit"] > 200:
             # We're vaguely faking the structure of the error structure returned
             # from the API.
             raise ApiError([], {"errors": [{"message": "limit exceeds 200"}]})
+        if prefetch < 0:
+            raise ClientError("prefetch must not be negative")
         self._params = params
+        self._prefetch = prefetch
+        # Cursor of the page being consumed, `None` for the first one
+        self._after = None
 
     def __iter__(self):
         """Iterate over the response items and yield one by one"""
+        if self._prefetch:
+            pages = self._prefetched_pages()
+        else:
+            pages = self._pages()
+
+        try:
+            for page in pages:
+                for entry in page["data"]:
+                    yield self._caller.from_json(entry)
+                self._after = page["meta"]["after"]
+        except GeneratorExit:
+            # The caller stopped on purpose, the next iteration starts over
+            self._after = None
+            raise
+        self._after = None
+
+    def _pages(self):
+        """Fetch the pages one after the other, following the `after` cursor"""
+        params = dict(self._params)
+        if self._after is not None:
+            params["after"] = self._after
         response = self._client.do_get(
             self._client._url,
-            query_params=self._params,
+            query_params=params,
         )
 
         while "meta" in response:
-            after = response["meta"]["after"]
-            for entry in response["data"]:
-                yield self._caller.from_json(entry)
+            yield response
 
+            after = response["meta"]["after"]
             if after is None:
                 break
 
-            self._params["after"] = after
+            params["after"] = after
             response = self._client.do_get(
                 self._client._url,
-                query_params=self._params,
+                query_params=params,
             )
 
+    def _prefetched_pages(self):
+        """Same as `_pages` but the pages are fetched ahead by a background thread"""
+        prefetcher = _PagePrefetcher(self._pages(), self._prefetch)
+        try:
+            yield from prefetcher
+        finally:
+            # Unblocks the fetcher if the caller stopped iterating early
+            prefetcher.stop()
+
+
+class _PagePrefetcher:
+    """Drains a page generator from a background thread into a bounded buffer"""
+
+    _DONE = object()
+
+    def __init__(self, pages, size):
+        self._pages = pages
+        self._buffer = queue.Queue(maxsize=size)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._fetch, daemon=True)
+        self._thread.start()
+
+    def __iter__(self):
+        """Yield the pages in order, re-raising any error hit while fetching them"""
+        while True:
+            item = self._buffer.get()
+            if item is self._DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    def stop(self):
+        """Tell the fetcher to give up"""
+        self._stopped.set()
+
+    def _fetch(self):
+        """Fill the buffer until there are no pages left or the consumer is gone"""
+        try:
+            for page in self._pages:
+                if not self._put(page):
+                    return
+        except Exception as err:
+            self._put(err)
+            return
+        self._put(self._DONE)
+
+    def _put(self, item):
+        """Wait for room in the buffer, giving up once the consumer stopped"""
+        while not self._stopped.is_set():
+            try:
+                self._buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+class HttpTransport:
+    """Connection pool and default headers shared by every client of a `Duffel`
+    instance.
+
+    Each `HttpClient` used to build its own `requests.Session`, which meant one TCP/TLS
+    connection pool per resource. The transport owns a single session so all of them
+    reuse the same connections.
+    """
+
+    def __init__(
+        self,
+        access_token=None,
+        api_version=None,
+        pool_connections=DEFAULT_POOLSIZE,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        pool_block=DEFAULT_POOLBLOCK,
+        keep_alive=True,
+    ):
+        """Create the shared session.
+
+        `pool_connections` is the number of per-host pools to cache, `pool_maxsize`
+        the maximum number of connections kept per host and `pool_block` whether to
+        wait for a free connection instead of opening a throwaway one once the pool is
+        exhausted. Setting `keep_alive` to `False` closes connections after every
+        response.
+        """
+        headers = default_headers(access_token, api_version)
+
+        self.session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.session.headers.update(headers)
+        if not keep_alive:
+            self.session.headers.update({"Connection": "close"})
+
+    def send(self, request, **settings):
+        """Prepare and send a `requests.Request` through the shared session"""
+        prepared = self.session.prepare_request(request)
+        return self.session.send(prepared, **settings)
+
+    def close(self):
+        """Close all the pooled connections"""
+        self.session.close()
+
 
 class HttpClient:
     """Http Client to manage all calls to the Duffel API"""
@@ -79,7 +281,17 @@ class HttpClient:
     URL = "https://api.duffel.com"
     VERSION = "v1"
 
-    def __init__(self, access_token=None, api_url=None, api_version=None, **settings):
+    def __init__(
+        self,
+        access_token=None,
+        api_url=None,
+        api_version=None,
+        transport=None,
+        retry=None,
+        rate_limiter=None,
+        json_codec=None,
+        **settings,
+    ):
         if api_url is not None:
             self._api_url = api_url
         else:
@@ -89,52 +301,104 @@ class HttpClient:
         else:
             self._api_version = HttpClient.VERSION
 
-        self.http_session = Session()
+        # A client created on its own gets a private transport, `Duffel` hands the
+        # same one to all of its clients.
+        if transport is None:
+            transport = HttpTransport(access_token, self._api_version)
+        self._transport = transport
+        self.http_session = transport.session
+        # A `RetryPolicy`, failed requests are not retried without one
+        self._retry = retry
+        # A `RateLimiter` pacing the requests, usually shared with other clients
+        self._rate_limiter = rate_limiter
+        # Encodes request bodies and decodes responses, orjson when available
+        self._json_codec = json_codec if json_codec is not None else default_codec()
         self._settings = settings
 
-        user_agent = f"Duffel/{self._api_version} duffel_api_python/{version()}"
-        self.http_session.headers.update({"User-Agent": user_agent})
-        self.http_session.headers.update({"Accept": "application/json"})
-        self.http_session.headers.update({"Duffel-Version": self._api_version})
-        if not access_token:
-            access_token = os.getenv("DUFFEL_ACCESS_TOKEN")
-            if not access_token:
-                raise ClientError("must set DUFFEL_ACCESS_TOKEN")
-        self.http_session.headers.update({"Authorization": f"Bearer {access_token}"})
+    def _request(self, endpoint, method, query_params, body, idempotency_key):
+        """Build the request to `endpoint`, with `body` encoded"""
+        headers = {}
+        data = None
+        if body is not None:
+            data = self._json_codec.dumps(body)
+            headers["Content-Type"] = "application/json"
+        if idempotency_key is not None:
+            headers["Idempotency-Key"] = idempotency_key
+        return Request(
+            method,
+            self._api_url + endpoint,
+            params=query_params,
+            data=data,
+            headers=headers,
+        )
 
-    def _http_call(self, endpoint, method, query_params=None, body=None):
+    def _http_call(
+        self, endpoint, method, query_params=None, body=None, idempotency_key=None
+    ):
         """Perform the http call and wrap the response in a ApiError in case an error
         occurred
 
         """
-        request_url = self._api_url + endpoint
-        request = Request(method, request_url, params=query_params, json=body)
-        prepared = self.http_session.prepare_request(request)
-        response = self.http_session.send(prepared, **self._settings)
-        if response.status_code in [
-            http_codes.ok,
-            http_codes.created,
-        ]:
-            try:
-                return response.json()
-            except ValueError as err:
-                raise Exception(f"something bad happened: {response.text}") from err
-        elif response.status_code == http_codes.no_content:
-            return None
-        else:
-            try:
-                raise ApiError(response.headers, response.json())
-            except ValueError as err:
-                raise Exception(f"something bad happened: {response.text}") from err
-            raise response.raise_for_status()
+        request = self._request(endpoint, method, query_params, body, idempotency_key)
+        return self._send(request, idempotency_key)
+
+    def _send(self, request, idempotency_key=None, stream=False):
+        """Send `request`, retrying as configured, and return the decoded body.
+
+        With `stream`, return the response itself as soon as its headers say it
+        succeeded, leaving the body to be read.
+        """
+
+        def send():
+            """Send the request once"""
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            response = self._transport.send(request, stream=stream, **self._settings)
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(response.headers)
+            if stream and response.status_code in (http_codes.ok, http_codes.created):
+                return response
+            return handle_response(response, self._json_codec)
+
+        if self._retry is None:
+            return send()
+        return self._retry.call(
+            send, request.method, idempotency_key, retry_on=(ConnectionError, Timeout)
+        )
+
+    def do_stream(
+        self,
+        endpoint,
+        method="POST",
+        query_params=None,
+        body=None,
+        idempotency_key=None,
+        chunk_size=65536,
+    ):
+        """Issue a request to `endpoint` and yield the chunks of the response body as
+        they are received. Nothing is sent until the first chunk is asked for.
+        """
+        request = self._request(endpoint, method, query_params, body, idempotency_key)
+        with self._send(request, idempotency_key, stream=True) as response:
+            yield from response.iter_content(chunk_size)
 
     def do_get(self, endpoint, method="GET", query_params=None, body=None):
         """Issue a GET request to `endpoint`"""
         return self._http_call(endpoint, method, query_params, body)
 
-    def do_post(self, endpoint, method="POST", query_params=None, body=None):
-        """Issue a POST request to `endpoint`"""
-        return self._http_call(endpoint, method, query_params, body)
+    def do_post(
+        self,
+        endpoint,
+        method="POST",
+        query_params=None,
+        body=None,
+        idempotency_key=None,
+    ):
+        """Issue a POST request to `endpoint`
+
+        With an `idempotency_key` the request is safe to retry.
+        """
+        return self._http_call(endpoint, method, query_params, body, idempotency_key)
 
     def do_delete(self, endpoint, method="DELETE", query_params=None, body=None):
         """Issue a DELETE request to `endpoint`"""
@@ -0,0 +1,52 @@
+"""JSON encoding of request bodies and decoding of responses"""
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+class JsonCodec:
+    """Codec backed by the standard library `json` module.
+
+    Any object with the same `loads` and `dumps` methods can be given to the clients as
+    `json_codec`.
+    """
+
+    name = "json"
+
+    def loads(self, data):
+        """Decode a response body, given as raw bytes"""
+        return json.loads(data)
+
+    def dumps(self, value):
+        """Encode a request body as UTF-8 bytes"""
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by `orjson`, which decodes straight from bytes and is much faster
+    on large responses such as offer requests with `return_offers`
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def loads(self, data):
+        """Decode a response body, given as raw bytes"""
+        return orjson.loads(data)
+
+    def dumps(self, value):
+        """Encode a request body as UTF-8 bytes"""
+        return orjson.dumps(value)
+
+
+def default_codec():
+    """The fastest codec available: orjson when installed, the stdlib otherwise"""
+    if orjson is not None:
+        return OrjsonCodec()
+    return JsonCodec()
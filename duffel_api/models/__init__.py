@@ -1,8 +1,12 @@
 from .aircraft import Aircraft
 from .airline import Airline
 from .airport import Airport, City, Place, Refund
+from .decoding import projection
+from .interning import REFERENCE_POOL, ReferencePool
+from .lazy import LazyModel
 from .loyalty_programme_account import LoyaltyProgrammeAccount
 from .offer import (
+    LazyOffer,
     Offer,
     OfferConditionChangeBeforeDeparture,
     OfferConditionRefundBeforeDeparture,
@@ -10,6 +14,7 @@ from .offer import (
 )
 from .offer_request import OfferRequest
 from .order import (
+    LazyOrder,
     Order,
     OrderConditionChangeBeforeDeparture,
     OrderConditionRefundBeforeDeparture,
@@ -20,7 +25,7 @@ from .order_change_offer import OrderChangeOffer
 from .order_change_request import OrderChangeRequest
 from .payment import Payment
 from .payment_intent import PaymentIntent
-from .seat_map import SeatMap
+from .seat_map import LazySeatMap, SeatMap
 from .session import Session
 from .webhook import Webhook
 
@@ -31,6 +36,12 @@ __all__ = [
     "City",
     "LoyaltyProgrammeAccount",
     "Place",
+    "REFERENCE_POOL",
+    "ReferencePool",
+    "LazyModel",
+    "LazyOffer",
+    "LazyOrder",
+    "LazySeatMap",
     "Offer",
     "OfferPassenger",
     "OfferConditionChangeBeforeDeparture",
@@ -49,4 +60,5 @@ __all__ = [
     "SeatMap",
     "Session",
     "Webhook",
+    "projection",
 ]
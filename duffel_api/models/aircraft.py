@@ -1,19 +1,13 @@
-from dataclasses import dataclass
+from duffel_api.models.decoding import JsonModel
+from duffel_api.models.slotted import slotted_dataclass
 
 
-@dataclass
-class Aircraft:
+@slotted_dataclass(frozen=True)
+class Aircraft(JsonModel):
     """Aircraft are used to describe what passengers will fly in for a given trip"""
 
     id: str
     iata_code: str
     name: str
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            iata_code=json["iata_code"],
-            name=json["name"],
-        )
+    interned = True
@@ -1,9 +1,11 @@
-from dataclasses import dataclass
 from typing import Optional
 
+from duffel_api.models.decoding import JsonModel
+from duffel_api.models.slotted import slotted_dataclass
 
-@dataclass
-class Airline:
+
+@slotted_dataclass(frozen=True)
+class Airline(JsonModel):
     """Airlines are used to identify the air travel companies selling and operating
     flights
     """
@@ -12,11 +14,4 @@ class Airline:
     name: str
     iata_code: Optional[str]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            name=json["name"],
-            iata_code=json.get("iata_code"),
-        )
+    interned = True
@@ -1,12 +1,12 @@
-from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Sequence
 
-from duffel_api.utils import get_and_transform, parse_datetime
+from duffel_api.models.decoding import JsonModel
+from duffel_api.models.slotted import slotted_dataclass
 
 
-@dataclass
-class City:
+@slotted_dataclass(frozen=True)
+class City(JsonModel):
     """The metropolitan area where the airport is located.
     Only present for airports which are registered with IATA as
     belonging to a metropolitan area.
@@ -17,19 +17,11 @@ class City:
     iata_code: str
     iata_country_code: str
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            name=json["name"],
-            iata_code=json["iata_code"],
-            iata_country_code=json["iata_country_code"],
-        )
+    interned = True
 
 
-@dataclass
-class Airport:
+@slotted_dataclass(frozen=True)
+class Airport(JsonModel):
     """Airports are used to identify origins and destinations in journey
     slices"""
 
@@ -43,24 +35,11 @@ class Airport:
     time_zone: str
     city: Optional[City]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            name=json["name"],
-            iata_code=json.get("iata_code"),
-            icao_code=json.get("icao_code"),
-            iata_country_code=json["iata_country_code"],
-            latitude=json["latitude"],
-            longitude=json["longitude"],
-            time_zone=json["time_zone"],
-            city=get_and_transform(json, "city", City.from_json),
-        )
-
-
-@dataclass
-class Place:
+    interned = True
+
+
+@slotted_dataclass
+class Place(JsonModel):
     """The city or airport"""
 
     id: str
@@ -87,31 +66,9 @@ class Place:
 
         return self
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            name=json["name"],
-            type=json["type"],
-            iata_city_code=json.get("iata_city_code"),
-            iata_country_code=json["iata_country_code"],
-            latitude=json.get("latitude"),
-            longitude=json.get("longitude"),
-            icao_code=json.get("icao_code"),
-            time_zone=json.get("time_zone"),
-            city_name=json.get("city_name"),
-            city=get_and_transform(json, "city", City.from_json),
-            airports=get_and_transform(
-                json,
-                "airports",
-                lambda value: [Airport.from_json(airport) for airport in value],
-            ),
-        )
-
-
-@dataclass
-class Refund:
+
+@slotted_dataclass
+class Refund(JsonModel):
     """A Refund allows you to refund money that you had collected from a customer with a
     Payment Intent. You're able to do partial refunds and also able to do multiple
     refunds for the same Payment Intent.
@@ -129,21 +86,3 @@ class Refund:
     arrival: str
     created_at: datetime
     updated_at: datetime
-
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            live_mode=json["live_mode"],
-            payment_intent_id=json["payment_intent_id"],
-            amount=json["amount"],
-            currency=json["currency"],
-            net_amount=json.get("net_amount"),
-            net_currency=json.get("net_currency"),
-            status=json["status"],
-            destination=json["destination"],
-            arrival=json["arrival"],
-            created_at=parse_datetime(json["created_at"]),
-            updated_at=parse_datetime(json["updated_at"]),
-        )
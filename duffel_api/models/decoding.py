@@ -0,0 +1,285 @@
+"""`from_json` decoders generated from the annotations of the models.
+
+Rather than each model spelling out how every field is read from the JSON, the
+decoder is derived from the field's type:
+
+- `T` is read with `json[key]`, a missing key raises `KeyError`
+- `Optional[T]` is read with `json.get(key)`
+- models (anything with a `from_json`), `datetime` and `date` are converted with
+  `from_json`, `parse_datetime` and `date.fromisoformat`. When optional, a missing or
+  `null` value gives `None`
+- `Sequence[Model]` gives `[]` when missing, `None` when `null`
+
+Converted values follow `get_and_transform`: a `KeyError` raised while converting a
+value which may be missing leaves the default instead.
+
+`json_metadata` overrides the key and conversion of a field, or picks the model of a
+union from another key (e.g. `origin` from `origin_type`). `from_json_with` compiles
+the decoder of a model with other conversions of some fields. The decoders are compiled
+into straight-line Python functions the first time a model is decoded, which avoids
+the lambdas, helper calls and lookups of hand-written decoders. `projection` compiles
+decoders of only some of the fields, into light record types.
+"""
+import collections
+import copy
+import functools
+import typing
+from dataclasses import MISSING, fields
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Optional, Union
+
+from duffel_api.models import interning
+from duffel_api.utils import parse_datetime
+
+NONE_TYPE = type(None)
+
+
+def json_metadata(
+    key: Optional[str] = None,
+    decode: Union[Callable, Dict[str, Callable], None] = None,
+    required: Optional[bool] = None,
+    tag: Optional[str] = None,
+) -> dict:
+    """Metadata of a field whose decoding differs from what its type implies, as in
+    `field(metadata=json_metadata(key="fare"))`.
+
+    `key` is the JSON key if not the field's name, `decode` converts the value and
+    `required` makes a missing key raise (or not) regardless of the type. The
+    `default` of the field is used when the key is missing.
+
+    With `tag`, `decode` maps the values of the key `tag` to the conversion to use,
+    as in `json_metadata(tag="origin_type", decode={"city": City.from_json})`. Values
+    with any other tag are kept as they are.
+    """
+    return {"key": key, "decode": decode, "required": required, "tag": tag}
+
+
+def datetime_format(format: str) -> Callable[[str], datetime]:
+    """Decoder of datetimes in exactly `format`, for fields stricter than
+    `parse_datetime`
+    """
+
+    def decode(value):
+        """Parse `value` with `strptime`"""
+        return datetime.strptime(value, format)
+
+    return decode
+
+
+# Fields which only accept the exact format they have always been parsed with
+STRICT_DATETIME = datetime_format("%Y-%m-%dT%H:%M:%S")
+STRICT_DATETIME_MS = datetime_format("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class FieldDecoder:
+    """How one field of a model is read from the JSON"""
+
+    def __init__(self, model_field, hint):
+        self.name = model_field.name
+        metadata = model_field.metadata
+        self.key = metadata.get("key") or self.name
+
+        optional = False
+        if typing.get_origin(hint) is typing.Union and NONE_TYPE in hint.__args__:
+            args = [arg for arg in hint.__args__ if arg is not NONE_TYPE]
+            optional = True
+            hint = args[0] if len(args) == 1 else hint
+
+        self.tag = metadata.get("tag")
+        self.decode = metadata.get("decode") or self.converter(hint)
+        self.many = False
+        if self.decode is None and typing.get_origin(hint) in (
+            list,
+            typing.get_origin(typing.Sequence),
+        ):
+            item_decode = self.converter(hint.__args__[0])
+            if item_decode is not None:
+                self.decode = item_decode
+                self.many = True
+
+        required = metadata.get("required")
+        if required is None:
+            # Lists of models have always defaulted to empty ones
+            required = not optional and not self.many
+        self.required = required
+        if model_field.default is not MISSING:
+            self.default = model_field.default
+        else:
+            self.default = [] if self.many and not optional else None
+
+    @staticmethod
+    def converter(hint):
+        """Function converting the JSON value to `hint`, `None` to keep it as it is"""
+        if hint is datetime:
+            return parse_datetime
+        if hint is date:
+            return date.fromisoformat
+        if isinstance(hint, type) and issubclass(hint, JsonModel):
+            return install_from_json(hint)
+        if isinstance(hint, type) and hasattr(hint, "from_json"):
+            return hint.from_json
+        return None
+
+    def source(self, namespace):
+        """Lines of code setting the local variable named after the field.
+
+        The functions and values used are added to `namespace`.
+        """
+        name, key = self.name, repr(self.key)
+        decode = f"decode_{name}"
+        namespace[decode] = self.decode
+        default = f"default_{name}"
+        namespace[default] = self.default
+        copy = ".copy()" if isinstance(self.default, list) else ""
+        if self.decode is None:
+            if self.required:
+                return [f"{name} = json[{key}]"]
+            if self.default is None:
+                return [f"{name} = json.get({key})"]
+            return [f"{name} = json[{key}] if {key} in json else {default}{copy}"]
+
+        if self.tag is not None:
+            # The conversion picked by the tag, the value as it is for other tags
+            return [
+                f"value = json[{key}]",
+                f"tag = json[{self.tag!r}]",
+                f"variant = {decode}.get(tag) if isinstance(tag, str) else None",
+                f"{name} = value if variant is None else variant(value)",
+            ]
+        if self.many:
+            value = f"[{decode}(item) for item in value]"
+        else:
+            value = f"{decode}(value)"
+        if self.required:
+            return [f"value = json[{key}]", f"{name} = {value}"]
+
+        # Same as `get_and_transform`
+        return [
+            "try:",
+            f"    value = json[{key}]",
+            f"    {name} = None if value is None else {value}",
+            "except KeyError:",
+            f"    {name} = {default}{copy}",
+        ]
+
+
+def field_decoders_of(model) -> list:
+    """A `FieldDecoder` for every field of `model`"""
+    hints = typing.get_type_hints(model)
+    return [FieldDecoder(field, hints[field.name]) for field in fields(model)]
+
+
+def compile_function(name, lines, namespace):
+    """Define the function `name` from its lines of code"""
+    exec("\n".join(lines), namespace)
+    return namespace[name]
+
+
+def compile_from_json(model, decoders=None):
+    """Build the `from_json` of `model`, to be wrapped in a `classmethod`.
+
+    `decoders` are those of the fields passed to `model`, all of them by default.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def from_json(cls, json):"]
+    if decoders is None:
+        decoders = field_decoders_of(model)
+    for decoder in decoders:
+        lines.extend(f"    {line}" for line in decoder.source(namespace))
+    arguments = ", ".join(f"{decoder.name}={decoder.name}" for decoder in decoders)
+    lines.append(f"    return cls({arguments})")
+    return compile_function("from_json", lines, namespace)
+
+
+def from_json_with(model, **decode: Callable) -> Callable:
+    """The `from_json` of `model` with the fields named in `decode` converted by the
+    functions given, to be called as `from_json(cls, json)`.
+
+    Lists are converted item by item as usual, e.g.
+    `from_json_with(OfferRequest, offers=LazyOffer.from_json)`. Compiled once for
+    each set of conversions.
+    """
+    return _from_json_with(model, tuple(sorted(decode.items())))
+
+
+@functools.lru_cache(maxsize=None)
+def _from_json_with(model, decode):
+    """`from_json_with`, with the conversions as a tuple so it can be cached"""
+    decoders = []
+    for decoder in field_decoders_of(model):
+        if decoder.name in dict(decode):
+            decoder = copy.copy(decoder)
+            decoder.decode = dict(decode)[decoder.name]
+        decoders.append(decoder)
+    return compile_from_json(model, decoders)
+
+
+def compile_field_decoders(model) -> Dict[str, Callable[[dict], Any]]:
+    """One function per field of `model`, taking the JSON of the model and returning
+    the field's value, as used by `LazyModel`
+    """
+    functions = {}
+    for decoder in field_decoders_of(model):
+        namespace: Dict[str, Any] = {}
+        lines = ["def decode(json):"]
+        lines.extend(f"    {line}" for line in decoder.source(namespace))
+        lines.append(f"    return {decoder.name}")
+        functions[decoder.name] = compile_function("decode", lines, namespace)
+    return functions
+
+
+def projection(model, names) -> type:
+    """Record type holding only the fields `names` of `model`.
+
+    The record is a named tuple (e.g. `OrderRecord`) whose `from_json` decodes those
+    fields the same way `model.from_json` does and never looks at the rest of the JSON,
+    so unwanted nested objects are not built at all.
+    """
+    return _projection(model, tuple(names))
+
+
+@functools.lru_cache(maxsize=None)
+def _projection(model, names):
+    """`projection`, with the names as a tuple so it can be cached"""
+    if not names:
+        raise ValueError("at least one field is required")
+    decoders = {decoder.name: decoder for decoder in field_decoders_of(model)}
+    for name in names:
+        if name not in decoders:
+            raise ValueError(f"{model.__name__} has no field {name!r}")
+
+    record = collections.namedtuple(f"{model.__name__}Record", names)  # type: ignore
+    record.from_json = classmethod(  # type: ignore[attr-defined]
+        compile_from_json(record, [decoders[name] for name in names])
+    )
+    return record
+
+
+class JsonModel:
+    """Base of the models whose `from_json` is generated from their annotations.
+
+    Set `interned` on reference models to share their instances through the
+    `REFERENCE_POOL`.
+    """
+
+    __slots__ = ()
+
+    interned = False
+
+    @classmethod
+    def from_json(cls, json: dict):
+        """Construct a class instance from a JSON response."""
+        # Compiled on first use, when all the models it refers to exist
+        return install_from_json(cls)(json)
+
+
+def install_from_json(model):
+    """Compile the `from_json` of `model` and set it on the class, unless that was
+    already done, and return it
+    """
+    if "from_json" not in vars(model):
+        decoder = compile_from_json(model)
+        if model.interned:
+            decoder = interning.interned(decoder)
+        setattr(model, "from_json", classmethod(decoder))
+    return model.from_json
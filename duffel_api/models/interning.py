@@ -0,0 +1,71 @@
+"""Sharing one instance of the reference data repeated throughout responses"""
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+
+class ReferencePool:
+    """Bounded, thread-safe pool of reference models (airports, airlines...) keyed by
+    their class and ID.
+
+    A response with many offers mentions the same few airports and airlines over and
+    over. Models built from the same JSON are handed out from the pool instead of being
+    built again, so they all share one instance, which is why those models are frozen.
+    An entry is only reused when the JSON it was built from is equal to the new one.
+    The least recently used entries are dropped past `maxsize`, 0 disables the pool.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Number of instances in the pool"""
+        return len(self._entries)
+
+    def get(self, cls, json, build):
+        """The instance of `cls` for `json`, built with `build(cls, json)` if needed"""
+        if not isinstance(json, dict):
+            # Left to `build` to fail, e.g. on `null`, as it would without the pool
+            return build(cls, json)
+        key = (cls, json.get("id"))
+        if not isinstance(key[1], str) or not self.maxsize:
+            return build(cls, json)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == json:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        # Built outside of the lock, as nested models go through the pool too
+        instance = build(cls, json)
+        with self._lock:
+            self._entries[key] = (json, instance)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return instance
+
+    def clear(self):
+        """Drop all the instances"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Pool used by all the reference models
+REFERENCE_POOL = ReferencePool()
+
+
+def interned(from_json):
+    """Decorator for the `from_json` of a reference model, sharing its instances
+    through `REFERENCE_POOL`
+    """
+
+    @wraps(from_json)
+    def wrapper(cls, json: dict):
+        """Look the instance up in the pool before building it"""
+        return REFERENCE_POOL.get(cls, json, from_json)
+
+    return wrapper
@@ -0,0 +1,57 @@
+"""Views over the JSON of a model that only build the fields being read"""
+
+
+class LazyModel:
+    """Read-only view of a model backed by the JSON object it comes from.
+
+    Each field is decoded the first time it is read and kept afterwards, so code that
+    only looks at a few fields of many objects (e.g. ranking offers by price) doesn't
+    pay for building all the nested models it never uses. `to_model()` builds the
+    complete model.
+
+    Subclasses set `model`, the dataclass being mirrored, and `decoders`, mapping each
+    of its fields to a function of the JSON object returning the field's value.
+    """
+
+    model: type
+    decoders: dict
+
+    def __init__(self, json: dict):
+        self._json = json
+
+    @classmethod
+    def from_json(cls, json: dict):
+        """Wrap the JSON object without decoding anything yet"""
+        return cls(json)
+
+    def __getattr__(self, name):
+        """Decode the field `name`, only called the first time it is read"""
+        try:
+            decode = self.decoders[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+        value = decode(self._json)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        """List the fields of the model along with the regular attributes"""
+        return sorted(set(super().__dir__()) | set(self.decoders))
+
+    def __eq__(self, other):
+        """Compare as the complete models"""
+        if isinstance(other, LazyModel):
+            other = other.to_model()
+        return self.to_model() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self):
+        """Only show the ID, as showing more would decode everything"""
+        return f"{type(self).__name__}(id={self._json.get('id')!r})"
+
+    def to_model(self):
+        """Build the complete model, reusing the fields decoded so far"""
+        return self.model(**{name: getattr(self, name) for name in self.decoders})
@@ -1,13 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import field
 from datetime import datetime
 from typing import Optional, Sequence
 
 from duffel_api.models import Aircraft, Airline, Airport, LoyaltyProgrammeAccount, Place
-from duffel_api.utils import get_and_transform, parse_datetime
+from duffel_api.models.lazy import LazyModel
+from duffel_api.models.decoding import JsonModel, compile_field_decoders, json_metadata
+from duffel_api.models.slotted import slotted_dataclass
 
 
-@dataclass
-class OfferConditionChangeBeforeDeparture:
+@slotted_dataclass
+class OfferConditionChangeBeforeDeparture(JsonModel):
     """Whether the whole offer can be changed before the departure of the first slice.
 
     If all of the slices on the offer can be changed then the allowed property will be
@@ -22,18 +24,9 @@ class OfferConditionChangeBeforeDeparture:
     penalty_amount: Optional[str]
     penalty_currency: Optional[str]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            allowed=json["allowed"],
-            penalty_amount=json.get("penalty_amount"),
-            penalty_currency=json.get("penalty_currency"),
-        )
 
-
-@dataclass
-class OfferConditionRefundBeforeDeparture:
+@slotted_dataclass
+class OfferConditionRefundBeforeDeparture(JsonModel):
     """Whether the whole offer can be refunded before the departure of the first slice.
 
     If all of the slices on the offer can be refunded then the allowed property will be
@@ -47,18 +40,9 @@ class OfferConditionRefundBeforeDeparture:
     penalty_amount: Optional[str]
     penalty_currency: Optional[str]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            allowed=json["allowed"],
-            penalty_amount=json.get("penalty_amount"),
-            penalty_currency=json.get("penalty_currency"),
-        )
-
 
-@dataclass
-class OfferConditions:
+@slotted_dataclass
+class OfferConditions(JsonModel):
     """The conditions associated with this offer, describing the kinds of modifications
     you can make post-booking and any penalties that will apply to those modifications.
     """
@@ -66,47 +50,18 @@ class OfferConditions:
     change_before_departure: Optional[OfferConditionChangeBeforeDeparture]
     refund_before_departure: Optional[OfferConditionRefundBeforeDeparture]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            change_before_departure=get_and_transform(
-                json,
-                "change_before_departure",
-                OfferConditionChangeBeforeDeparture.from_json,
-            ),
-            refund_before_departure=get_and_transform(
-                json,
-                "refund_before_departure",
-                OfferConditionRefundBeforeDeparture.from_json,
-            ),
-        )
-
-
-@dataclass
-class PaymentRequirements:
+
+@slotted_dataclass
+class PaymentRequirements(JsonModel):
     """The payment requirements for an offer"""
 
     payment_required_by: Optional[datetime]
     price_guarantee_expires_at: Optional[datetime]
     requires_instant_payment: bool
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            payment_required_by=get_and_transform(
-                json, "payment_required_by", parse_datetime
-            ),
-            price_guarantee_expires_at=get_and_transform(
-                json, "price_guarantee_expires_at", parse_datetime
-            ),
-            requires_instant_payment=json["requires_instant_payment"],
-        )
-
-
-@dataclass
-class ServiceMetadata:
+
+@slotted_dataclass
+class ServiceMetadata(JsonModel):
     """An object containing metadata about the service, like the maximum weight
     and dimensions of the baggage.
     """
@@ -118,20 +73,9 @@ class ServiceMetadata:
     maximum_length_cm: Optional[int]
     maximum_depth_cm: Optional[int]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            type=json.get("type"),
-            maximum_weight_kg=json.get("maximum_weight_kg"),
-            maximum_height_cm=json.get("maximum_height_cm"),
-            maximum_length_cm=json.get("maximum_length_cm"),
-            maximum_depth_cm=json.get("maximum_depth_cm"),
-        )
-
 
-@dataclass
-class Service:
+@slotted_dataclass
+class Service(JsonModel):
     """The services that can be booked with the offer but are not included by default,
     for example an additional checked bag. This field is only returned in the [Get single
     offer](https://duffel.com/docs/api/offers/get-offer-by-id) endpoint. When there are no
@@ -154,23 +98,9 @@ class Service:
     class InvalidType(Exception):
         """Invalid service type"""
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            maximum_quantity=json["maximum_quantity"],
-            metadata=ServiceMetadata.from_json(json["metadata"]),
-            passenger_ids=json["passenger_ids"],
-            segment_ids=json["segment_ids"],
-            total_amount=json["total_amount"],
-            total_currency=json["total_currency"],
-            type=json["type"],
-        )
-
-
-@dataclass
-class OfferSliceSegmentPassengerBaggage:
+
+@slotted_dataclass
+class OfferSliceSegmentPassengerBaggage(JsonModel):
     """The baggage allowances for the passenger on this segment included in the offer.
     Some airlines may allow additional baggage to be booked as a service - see the offer's
     `available_services`
@@ -179,17 +109,9 @@ class OfferSliceSegmentPassengerBaggage:
     type: str
     quantity: int
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            type=json["type"],
-            quantity=json["quantity"],
-        )
-
 
-@dataclass
-class OfferSliceSegmentPassenger:
+@slotted_dataclass
+class OfferSliceSegmentPassenger(JsonModel):
     """Additional segment-specific information about the passengers included in the offer
     (e.g. their baggage allowance and the cabin class they will be travelling in)
 
@@ -199,30 +121,11 @@ class OfferSliceSegmentPassenger:
     cabin_class: str
     cabin_class_marketing_name: str
     passenger_id: str
-    fare_basis_code: Optional[str]
-
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            baggages=get_and_transform(
-                json,
-                "baggages",
-                lambda value: [
-                    OfferSliceSegmentPassengerBaggage.from_json(baggage)
-                    for baggage in value
-                ],
-                [],
-            ),
-            cabin_class=json["cabin_class"],
-            cabin_class_marketing_name=json["cabin_class_marketing_name"],
-            passenger_id=json["passenger_id"],
-            fare_basis_code=json.get("fare"),
-        )
-
-
-@dataclass
-class OfferSliceSegmentStop:
+    fare_basis_code: Optional[str] = field(metadata=json_metadata(key="fare"))
+
+
+@slotted_dataclass
+class OfferSliceSegmentStop(JsonModel):
     """Additional segment-specific information about the stops"""
 
     id: str
@@ -231,21 +134,9 @@ class OfferSliceSegmentStop:
     arriving_at: datetime
     duration: str
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        print(json)
-        return cls(
-            id=json["id"],
-            airport=Airport.from_json(json["airport"]),
-            departing_at=parse_datetime(json["departing_at"]),
-            arriving_at=parse_datetime(json["arriving_at"]),
-            duration=json["duration"],
-        )
-
-
-@dataclass
-class OfferSliceSegment:
+
+@slotted_dataclass
+class OfferSliceSegment(JsonModel):
     """The segments - that is, specific flights - that the airline is offering
     to get the passengers from the `origin` to the `destination`
     """
@@ -267,44 +158,9 @@ class OfferSliceSegment:
     passengers: Sequence[OfferSliceSegmentPassenger]
     stops: Sequence[OfferSliceSegmentStop]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            aircraft=get_and_transform(json, "aircraft", Aircraft.from_json),
-            arriving_at=parse_datetime(json["arriving_at"]),
-            departing_at=parse_datetime(json["departing_at"]),
-            destination=Airport.from_json(json["destination"]),
-            destination_terminal=json.get("destination_terminal"),
-            origin=Airport.from_json(json["origin"]),
-            origin_terminal=json.get("origin_terminal"),
-            distance=json.get("distance"),
-            duration=json.get("duration"),
-            marketing_carrier=Airline.from_json(json["marketing_carrier"]),
-            marketing_carrier_flight_number=json["marketing_carrier_flight_number"],
-            operating_carrier=Airline.from_json(json["operating_carrier"]),
-            operating_carrier_flight_number=json.get("operating_carrier_flight_number"),
-            passengers=get_and_transform(
-                json,
-                "passengers",
-                lambda value: [
-                    OfferSliceSegmentPassenger.from_json(passenger)
-                    for passenger in value
-                ],
-                [],
-            ),
-            stops=get_and_transform(
-                json,
-                "stops",
-                lambda value: [OfferSliceSegmentStop.from_json(stop) for stop in value],
-                [],
-            ),
-        )
-
-
-@dataclass
-class OfferSliceConditionsChangeBeforeDeparture:
+
+@slotted_dataclass
+class OfferSliceConditionsChangeBeforeDeparture(JsonModel):
     """Whether this slice can be changed before the departure.
 
     If the slice can be changed for all of the passengers then
@@ -325,18 +181,9 @@ class OfferSliceConditionsChangeBeforeDeparture:
     penalty_amount: Optional[str]
     penalty_currency: Optional[str]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            allowed=json["allowed"],
-            penalty_amount=json.get("penalty_amount"),
-            penalty_currency=json.get("penalty_currency"),
-        )
-
 
-@dataclass
-class OfferSliceConditions:
+@slotted_dataclass
+class OfferSliceConditions(JsonModel):
     """The conditions associated with this slice, describing the kinds of
     modifications you can make post-booking and any penalties that
     will apply to those modifications.
@@ -353,20 +200,9 @@ class OfferSliceConditions:
 
     change_before_departure: Optional[OfferSliceConditionsChangeBeforeDeparture]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            change_before_departure=get_and_transform(
-                json,
-                "change_before_departure",
-                OfferSliceConditionsChangeBeforeDeparture.from_json,
-            ),
-        )
-
 
-@dataclass
-class OfferSlice:
+@slotted_dataclass
+class OfferSlice(JsonModel):
     """Each slice will include one or more segments, the specific flights that the airline
     is offering to take the passengers from the slice's origin to its destination.
     """
@@ -381,31 +217,9 @@ class OfferSlice:
     segments: Sequence[OfferSliceSegment]
     conditions: OfferSliceConditions
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            destination=Place.from_json(json["destination"]),
-            destination_terminal=json.get("destination_terminal"),
-            origin=Place.from_json(json["origin"]),
-            origin_terminal=json.get("origin_terminal"),
-            duration=json.get("duration"),
-            fare_brand_name=json.get("fare_brand_name"),
-            segments=get_and_transform(
-                json,
-                "segments",
-                lambda value: [
-                    OfferSliceSegment.from_json(segment) for segment in value
-                ],
-                [],
-            ),
-            conditions=OfferSliceConditions.from_json(json["conditions"]),
-        )
-
-
-@dataclass
-class OfferPassenger:
+
+@slotted_dataclass
+class OfferPassenger(JsonModel):
     """The passenger travelling"""
 
     id: str
@@ -420,29 +234,9 @@ class OfferPassenger:
     class InvalidType(Exception):
         """Invalid passenger type provided"""
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            age=json["age"],
-            type=json["type"],
-            given_name=json.get("given_name"),
-            family_name=json.get("family_name"),
-            loyalty_programme_accounts=get_and_transform(
-                json,
-                "loyalty_programme_accounts",
-                lambda value: [
-                    LoyaltyProgrammeAccount.from_json(loyalty_programme_account)
-                    for loyalty_programme_account in value
-                ],
-                [],
-            ),
-        )
-
-
-@dataclass
-class Offer:
+
+@slotted_dataclass
+class Offer(JsonModel):
     """After you've searched for flights by creating an offer request, we'll send your
     search to a range of airlines, which may return offers.
 
@@ -476,52 +270,13 @@ class Offer:
     total_amount: str
     total_currency: str
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            live_mode=json["live_mode"],
-            allowed_passenger_identity_document_types=json[
-                "allowed_passenger_identity_document_types"
-            ],
-            available_services=get_and_transform(
-                json,
-                "available_services",
-                lambda value: [Service.from_json(passenger) for passenger in value],
-                [],
-            ),
-            base_amount=json["base_amount"],
-            base_currency=json["base_currency"],
-            conditions=OfferConditions.from_json(json["conditions"]),
-            created_at=parse_datetime(json["created_at"]),
-            updated_at=parse_datetime(json["updated_at"]),
-            expires_at=parse_datetime(json["expires_at"]),
-            owner=Airline.from_json(json["owner"]),
-            partial=json["partial"],
-            passenger_identity_documents_required=json[
-                "passenger_identity_documents_required"
-            ],
-            passengers=get_and_transform(
-                json,
-                "passengers",
-                lambda value: [
-                    OfferPassenger.from_json(passenger) for passenger in value
-                ],
-                [],
-            ),
-            payment_requirements=PaymentRequirements.from_json(
-                json["payment_requirements"]
-            ),
-            slices=get_and_transform(
-                json,
-                "slices",
-                lambda value: [OfferSlice.from_json(slice) for slice in value],
-                [],
-            ),
-            tax_amount=json.get("tax_amount"),
-            tax_currency=json.get("tax_currency"),
-            total_amount=json["total_amount"],
-            total_currency=json["total_currency"],
-            total_emissions_kg=json["total_emissions_kg"],
-        )
+
+# How each field of an offer is built from the JSON, for `LazyOffer`
+OFFER_DECODERS = compile_field_decoders(Offer)
+
+
+class LazyOffer(LazyModel):
+    """An `Offer` whose fields are only built when read, see `LazyModel`"""
+
+    model = Offer
+    decoders = OFFER_DECODERS
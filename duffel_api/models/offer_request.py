@@ -1,52 +1,35 @@
-from dataclasses import dataclass
+from dataclasses import field
 from datetime import date, datetime
 from typing import Optional, Sequence, Union
 
-from duffel_api.models import Airport, City, LoyaltyProgrammeAccount, Offer
-from duffel_api.utils import get_and_transform, parse_datetime
+from duffel_api.models import Airport, City, LazyOffer, LoyaltyProgrammeAccount, Offer
+from duffel_api.models.decoding import JsonModel, from_json_with, json_metadata
+from duffel_api.models.slotted import slotted_dataclass
 
 
-@dataclass
-class OfferRequestSlice:
+# How the origin or destination of a slice is read, depending on its type
+PLACE_DECODERS = {"airport": Airport.from_json, "city": City.from_json}
+
+
+@slotted_dataclass
+class OfferRequestSlice(JsonModel):
     """One-way journeys can be expressed using one slice, whereas return trips will need
     two.
     """
 
     destination_type: str
-    destination: Union[Airport, City]
+    destination: Union[Airport, City] = field(
+        metadata=json_metadata(tag="destination_type", decode=PLACE_DECODERS)
+    )
     origin_type: str
-    origin: Union[Airport, City]
+    origin: Union[Airport, City] = field(
+        metadata=json_metadata(tag="origin_type", decode=PLACE_DECODERS)
+    )
     departure_date: date
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-
-        destination_type = json["destination_type"]
-        destination = json["destination"]
-        if destination_type == "airport":
-            destination = Airport.from_json(destination)
-        elif destination_type == "city":
-            destination = City.from_json(destination)
-
-        origin_type = json["origin_type"]
-        origin = json["origin"]
-        if origin_type == "airport":
-            origin = Airport.from_json(origin)
-        elif origin_type == "city":
-            origin = City.from_json(origin)
 
-        return cls(
-            destination_type=destination_type,
-            destination=destination,
-            origin_type=origin_type,
-            origin=origin,
-            departure_date=date.fromisoformat(json["departure_date"]),
-        )
-
-
-@dataclass
-class OfferRequestPassenger:
+@slotted_dataclass
+class OfferRequestPassenger(JsonModel):
     """The passengers who want to travel"""
 
     id: str
@@ -56,29 +39,9 @@ class OfferRequestPassenger:
     family_name: Optional[str]
     loyalty_programme_accounts: Sequence[LoyaltyProgrammeAccount]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            age=json["age"],
-            type=json["type"],
-            given_name=json.get("given_name"),
-            family_name=json.get("family_name"),
-            loyalty_programme_accounts=get_and_transform(
-                json,
-                "loyalty_programme_accounts",
-                lambda value: [
-                    LoyaltyProgrammeAccount.from_json(loyalty_programme_account)
-                    for loyalty_programme_account in value
-                ],
-                [],
-            ),
-        )
-
 
-@dataclass
-class OfferRequest:
+@slotted_dataclass
+class OfferRequest(JsonModel):
     """To search for flights, you'll need to create an offer request. An offer request
     describes the passengers and where and when they want to travel (in the form of a
     list of slices). It may also include additional filters (e.g. a particular cabin to
@@ -95,32 +58,11 @@ class OfferRequest:
     passengers: Sequence[OfferRequestPassenger]
 
     @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            client_key=json["client_key"],
-            live_mode=json["live_mode"],
-            cabin_class=json["cabin_class"],
-            offers=get_and_transform(
-                json,
-                "offers",
-                lambda value: [Offer.from_json(offer) for offer in value],
-                [],
-            ),
-            slices=get_and_transform(
-                json,
-                "slices",
-                lambda value: [OfferRequestSlice.from_json(slice) for slice in value],
-                [],
-            ),
-            passengers=get_and_transform(
-                json,
-                "passengers",
-                lambda value: [
-                    OfferRequestPassenger.from_json(passenger) for passenger in value
-                ],
-                [],
-            ),
-            created_at=parse_datetime(json["created_at"]),
-        )
+    def from_json(cls, json: dict, lazy_offers: bool = False):
+        """Construct a class instance from a JSON response.
+
+        With `lazy_offers`, the offers are `LazyOffer`s.
+        """
+        if lazy_offers:
+            return from_json_with(cls, offers=LazyOffer.from_json)(cls, json)
+        return from_json_with(cls)(cls, json)
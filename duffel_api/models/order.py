@@ -1,13 +1,14 @@
-from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Sequence, Union
 
 from duffel_api.models import Aircraft, Airline, Airport, LoyaltyProgrammeAccount, Place
-from duffel_api.utils import get_and_transform, parse_datetime
+from duffel_api.models.lazy import LazyModel
+from duffel_api.models.decoding import JsonModel, compile_field_decoders
+from duffel_api.models.slotted import slotted_dataclass
 
 
-@dataclass
-class OrderConditionChangeBeforeDeparture:
+@slotted_dataclass
+class OrderConditionChangeBeforeDeparture(JsonModel):
     """Whether the whole order can be changed before the departure of the first slice.
 
     If all of the slices on the order can be changed then
@@ -27,18 +28,9 @@ class OrderConditionChangeBeforeDeparture:
     penalty_amount: Optional[str]
     penalty_currency: Optional[str]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            allowed=json["allowed"],
-            penalty_amount=json.get("penalty_amount"),
-            penalty_currency=json.get("penalty_currency"),
-        )
-
 
-@dataclass
-class OrderConditionRefundBeforeDeparture:
+@slotted_dataclass
+class OrderConditionRefundBeforeDeparture(JsonModel):
     """Whether the whole order can be refunded before the departure of the first slice.
 
     If all of the slices on the order can be refunded then
@@ -56,18 +48,9 @@ class OrderConditionRefundBeforeDeparture:
     penalty_amount: Optional[str]
     penalty_currency: Optional[str]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            allowed=json["allowed"],
-            penalty_amount=json.get("penalty_amount"),
-            penalty_currency=json.get("penalty_currency"),
-        )
-
 
-@dataclass
-class OrderConditions:
+@slotted_dataclass
+class OrderConditions(JsonModel):
     """The conditions associated with this order, describing the kinds of
     modifications you can make to it and any penalties that
     will apply to those modifications.
@@ -84,43 +67,18 @@ class OrderConditions:
     change_before_departure: Optional[OrderConditionChangeBeforeDeparture]
     refund_before_departure: Optional[OrderConditionRefundBeforeDeparture]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            change_before_departure=get_and_transform(
-                json,
-                "change_before_departure",
-                OrderConditionChangeBeforeDeparture.from_json,
-            ),
-            refund_before_departure=get_and_transform(
-                json,
-                "refund_before_departure",
-                OrderConditionRefundBeforeDeparture.from_json,
-            ),
-        )
-
 
-@dataclass
-class OrderSliceSegmentPassengerSeat:
+@slotted_dataclass
+class OrderSliceSegmentPassengerSeat(JsonModel):
     """An object containing metadata about the service, like the designator of the seat"""
 
     designator: str
     name: str
     disclosures: Sequence[str]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            designator=json["designator"],
-            name=json["name"],
-            disclosures=json["disclosures"],
-        )
-
 
-@dataclass
-class OrderSliceSegmentPassengerBaggage:
+@slotted_dataclass
+class OrderSliceSegmentPassengerBaggage(JsonModel):
     """The baggage allowances for the passenger on this segment that were included in the
     original offer. Any extra baggage items which were booked as services will be listed
     in the services field instead of here.
@@ -129,17 +87,9 @@ class OrderSliceSegmentPassengerBaggage:
     type: str
     quantity: int
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            type=json["type"],
-            quantity=json["quantity"],
-        )
-
 
-@dataclass
-class OrderSliceSegmentPassenger:
+@slotted_dataclass
+class OrderSliceSegmentPassenger(JsonModel):
     """Additional segment-specific information about the passengers included in the offer
     (e.g. their baggage allowance and the cabin class they will be travelling in)
     """
@@ -150,30 +100,9 @@ class OrderSliceSegmentPassenger:
     passenger_id: str
     seat: Optional[OrderSliceSegmentPassengerSeat]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            baggages=get_and_transform(
-                json,
-                "baggages",
-                lambda value: [
-                    OrderSliceSegmentPassengerBaggage.from_json(baggage)
-                    for baggage in value
-                ],
-                [],
-            ),
-            cabin_class=json["cabin_class"],
-            cabin_class_marketing_name=json["cabin_class_marketing_name"],
-            passenger_id=json["passenger_id"],
-            seat=get_and_transform(
-                json, "seat", OrderSliceSegmentPassengerSeat.from_json
-            ),
-        )
-
 
-@dataclass
-class OrderSliceSegment:
+@slotted_dataclass
+class OrderSliceSegment(JsonModel):
     """The segments - that is, specific flights - that the airline is offering to get the
     passengers from the `origin` to the `destination`
     """
@@ -194,38 +123,9 @@ class OrderSliceSegment:
     operating_carrier_flight_number: Optional[str]
     passengers: Sequence[OrderSliceSegmentPassenger]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            aircraft=get_and_transform(json, "aircraft", Aircraft.from_json),
-            arriving_at=parse_datetime(json["arriving_at"]),
-            departing_at=parse_datetime(json["departing_at"]),
-            destination=Airport.from_json(json["destination"]),
-            destination_terminal=json.get("destination_terminal"),
-            origin=Airport.from_json(json["origin"]),
-            origin_terminal=json.get("origin_terminal"),
-            distance=json.get("distance"),
-            duration=json.get("duration"),
-            marketing_carrier=Airline.from_json(json["marketing_carrier"]),
-            marketing_carrier_flight_number=json["marketing_carrier_flight_number"],
-            operating_carrier=Airline.from_json(json["operating_carrier"]),
-            operating_carrier_flight_number=json.get("operating_carrier_flight_number"),
-            passengers=get_and_transform(
-                json,
-                "passengers",
-                lambda value: [
-                    OrderSliceSegmentPassenger.from_json(passenger)
-                    for passenger in value
-                ],
-                [],
-            ),
-        )
-
 
-@dataclass
-class OrderSliceConditionChangeBeforeDeparture:
+@slotted_dataclass
+class OrderSliceConditionChangeBeforeDeparture(JsonModel):
     """Whether this slice can be changed before the departure.
 
     If the slice can be changed for all of the passengers then
@@ -246,18 +146,9 @@ class OrderSliceConditionChangeBeforeDeparture:
     penalty_amount: Optional[str]
     penalty_currency: Optional[str]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            allowed=json["allowed"],
-            penalty_amount=json.get("penalty_amount"),
-            penalty_currency=json.get("penalty_currency"),
-        )
-
 
-@dataclass
-class OrderSliceConditions:
+@slotted_dataclass
+class OrderSliceConditions(JsonModel):
     """The conditions associated with this slice, describing the kinds of
     modifications you can make and any penalties that
     will apply to those modifications.
@@ -275,20 +166,9 @@ class OrderSliceConditions:
 
     change_before_departure: Optional[OrderSliceConditionChangeBeforeDeparture]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            change_before_departure=get_and_transform(
-                json,
-                "change_before_departure",
-                OrderSliceConditionChangeBeforeDeparture.from_json,
-            )
-        )
-
 
-@dataclass
-class OrderSlice:
+@slotted_dataclass
+class OrderSlice(JsonModel):
     """A slice is one part of the slices that make up the itinerary of an order.
     One-way journeys can be expressed using one slice, whereas return trips will need two.
     """
@@ -303,49 +183,18 @@ class OrderSlice:
     segments: Sequence[OrderSliceSegment]
     conditions: OrderSliceConditions
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            changeable=json["changeable"],
-            destination_type=json["destination_type"],
-            destination=Place.from_json(json["destination"]),
-            origin_type=json["origin_type"],
-            origin=Place.from_json(json["origin"]),
-            duration=json.get("duration"),
-            segments=get_and_transform(
-                json,
-                "segments",
-                lambda value: [
-                    OrderSliceSegment.from_json(segment) for segment in value
-                ],
-                [],
-            ),
-            conditions=OrderSliceConditions.from_json(json["conditions"]),
-        )
-
 
-@dataclass
-class OrderServiceMetadataSeat:
+@slotted_dataclass
+class OrderServiceMetadataSeat(JsonModel):
     """An object containing metadata about the service, like the designator of the seat"""
 
     designator: str
     name: str
     disclosures: Sequence[str]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            designator=json["designator"],
-            name=json["name"],
-            disclosures=json["disclosures"],
-        )
-
 
-@dataclass
-class OrderServiceMetadataBaggage:
+@slotted_dataclass
+class OrderServiceMetadataBaggage(JsonModel):
     """An object containing metadata about the service, like the maximum weight and
     dimensions of the baggage.
     """
@@ -356,19 +205,8 @@ class OrderServiceMetadataBaggage:
     maximum_length_cm: Optional[int]
     maximum_depth_cm: Optional[int]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            type=json["type"],
-            maximum_weight_kg=json.get("maximum_weight_kg"),
-            maximum_height_cm=json.get("maximum_height_cm"),
-            maximum_length_cm=json.get("maximum_length_cm"),
-            maximum_depth_cm=json.get("maximum_depth_cm"),
-        )
 
-
-@dataclass
+@slotted_dataclass
 class OrderService:
     """The service booked along with this order"""
 
@@ -404,34 +242,17 @@ class OrderService:
         )
 
 
-@dataclass
-class OrderPaymentStatus:
+@slotted_dataclass
+class OrderPaymentStatus(JsonModel):
     """The payment status for an order"""
 
     awaiting_payment: bool
     payment_required_by: Optional[datetime]
     price_guarantee_expires_at: Optional[datetime]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            awaiting_payment=json["awaiting_payment"],
-            payment_required_by=get_and_transform(
-                json,
-                "payment_required_by",
-                parse_datetime,
-            ),
-            price_guarantee_expires_at=get_and_transform(
-                json,
-                "price_guarantee_expires_at",
-                parse_datetime,
-            ),
-        )
 
-
-@dataclass
-class OrderPassenger:
+@slotted_dataclass
+class OrderPassenger(JsonModel):
     """A passenger who is travelling"""
 
     id: str
@@ -444,48 +265,17 @@ class OrderPassenger:
     born_on: str
     loyalty_programme_accounts: Sequence[LoyaltyProgrammeAccount]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            type=json["type"],
-            infant_passenger_id=json.get("infant_passenger_id"),
-            given_name=json["given_name"],
-            family_name=json["family_name"],
-            gender=json["gender"],
-            title=json["title"],
-            born_on=json["born_on"],
-            loyalty_programme_accounts=get_and_transform(
-                json,
-                "loyalty_programme_accounts",
-                lambda value: [
-                    LoyaltyProgrammeAccount.from_json(loyalty_programme_account)
-                    for loyalty_programme_account in value
-                ],
-                [],
-            ),
-        )
 
-
-@dataclass
-class OrderDocument:
+@slotted_dataclass
+class OrderDocument(JsonModel):
     """A document issued for this order."""
 
     type: str
     unique_identifier: str
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            type=json["type"],
-            unique_identifier=json["unique_identifier"],
-        )
-
 
-@dataclass
-class Order:
+@slotted_dataclass
+class Order(JsonModel):
     """Once you've searched for flights by creating an offer request, and you've chosen
     which offer you want to book, you'll then want to create an order.
 
@@ -516,61 +306,13 @@ class Order:
     total_currency: str
     metadata: dict
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            available_actions=json["available_actions"],
-            live_mode=json["live_mode"],
-            base_amount=json.get("base_amount"),
-            base_currency=json.get("base_currency"),
-            booking_reference=json["booking_reference"],
-            cancelled_at=get_and_transform(
-                json,
-                "cancelled_at",
-                parse_datetime,
-            ),
-            content=json["content"],
-            created_at=parse_datetime(json["created_at"]),
-            synced_at=get_and_transform(
-                json,
-                "synced_at",
-                parse_datetime,
-            ),
-            documents=get_and_transform(
-                json,
-                "documents",
-                lambda value: [OrderDocument.from_json(document) for document in value],
-                [],
-            ),
-            owner=Airline.from_json(json["owner"]),
-            passengers=get_and_transform(
-                json,
-                "passengers",
-                lambda value: [
-                    OrderPassenger.from_json(passenger) for passenger in value
-                ],
-                [],
-            ),
-            payment_status=OrderPaymentStatus.from_json(json["payment_status"]),
-            services=get_and_transform(
-                json,
-                "services",
-                lambda value: [OrderService.from_json(service) for service in value],
-                [],
-            ),
-            slices=get_and_transform(
-                json,
-                "slices",
-                lambda value: [OrderSlice.from_json(slice) for slice in value],
-                [],
-            ),
-            conditions=OrderConditions.from_json(json["conditions"]),
-            tax_amount=json["tax_amount"],
-            tax_currency=json.get("tax_currency"),
-            total_amount=json["total_amount"],
-            total_currency=json["total_currency"],
-            # Metadata is customer-specified data, so we don't try and parse it
-            metadata=json["metadata"],
-        )
+
+# How each field of an order is built from the JSON, for `LazyOrder`
+ORDER_DECODERS = compile_field_decoders(Order)
+
+
+class LazyOrder(LazyModel):
+    """An `Order` whose fields are only built when read, see `LazyModel`"""
+
+    model = Order
+    decoders = ORDER_DECODERS
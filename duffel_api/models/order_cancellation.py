@@ -1,12 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import field
 from datetime import datetime
 from typing import Optional
 
-from duffel_api.utils import get_and_transform, parse_datetime
+from duffel_api.models.decoding import JsonModel, STRICT_DATETIME_MS, json_metadata
+from duffel_api.models.slotted import slotted_dataclass
 
 
-@dataclass
-class OrderCancellation:
+@slotted_dataclass
+class OrderCancellation(JsonModel):
     """To cancel an order, you'll need to create an order cancellation,
     check the refund_amount returned, and, if you're happy to go ahead and
     cancel the order.
@@ -24,7 +25,7 @@ class OrderCancellation:
     refund_currency: str
     refund_to: str
     confirmed_at: Optional[datetime]
-    created_at: datetime
+    created_at: datetime = field(metadata=json_metadata(decode=STRICT_DATETIME_MS))
 
     allowed_refund_types = [
         "arc_bsp_cash",
@@ -42,18 +43,3 @@ class OrderCancellation:
             raise OrderCancellation.InvalidRefundType(self.refund_to)
 
         return self
-
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            order_id=json["order_id"],
-            live_mode=json["live_mode"],
-            expires_at=parse_datetime(json["expires_at"]),
-            refund_amount=json["refund_amount"],
-            refund_currency=json["refund_currency"],
-            refund_to=json["refund_to"],
-            confirmed_at=get_and_transform(json, "confirmed_at", parse_datetime),
-            created_at=datetime.strptime(json["created_at"], "%Y-%m-%dT%H:%M:%S.%fZ"),
-        )
@@ -1,12 +1,12 @@
-from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from duffel_api.utils import parse_datetime
+from duffel_api.models.decoding import JsonModel
+from duffel_api.models.slotted import slotted_dataclass
 
 
-@dataclass
-class Payment:
+@slotted_dataclass
+class Payment(JsonModel):
     """To pay for an unpaid order you've previously created, you'll need to create a
     payment for it.
 
@@ -32,15 +32,3 @@ class Payment:
             raise Payment.InvalidType(self.type)
 
         return self
-
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            type=json["type"],
-            live_mode=json["live_mode"],
-            amount=json["amount"],
-            currency=json.get("currency"),
-            created_at=parse_datetime(json["created_at"]),
-        )
@@ -1,13 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import field
 from datetime import datetime
 from typing import Optional, Sequence
 
 from duffel_api.models import Refund
-from duffel_api.utils import get_and_transform, parse_datetime
+from duffel_api.models.decoding import JsonModel, STRICT_DATETIME_MS, json_metadata
+from duffel_api.models.slotted import slotted_dataclass
 
 
-@dataclass
-class PaymentIntent:
+@slotted_dataclass
+class PaymentIntent(JsonModel):
     """To begin the process of collecting a card payment from your customer, you
     need to create a Payment Intent.
 
@@ -32,33 +33,5 @@ class PaymentIntent:
     status: str
     refunds: Sequence[Refund]
     confirmed_at: Optional[datetime]
-    created_at: datetime
-    updated_at: datetime
-
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            live_mode=json["live_mode"],
-            amount=json["amount"],
-            currency=json["currency"],
-            net_amount=json.get("net_amount"),
-            net_currency=json.get("net_currency"),
-            fees_amount=json.get("fees_amount"),
-            fees_currency=json.get("fees_currency"),
-            client_token=json["client_token"],
-            card_network=json.get("card_network"),
-            card_last_four_digits=json.get("card_last_four_digits"),
-            card_country_code=json.get("card_country_code"),
-            status=json["status"],
-            refunds=get_and_transform(
-                json,
-                "refunds",
-                lambda value: [Refund.from_json(refund) for refund in value],
-                [],
-            ),
-            confirmed_at=get_and_transform(json, "confirmed_at", parse_datetime),
-            created_at=datetime.strptime(json["created_at"], "%Y-%m-%dT%H:%M:%S.%fZ"),
-            updated_at=datetime.strptime(json["updated_at"], "%Y-%m-%dT%H:%M:%S.%fZ"),
-        )
+    created_at: datetime = field(metadata=json_metadata(decode=STRICT_DATETIME_MS))
+    updated_at: datetime = field(metadata=json_metadata(decode=STRICT_DATETIME_MS))
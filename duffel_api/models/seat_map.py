@@ -1,11 +1,12 @@
-from dataclasses import dataclass
 from typing import Optional, Sequence
 
-from duffel_api.utils import get_and_transform
+from duffel_api.models.decoding import JsonModel, compile_field_decoders
+from duffel_api.models.lazy import LazyModel
+from duffel_api.models.slotted import slotted_dataclass
 
 
-@dataclass
-class SeatMapCabinRowSectionElementSeatService:
+@slotted_dataclass
+class SeatMapCabinRowSectionElementSeatService(JsonModel):
     """A seat for a passenger. If the available_services list is empty (which will be
     represented as an empty list : []), the seat is unavailable.
 
@@ -18,19 +19,9 @@ class SeatMapCabinRowSectionElementSeatService:
     total_amount: str
     total_currency: str
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            passenger_id=json["passenger_id"],
-            total_amount=json["total_amount"],
-            total_currency=json["total_currency"],
-        )
 
-
-@dataclass
-class SeatMapCabinWings:
+@slotted_dataclass
+class SeatMapCabinWings(JsonModel):
     """Where the wings of the aircraft are in relation to rows in the cabin.
 
     The numbers correspond to the indices of the first and the last row which are
@@ -45,17 +36,9 @@ class SeatMapCabinWings:
     first_row_index: int
     last_row_index: int
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            first_row_index=json["first_row_index"],
-            last_row_index=json["last_row_index"],
-        )
-
 
-@dataclass
-class SeatMapCabinRowSectionElement:
+@slotted_dataclass
+class SeatMapCabinRowSectionElement(JsonModel):
     """The element that makes up a section"""
 
     type: str
@@ -85,72 +68,25 @@ class SeatMapCabinRowSectionElement:
 
         return self
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            type=json["type"],
-            designator=json.get("designator"),
-            name=json.get("name"),
-            disclosures=json.get("disclosures"),
-            available_services=get_and_transform(
-                json,
-                "available_services",
-                lambda value: [
-                    SeatMapCabinRowSectionElementSeatService.from_json(service)
-                    for service in value
-                ],
-            ),
-        )
-
-
-@dataclass
-class SeatMapCabinRowSection:
+
+@slotted_dataclass
+class SeatMapCabinRowSection(JsonModel):
     """Each row is divided into sections by one or more aisles."""
 
     elements: Sequence[SeatMapCabinRowSectionElement]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            elements=get_and_transform(
-                json,
-                "elements",
-                lambda value: [
-                    SeatMapCabinRowSectionElement.from_json(element)
-                    for element in value
-                ],
-                [],
-            ),
-        )
-
-
-@dataclass
-class SeatMapCabinRow:
+
+@slotted_dataclass
+class SeatMapCabinRow(JsonModel):
     """Row sections are broken up by aisles. Rows are ordered from front to back of the
     aircraft.
     """
 
     sections: Sequence[SeatMapCabinRowSection]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            sections=get_and_transform(
-                json,
-                "sections",
-                lambda value: [
-                    SeatMapCabinRowSection.from_json(section) for section in value
-                ],
-                [],
-            ),
-        )
-
-
-@dataclass
-class SeatMapCabin:
+
+@slotted_dataclass
+class SeatMapCabin(JsonModel):
     """Cabins are ordered by deck from lowest to highest, and then within each deck from
     the front to back of the aircraft.
     """
@@ -161,25 +97,9 @@ class SeatMapCabin:
     aisles: int
     rows: Sequence[SeatMapCabinRow]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            cabin_class=json["cabin_class"],
-            deck=json["deck"],
-            wings=get_and_transform(json, "wings", SeatMapCabinWings.from_json),
-            aisles=json["aisles"],
-            rows=get_and_transform(
-                json,
-                "rows",
-                lambda value: [SeatMapCabinRow.from_json(row) for row in value],
-                [],
-            ),
-        )
-
-
-@dataclass
-class SeatMap:
+
+@slotted_dataclass
+class SeatMap(JsonModel):
     """Seat maps are used to build a rich experience for your customers so they can select
     a seat as part of an order.
 
@@ -210,17 +130,13 @@ class SeatMap:
     segment_id: str
     cabins: Sequence[SeatMapCabin]
 
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(
-            id=json["id"],
-            slice_id=json["slice_id"],
-            segment_id=json["segment_id"],
-            cabins=get_and_transform(
-                json,
-                "cabins",
-                lambda value: [SeatMapCabin.from_json(cabin) for cabin in value],
-                [],
-            ),
-        )
+
+# How each field of a seat map is built from the JSON, for `LazySeatMap`
+SEAT_MAP_DECODERS = compile_field_decoders(SeatMap)
+
+
+class LazySeatMap(LazyModel):
+    """A `SeatMap` whose fields are only built when read, see `LazyModel`"""
+
+    model = SeatMap
+    decoders = SEAT_MAP_DECODERS
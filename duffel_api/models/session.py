@@ -1,8 +1,9 @@
-from dataclasses import dataclass
+from duffel_api.models.decoding import JsonModel
+from duffel_api.models.slotted import slotted_dataclass
 
 
-@dataclass
-class Session:
+@slotted_dataclass
+class Session(JsonModel):
     """A Session represents the traveller's session as they go through the search and book
     flow to create an order.
 
@@ -22,8 +23,3 @@ class Session:
     #
     # Example: "https://links.duffel.com?token=U0ZNeU5UWS5nMmdEYlFBQUFCWXdNREF3TESTWU5rNWxPWGR1VDNoUFYydEdiMVZEYmdZQXB5M0RPb1lCWWdBQlVZQS5aTESTRHYwdmVyQl9vbkJ5TESTNHVsSGdIZjFiaGctY0tmdVdITESTNVlv" # noqa: E501
     url: str
-
-    @classmethod
-    def from_json(cls, json: dict):
-        """Construct a class instance from a JSON response."""
-        return cls(url=json["url"])
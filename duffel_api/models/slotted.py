@@ -0,0 +1,52 @@
+"""Dataclasses without a per-instance `__dict__`"""
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    # Type checkers can't follow the class being recreated below, but it is the same
+    # class `dataclass` would have made
+    from dataclasses import dataclass as slotted_dataclass
+else:
+
+    def slotted_dataclass(cls=None, *, frozen=False):
+        """Same as `@dataclass`, but the class gets `__slots__` for its fields.
+
+        Models are created by the hundred thousand when parsing seat maps and large
+        offer lists, and without a `__dict__` each instance is much smaller. This works
+        on every Python version we support, unlike `dataclass(slots=True)`.
+        """
+
+        def wrap(cls):
+            """Build the dataclass, then recreate it with slots"""
+            cls = dataclass(cls, frozen=frozen)
+            names = tuple(field.name for field in fields(cls))
+            namespace = dict(cls.__dict__)
+            namespace["__slots__"] = names
+            # Defaults live on as arguments of `__init__`, but would clash with the slots
+            for name in names:
+                namespace.pop(name, None)
+            namespace.pop("__dict__", None)
+            namespace.pop("__weakref__", None)
+            if frozen:
+                # The default pickling sets the slots with `setattr`, which is forbidden
+                namespace["__getstate__"] = _getstate
+                namespace["__setstate__"] = _setstate
+            slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+            slotted.__qualname__ = cls.__qualname__
+            return slotted
+
+        if cls is None:
+            return wrap
+        return wrap(cls)
+
+
+def _getstate(self):
+    """Values of the fields, for pickling"""
+    return [getattr(self, field.name) for field in fields(self)]
+
+
+def _setstate(self, state):
+    """Restore the values of the fields of a frozen instance when unpickling"""
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)
@@ -0,0 +1,131 @@
+"""What the helpers ranking and filtering offers read from them, the same whether an
+offer is given as JSON, as a `LazyOffer` or as an `Offer`
+"""
+from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
+
+from .models.lazy import LazyModel
+from .utils import parse_datetime, parse_duration
+
+
+def duration_minutes(value):
+    """Minutes in an ISO 8601 duration, -1 when unknown"""
+    if not value:
+        return -1
+    return int(parse_duration(value).total_seconds() // 60)
+
+
+class SegmentFacts(NamedTuple):
+    """The flight of a segment: its marketing carrier (IATA code), flight number,
+    local departure time and the IATA code of the airport it lands at
+    """
+
+    marketing_carrier: Optional[str]
+    flight_number: Optional[str]
+    departing_at: datetime
+    destination: Optional[str]
+
+
+class SliceFacts(NamedTuple):
+    """The segments of a slice, its duration in minutes (`None` when unknown) and its
+    stops, connections included
+    """
+
+    segments: Tuple[SegmentFacts, ...]
+    duration: Optional[int]
+    stops: int
+
+
+class OfferFacts(NamedTuple):
+    """An offer's ID, price and slices"""
+
+    id: str
+    total_amount: str
+    total_currency: str
+    slices: Tuple[SliceFacts, ...]
+
+    @property
+    def stops(self):
+        """Highest number of stops on any slice"""
+        return max((slice.stops for slice in self.slices), default=0)
+
+    @property
+    def duration(self):
+        """Minutes all slices take together, `None` if any is unknown"""
+        durations = [slice.duration for slice in self.slices]
+        return None if None in durations else sum(durations)
+
+    @property
+    def departing_at(self):
+        """Local departure time of the first segment, if any"""
+        for slice in self.slices:
+            for segment in slice.segments:
+                return segment.departing_at
+        return None
+
+
+def _slice_facts(segments, duration, technical_stops):
+    """`SliceFacts` of a slice"""
+    minutes = duration_minutes(duration)
+    return SliceFacts(
+        tuple(segments),
+        None if minutes < 0 else minutes,
+        max(len(segments) - 1, 0) + technical_stops,
+    )
+
+
+def _json_facts(offer):
+    """`OfferFacts` of the JSON of an offer"""
+    slices = []
+    for slice in offer["slices"]:
+        segments = slice.get("segments") or []
+        slices.append(
+            _slice_facts(
+                [
+                    SegmentFacts(
+                        (segment.get("marketing_carrier") or {}).get("iata_code"),
+                        segment.get("marketing_carrier_flight_number"),
+                        parse_datetime(segment["departing_at"]),
+                        (segment.get("destination") or {}).get("iata_code"),
+                    )
+                    for segment in segments
+                ],
+                slice.get("duration"),
+                sum(len(segment.get("stops") or []) for segment in segments),
+            )
+        )
+    return OfferFacts(
+        offer["id"], offer["total_amount"], offer["total_currency"], tuple(slices)
+    )
+
+
+def _model_facts(offer):
+    """`OfferFacts` of an `Offer`"""
+    slices = []
+    for slice in offer.slices:
+        segments = slice.segments or []
+        slices.append(
+            _slice_facts(
+                [
+                    SegmentFacts(
+                        segment.marketing_carrier.iata_code,
+                        segment.marketing_carrier_flight_number,
+                        segment.departing_at,
+                        segment.destination.iata_code,
+                    )
+                    for segment in segments
+                ],
+                slice.duration,
+                sum(len(segment.stops or []) for segment in segments),
+            )
+        )
+    return OfferFacts(offer.id, offer.total_amount, offer.total_currency, tuple(slices))
+
+
+def offer_facts(offer):
+    """`OfferFacts` of an offer given as JSON, as a `LazyOffer` or as an `Offer`"""
+    if isinstance(offer, LazyModel):
+        return _json_facts(offer._json)
+    if isinstance(offer, dict):
+        return _json_facts(offer)
+    return _model_facts(offer)
@@ -0,0 +1,248 @@
+"""Indexes over the offers of a search, for filtering them over and over again"""
+import datetime
+import re
+from bisect import bisect_left, bisect_right
+
+from .http_client import ClientError
+from .offer_facts import offer_facts
+
+# Offers covered by each stored prefix of a sorted index
+_BLOCK = 64
+
+_HOURS_MINUTES = re.compile(r"(\d\d):(\d\d)")
+
+
+def _bitmap(positions):
+    """Bitmap with the bits at `positions` set"""
+    bitmap = 0
+    for position in positions:
+        bitmap |= 1 << position
+    return bitmap
+
+
+def _union(bitmaps):
+    """Bitmap of the offers in any of `bitmaps`"""
+    result = 0
+    for bitmap in bitmaps:
+        result |= bitmap
+    return result
+
+
+def _positions(bitmap):
+    """Positions of the bits set in `bitmap`, in increasing order"""
+    while bitmap:
+        lowest = bitmap & -bitmap
+        yield lowest.bit_length() - 1
+        bitmap ^= lowest
+
+
+def _minute_of_day(departing_at):
+    """Minutes since midnight of a local time given as a `datetime` or a `time`"""
+    return departing_at.hour * 60 + departing_at.minute
+
+
+def _bound(value):
+    """Minutes since midnight of a bound of `departing_between`, a `time` or an
+    "HH:MM" string
+    """
+    if isinstance(value, str):
+        match = _HOURS_MINUTES.fullmatch(value)
+        try:
+            value = datetime.time(int(match[1]), int(match[2])) if match else None
+        except ValueError:
+            value = None
+    if not isinstance(value, datetime.time):
+        raise ClientError(f"departing_between takes times or HH:MM, not {value!r}")
+    return _minute_of_day(value)
+
+
+def _facts(offer):
+    """ID, marketing carriers, stops, total duration and, for each slice, departure
+    time and arrival airport of an offer given as JSON, as a `LazyOffer` or as an
+    `Offer`
+    """
+    facts = offer_facts(offer)
+    carriers = set()
+    slices = []
+    for slice in facts.slices:
+        segments = slice.segments
+        carriers.update(segment.marketing_carrier for segment in segments)
+        departure = _minute_of_day(segments[0].departing_at) if segments else None
+        arrival = segments[-1].destination if segments else None
+        slices.append((departure, arrival))
+    return facts.id, carriers, facts.stops, facts.duration, slices
+
+
+class _SortedIndex:
+    """Offers sorted by a value, telling which ones have a value in a range as a
+    bitmap.
+
+    The bitmaps of every prefix of `_BLOCK` offers are kept, so a range takes two of
+    them and at most two partial blocks, whatever its length.
+    """
+
+    def __init__(self, pairs):
+        pairs = sorted(pairs)
+        self._values = [value for value, _ in pairs]
+        self._positions = [position for _, position in pairs]
+        self._prefixes = [0]
+        for start in range(0, len(pairs), _BLOCK):
+            stop = start + _BLOCK
+            self._prefixes.append(
+                self._prefixes[-1] | _bitmap(self._positions[start:stop])
+            )
+
+    def between(self, low=None, high=None):
+        """Bitmap of the offers with a value from `low` to `high`, both included"""
+        start = 0 if low is None else bisect_left(self._values, low)
+        stop = len(self._values) if high is None else bisect_right(self._values, high)
+        if start >= stop:
+            return 0
+        first = -(-start // _BLOCK)
+        last = stop // _BLOCK
+        if first >= last:
+            return _bitmap(self._positions[start:stop])
+        head, tail = first * _BLOCK, last * _BLOCK
+        return (
+            (self._prefixes[last] ^ self._prefixes[first])
+            | _bitmap(self._positions[start:head])
+            | _bitmap(self._positions[tail:stop])
+        )
+
+
+class OfferIndex:
+    """Indexes over a list of offers, answering the filters of a search page without
+    going through every offer, slice and segment each time.
+
+    Built once from the JSON of offers, `LazyOffer`s or `Offer`s (e.g. the `offers`
+    of an offer request, or a page of `offers.list()`). Each filter is kept as a
+    bitmap (an `int` with one bit per offer) or as offers sorted by value, and
+    combining filters is a bitwise AND, so a query over thousands of offers takes
+    microseconds.
+
+    The filters are:
+
+    - `airlines`: every segment is marketed by one of these airlines (IATA codes)
+    - `max_stops`: no slice has more stops, connections included
+    - `departing_between`: the first segment of the slice leaves within this window
+      of local times (`time`s or "HH:MM" strings), `(time(22), time(6))` spanning
+      midnight
+    - `arriving_at`: the last segment of the slice lands at one of these airports
+      (IATA codes)
+    - `max_duration`: all slices take at most this long together (a `timedelta` or
+      minutes). Offers of unknown duration never match
+    - `on_slice`: the slice `departing_between` and `arriving_at` look at, the
+      outbound one by default
+    """
+
+    def __init__(self, offers):
+        self.offers = list(offers)
+        facts = [_facts(offer) for offer in self.offers]
+        self._ids = [id for id, _, _, _, _ in facts]
+        self._all = (1 << len(facts)) - 1
+
+        self._carriers = {}
+        for position, (_, carriers, _, _, _) in enumerate(facts):
+            for carrier in carriers:
+                self._carriers[carrier] = self._carriers.get(carrier, 0) | 1 << position
+
+        self._stops = _SortedIndex(
+            (stops, position) for position, (_, _, stops, _, _) in enumerate(facts)
+        )
+        self._durations = _SortedIndex(
+            (duration, position)
+            for position, (_, _, _, duration, _) in enumerate(facts)
+            if duration is not None
+        )
+
+        width = max((len(slices) for _, _, _, _, slices in facts), default=0)
+        self._departures = []
+        self._destinations = []
+        for index in range(width):
+            slices = [
+                (position, offer_slices[index])
+                for position, (_, _, _, _, offer_slices) in enumerate(facts)
+                if index < len(offer_slices)
+            ]
+            self._departures.append(
+                _SortedIndex(
+                    (departure, position)
+                    for position, (departure, _) in slices
+                    if departure is not None
+                )
+            )
+            destinations = {}
+            for position, (_, destination) in slices:
+                destinations[destination] = destinations.get(destination, 0) | (
+                    1 << position
+                )
+            self._destinations.append(destinations)
+
+    @classmethod
+    def from_offer_request(cls, offer_request):
+        """Index the offers of an `OfferRequest` or of its JSON"""
+        if isinstance(offer_request, dict):
+            return cls(offer_request.get("offers") or [])
+        return cls(offer_request.offers)
+
+    def __len__(self):
+        """Number of offers"""
+        return len(self.offers)
+
+    def query(
+        self,
+        airlines=None,
+        max_stops=None,
+        departing_between=None,
+        arriving_at=None,
+        max_duration=None,
+        on_slice=0,
+    ):
+        """Bitmap of the offers matching every filter given: the bit `i` is set when
+        the offer at position `i` matches
+        """
+        bitmap = self._all
+        if airlines is not None:
+            airlines = {airlines} if isinstance(airlines, str) else set(airlines)
+            for carrier, carriers in self._carriers.items():
+                if carrier not in airlines:
+                    bitmap &= ~carriers
+        if max_stops is not None:
+            bitmap &= self._stops.between(high=max_stops)
+        if max_duration is not None:
+            if isinstance(max_duration, datetime.timedelta):
+                max_duration = max_duration.total_seconds() / 60
+            bitmap &= self._durations.between(high=max_duration)
+        if departing_between is not None:
+            bitmap &= self._departing_between(on_slice, *departing_between)
+        if arriving_at is not None:
+            destinations = (
+                self._destinations[on_slice]
+                if on_slice < len(self._destinations)
+                else {}
+            )
+            codes = [arriving_at] if isinstance(arriving_at, str) else arriving_at
+            bitmap &= _union(destinations.get(code, 0) for code in codes)
+        return bitmap
+
+    def _departing_between(self, on_slice, start, end):
+        """Bitmap of the offers whose slice leaves between the times `start` and `end`"""
+        start, end = _bound(start), _bound(end)
+        if on_slice >= len(self._departures):
+            return 0
+        departures = self._departures[on_slice]
+        if start <= end:
+            return departures.between(start, end)
+        return departures.between(low=start) | departures.between(high=end)
+
+    def filter(self, **filters):
+        """The offers matching the filters (see `query`), in their original order"""
+        return [self.offers[position] for position in _positions(self.query(**filters))]
+
+    def ids(self, **filters):
+        """IDs of the offers matching the filters, in their original order"""
+        return [self._ids[position] for position in _positions(self.query(**filters))]
+
+    def count(self, **filters):
+        """Number of offers matching the filters"""
+        return bin(self.query(**filters)).count("1")
@@ -0,0 +1,123 @@
+"""Narrowing large lists of offers down to the few worth showing"""
+import math
+from bisect import bisect_left
+
+from .http_client import ClientError
+from .offer_facts import offer_facts
+
+
+def _facts(offer):
+    """Itinerary, price, currency, duration and stops of an offer given as JSON, as a
+    `LazyOffer` or as an `Offer`
+    """
+    facts = offer_facts(offer)
+    itinerary = []
+    for slice in facts.slices:
+        itinerary.extend(
+            (segment.marketing_carrier, segment.flight_number, segment.departing_at)
+            for segment in slice.segments
+        )
+        # Slices are kept apart, the same flights split differently are another trip
+        itinerary.append(None)
+    # Offers of unknown duration never look shorter than others
+    duration = math.inf if facts.duration is None else facts.duration
+    price = float(facts.total_amount)
+    return tuple(itinerary), price, facts.total_currency, duration, facts.stops
+
+
+def itinerary_key(offer):
+    """Hashable key of the flights of an offer: the marketing carrier, flight number
+    and departure time of every segment, slice by slice.
+
+    Offers with the same key take the same flights, whatever their fare brand and
+    whether they are given as JSON or models. Departure times are compared as
+    `datetime`s, however they are written.
+    """
+    return _facts(offer)[0]
+
+
+def _check_currency(facts):
+    """Make sure the prices can be compared"""
+    currencies = {currency for _, _, currency, _, _ in facts}
+    if len(currencies) > 1:
+        raise ClientError(
+            f"offers in different currencies can't be compared: {sorted(currencies)}"
+        )
+
+
+def deduplicate_offers(offers):
+    """Keep the cheapest offer of each itinerary (the first one on a tie), in their
+    original order.
+
+    `offers` may be the JSON of offers (e.g. from an offer request response),
+    `LazyOffer`s or `Offer`s.
+    """
+    offers = list(offers)
+    facts = [_facts(offer) for offer in offers]
+    _check_currency(facts)
+    cheapest = {}
+    for position, (key, price, _, _, _) in enumerate(facts):
+        best = cheapest.get(key)
+        if best is None or price < facts[best][1]:
+            cheapest[key] = position
+    return [offers[position] for position in sorted(cheapest.values())]
+
+
+class _MinimumTree:
+    """Fenwick tree of the minimum value over each prefix of a fixed set of slots"""
+
+    def __init__(self, size):
+        self._tree = [math.inf] * (size + 1)
+
+    def lower(self, slot, value):
+        """Lower the value of `slot` to `value` if it's smaller"""
+        slot += 1
+        while slot < len(self._tree):
+            if value < self._tree[slot]:
+                self._tree[slot] = value
+            slot += slot & -slot
+
+    def minimum(self, slot):
+        """Smallest value of the slots up to and including `slot`"""
+        slot += 1
+        result = math.inf
+        while slot > 0:
+            result = min(result, self._tree[slot])
+            slot -= slot & -slot
+        return result
+
+
+def pareto_front(offers):
+    """The offers no other offer beats on price, duration and stops together, in their
+    original order.
+
+    An offer is left out when another is at least as good on all three and better on
+    one. Offers equal on all three are all kept, `deduplicate_offers` first to keep
+    one per itinerary. Takes O(n log n): the offers are sorted by price, then a
+    Fenwick tree of the fewest stops by duration tells whether a cheaper offer is also
+    shorter and has fewer stops.
+    """
+    offers = list(offers)
+    facts = [_facts(offer) for offer in offers]
+    _check_currency(facts)
+    criteria = sorted(
+        (price, duration, stops, position)
+        for position, (_, price, _, duration, stops) in enumerate(facts)
+    )
+    durations = sorted({duration for _, duration, _, _ in criteria})
+    tree = _MinimumTree(len(durations))
+
+    front = []
+    start = 0
+    while start < len(criteria):
+        # Offers equal on every criterion don't beat one another
+        end = start
+        while end < len(criteria) and criteria[end][:3] == criteria[start][:3]:
+            end += 1
+        _, duration, stops, _ = criteria[start]
+        slot = bisect_left(durations, duration)
+        if tree.minimum(slot) > stops:
+            front.extend(position for _, _, _, position in criteria[start:end])
+            tree.lower(slot, stops)
+        start = end
+    return [offers[position] for position in sorted(front)]
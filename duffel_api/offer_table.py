@@ -0,0 +1,154 @@
+"""Columnar view of offers for ranking and filtering them in bulk, backed by NumPy"""
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
+
+from .http_client import ClientError
+from .models.lazy import LazyModel
+from .offer_facts import offer_facts
+
+
+def _descending(values):
+    """Keys sorting as `values` in reverse, equal values staying equal so that a
+    stable sort keeps their order
+    """
+    ranks = np.unique(values, return_inverse=True)[1]
+    return -ranks.reshape(-1)
+
+
+class OfferTable:
+    """Offers as columns of NumPy arrays, one row per offer.
+
+    Built straight from the JSON of the offers, without creating any `Offer`. The
+    columns are:
+
+    - `id`: the offer ID
+    - `total_amount`: as a float, in `total_currency`
+    - `total_currency`
+    - `owner`: IATA code of the airline selling the offer
+    - `slice_durations`: minutes each slice takes, one column per slice (-1 when
+      unknown or when an offer has fewer slices than others)
+    - `duration`: minutes all slices take together (unknown ones are left out)
+    - `stops`: highest number of stops, connections included, on any slice
+    - `departing_at`: local departure time of the first segment (`datetime64[s]`)
+    - `total_emissions_kg`: NaN when unknown
+    - `position`: index of the offer in the list the table was built from
+
+    `filter`, `sort` and `top` return new tables, `ids` maps their rows back to offers.
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    @classmethod
+    def from_json(cls, offers):
+        """Build a table from the JSON of offers, e.g. the `offers` of an offer
+        request, or from `LazyOffer`s
+        """
+        if np is None:
+            raise ClientError(
+                "numpy is required for OfferTable: pip install duffel-api[numpy]"
+            )
+        rows = [
+            offer._json if isinstance(offer, LazyModel) else offer for offer in offers
+        ]
+
+        facts = [offer_facts(offer) for offer in rows]
+
+        slice_durations = [
+            [-1 if slice.duration is None else slice.duration for slice in offer.slices]
+            for offer in facts
+        ]
+        width = max((len(durations) for durations in slice_durations), default=0)
+        durations = np.full((len(rows), width), -1, dtype=np.int64)
+        for row, offer_durations in enumerate(slice_durations):
+            durations[row, : len(offer_durations)] = offer_durations
+
+        return cls(
+            {
+                "id": np.array([offer["id"] for offer in rows], dtype=object),
+                "total_amount": np.array(
+                    [offer["total_amount"] for offer in rows], dtype=np.float64
+                ),
+                "total_currency": np.array(
+                    [offer["total_currency"] for offer in rows], dtype="U3"
+                ),
+                "owner": np.array(
+                    [offer["owner"].get("iata_code") or "" for offer in rows],
+                    dtype="U3",
+                ),
+                "slice_durations": durations,
+                "duration": np.where(durations < 0, 0, durations).sum(axis=1),
+                "stops": np.array([offer.stops for offer in facts], dtype=np.int64),
+                "departing_at": np.array(
+                    [offer.departing_at for offer in facts], dtype="datetime64[s]"
+                ),
+                "total_emissions_kg": np.array(
+                    [offer.get("total_emissions_kg") for offer in rows],
+                    dtype=np.float64,
+                ),
+                "position": np.arange(len(rows)),
+            }
+        )
+
+    def __len__(self):
+        """Number of offers"""
+        return len(self.columns["id"])
+
+    def __getitem__(self, name):
+        """The column `name`"""
+        return self.columns[name]
+
+    @property
+    def ids(self):
+        """IDs of the offers, in the order of the table"""
+        return self.columns["id"].tolist()
+
+    def take(self, indices):
+        """A table with the rows at `indices`, in that order"""
+        return OfferTable(
+            {name: column[indices] for name, column in self.columns.items()}
+        )
+
+    def filter(self, mask):
+        """A table with only the rows where the boolean array `mask` is true, e.g.
+        `table.filter(table["stops"] == 0)`
+        """
+        return self.take(np.flatnonzero(mask))
+
+    def sort(self, *names, descending=False):
+        """A table sorted by the columns `names`, the first one being the primary key.
+
+        The sort is stable, so rows with equal keys keep their order.
+        """
+        if not names:
+            raise ClientError("sort needs at least one column")
+        keys = [self.columns[name] for name in names]
+        if descending:
+            keys = [_descending(key) for key in keys]
+        # lexsort takes the primary key last
+        return self.take(np.lexsort(keys[::-1]))
+
+    def top(self, k, name="total_amount", largest=False):
+        """The `k` rows with the smallest (or `largest`) values of `name`, sorted.
+
+        Only those `k` rows get sorted, the rest is just partitioned away. Like
+        `sort`, rows with equal values keep their order, the first ones being kept.
+        """
+        keys = self.columns[name]
+        if largest:
+            keys = -keys if keys.dtype.kind in "iuf" else _descending(keys)
+        k = max(0, min(k, len(self)))
+        if not k:
+            return self.take(np.zeros(0, dtype=np.int64))
+        kth = np.partition(keys, k - 1)[k - 1]
+        if keys.dtype.kind == "f" and np.isnan(kth):
+            better, tied = ~np.isnan(keys), np.isnan(keys)
+        else:
+            better, tied = keys < kth, keys == kth
+        better = np.flatnonzero(better)
+        candidates = np.sort(
+            np.concatenate([better, np.flatnonzero(tied)[: k - len(better)]])
+        )
+        return self.take(candidates[np.argsort(keys[candidates], kind="stable")])
@@ -0,0 +1,212 @@
+"""Resolving the codes and names of cities and airports, e.g. to normalise search input"""
+import dataclasses
+import re
+import unicodedata
+from bisect import bisect_left
+
+from .http_client import ClientError
+from .models import Airport, City, Place
+
+_WORD = re.compile(r"\w+")
+
+# Words shorter than this only match exactly or as a prefix, never with a typo
+_MIN_TYPO_LENGTH = 4
+
+
+def normalise(text):
+    """Words of `text` in lower case, without accents"""
+    if not text.isascii():
+        decomposed = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _WORD.findall(text.casefold())
+
+
+def _deletions(word):
+    """`word` with one of its characters removed, every way"""
+    return {
+        word[:index] + word[index + 1 :] for index in range(len(word))  # noqa: E203
+    }
+
+
+def _one_edit_apart(a, b):
+    """Whether `b` is `a` with at most one character inserted, removed, replaced or
+    swapped with its neighbour
+    """
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    start = 0
+    while start < min(len(a), len(b)) and a[start] == b[start]:
+        start += 1
+    if len(a) == len(b):
+        swapped = (
+            start + 1 < len(a)
+            and a[start] == b[start + 1]
+            and a[start + 1] == b[start]
+            and a[start + 2 :] == b[start + 2 :]  # noqa: E203
+        )
+        return swapped or a[start + 1 :] == b[start + 1 :]  # noqa: E203
+    if len(a) < len(b):
+        return a[start:] == b[start + 1 :]  # noqa: E203
+    return a[start + 1 :] == b[start:]  # noqa: E203
+
+
+def _airports(items):
+    """The `Airport`s of items which are airports, places or their JSON, those of a
+    city place belonging to that city
+    """
+    for item in items:
+        if isinstance(item, dict) and item.get("type") == "city":
+            item = Place.from_json(item)
+        if isinstance(item, Airport):
+            yield item
+        elif isinstance(item, Place):
+            if item.type != "city":
+                raise ClientError(
+                    "Place models of airports have no IATA code, give their JSON"
+                )
+            city = None
+            if item.iata_city_code:
+                city = City(
+                    item.id, item.name, item.iata_city_code, item.iata_country_code
+                )
+            for airport in item.airports or ():
+                if airport.city is None and city is not None:
+                    airport = dataclasses.replace(airport, city=city)
+                yield airport
+        else:
+            yield Airport.from_json(item)
+
+
+class PlaceIndex:
+    """In-memory index of airports and the cities they belong to.
+
+    Built once from airports (e.g. `client.airports.list(200)`, or see
+    `from_snapshot`), places of type `city` (their airports) or the JSON of either.
+    Mappings:
+
+    - `airports_by_iata` and `airports_by_icao`: code to `Airport`
+    - `cities`: IATA city code to `City`
+    - `airports_by_city`: IATA city code to its `Airport`s
+    - `airports_by_country`: ISO country code to its `Airport`s
+
+    `search` completes what a user is typing into cities and airports, forgiving a
+    typo per word.
+    """
+
+    def __init__(self, items):
+        self.airports_by_iata = {}
+        self.airports_by_icao = {}
+        self.cities = {}
+        self.airports_by_city = {}
+        self.airports_by_country = {}
+        for airport in _airports(items):
+            if airport.iata_code:
+                self.airports_by_iata[airport.iata_code] = airport
+            if airport.icao_code:
+                self.airports_by_icao[airport.icao_code] = airport
+            self.airports_by_country.setdefault(airport.iata_country_code, []).append(
+                airport
+            )
+            if airport.city is not None:
+                self.cities[airport.city.iata_code] = airport.city
+                self.airports_by_city.setdefault(airport.city.iata_code, []).append(
+                    airport
+                )
+        self._index_words()
+
+    def _index_words(self):
+        """Index the words `search` looks for: of cities first, then airports"""
+        self._entries = list(self.cities.values()) + list(
+            self.airports_by_iata.values()
+        )
+        self._entry_words = {}
+        # Words of names, where typos are looked for, unlike in codes
+        names = set()
+        for position, entry in enumerate(self._entries):
+            words = normalise(entry.name)
+            codes = [entry.iata_code]
+            if isinstance(entry, Airport):
+                if entry.city is not None:
+                    words += normalise(entry.city.name)
+                codes.append(entry.icao_code)
+            names.update(words)
+            for word in words + [code.casefold() for code in codes if code]:
+                self._entry_words.setdefault(word, set()).add(position)
+        self._words = sorted(self._entry_words)
+        self._deleted = {}
+        for word in names:
+            if len(word) >= _MIN_TYPO_LENGTH:
+                for deletion in _deletions(word) | {word}:
+                    self._deleted.setdefault(deletion, []).append(word)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Index the airports of a `ReferenceSnapshot`"""
+        return cls(snapshot.airports.values())
+
+    def expand(self, code):
+        """The airports an IATA code stands for: all those of a city, or the airport
+        with that code. Empty for an unknown code.
+        """
+        if code in self.airports_by_city:
+            return list(self.airports_by_city[code])
+        airport = self.airports_by_iata.get(code)
+        return [airport] if airport is not None else []
+
+    def city_of(self, airport_code):
+        """The `City` of the airport with an IATA or ICAO code, if known"""
+        airport = self.airports_by_iata.get(airport_code) or self.airports_by_icao.get(
+            airport_code
+        )
+        return airport.city if airport is not None else None
+
+    def search(self, text, limit=10):
+        """Up to `limit` cities and airports matching what a user typed, best first.
+
+        Every word of `text` must match a word of the name, city name or codes of a
+        result. The last word may be incomplete. Each word forgives one character
+        missing, added, wrong or swapped with the next, from four characters on.
+        Exact matches rank first, then prefixes, then typos; cities come before
+        airports.
+        """
+        words = normalise(text)
+        if not words:
+            return []
+        scores = None
+        for index, word in enumerate(words):
+            matches = self._match(word, prefix=index == len(words) - 1)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {
+                    position: max(score, matches[position])
+                    for position, score in scores.items()
+                    if position in matches
+                }
+        ranked = sorted(scores, key=lambda position: (scores[position], position))
+        return [self._entries[position] for position in ranked[:limit]]
+
+    def _match(self, word, prefix):
+        """Entries with a word matching `word`, mapped to how well: 0 for the word
+        itself, 1 for a word it begins, 2 for a word a typo away
+        """
+        matches = {position: 0 for position in self._entry_words.get(word, ())}
+        if prefix:
+            index = bisect_left(self._words, word)
+            while index < len(self._words) and self._words[index].startswith(word):
+                for position in self._entry_words[self._words[index]]:
+                    matches.setdefault(position, 1)
+                index += 1
+        if len(word) < _MIN_TYPO_LENGTH:
+            return matches
+
+        candidates = set()
+        for deletion in _deletions(word) | {word}:
+            candidates.update(self._deleted.get(deletion, ()))
+        for candidate in candidates:
+            if _one_edit_apart(word, candidate):
+                for position in self._entry_words[candidate]:
+                    matches.setdefault(position, 2)
+        return matches
@@ -0,0 +1,89 @@
+"""Client-side pacing of the requests sent to the API"""
+import threading
+import time
+
+from .retry import get_header, seconds_until
+
+
+class RateLimiter:
+    """Interface of the rate limiters accepted by the clients.
+
+    `reserve` is called before every request and returns how long (in seconds) the
+    caller must wait before sending it, `update` is called with the headers of every
+    response. This base class never makes anyone wait.
+    """
+
+    def reserve(self, tokens=1):
+        """Take `tokens` and return the number of seconds to wait before using them"""
+        return 0.0
+
+    def update(self, headers):
+        """Adjust to the rate limit information sent back by the API"""
+
+    def acquire(self, tokens=1):
+        """Block the calling thread until `tokens` are available"""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class TokenBucket(RateLimiter):
+    """Thread-safe token bucket.
+
+    The bucket holds up to `capacity` tokens (defaults to one second's worth) and
+    refills at `rate` tokens per second. Every request takes one token; when there are
+    none left the request waits for its turn, in the order the requests were made.
+
+    Pass the same bucket to every client (which `Duffel` does when given a
+    `rate_limiter`) to pace all of them together. As responses come back, the refill
+    rate is lowered to spread the quota the API reports as remaining over the time left
+    until it resets, so we run right at the limit without being answered with 429s.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        """Add the tokens accumulated since the last refill"""
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def reserve(self, tokens=1):
+        """Take `tokens` and return the number of seconds to wait before using them.
+
+        The bucket can go into debt: later callers have to wait for the earlier ones'
+        tokens to be refilled first.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def update(self, headers):
+        """Adapt to the `ratelimit-remaining` and `ratelimit-reset` headers"""
+        remaining = get_header(headers, "ratelimit-remaining")
+        reset_in = seconds_until(get_header(headers, "ratelimit-reset"))
+        if remaining is None or not reset_in:
+            return
+        try:
+            remaining = int(remaining)
+        except ValueError:
+            return
+
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, remaining)
+            # With nothing left, the next token shows up when the quota resets
+            self.rate = min(self.max_rate, max(remaining, 1) / reset_in)
@@ -0,0 +1,304 @@
+"""A local snapshot of the reference data (airports, airlines and aircraft), kept in a
+sqlite file so that services can resolve codes without listing them at startup.
+
+Refresh a snapshot from the command line with
+
+    python -m duffel_api.reference_data refresh reference.sqlite [--max-age SECONDS]
+
+which reads the access token from `DUFFEL_ACCESS_TOKEN`.
+"""
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import Duffel
+from .http_client import ClientError, Pagination
+from .models import Aircraft, Airline, Airport
+
+# Model of each kind of reference data, named as the client listing it
+KINDS = {"airports": Airport, "airlines": Airline, "aircraft": Aircraft}
+
+# Bytes of the file mapped in memory by readers, more than a snapshot ever takes
+_MMAP_SIZE = 256 * 2**20
+
+
+class _RawJson:
+    """Stands for a model in `Pagination` to get the JSON of the items as they are"""
+
+    @staticmethod
+    def from_json(json):
+        """The JSON untouched"""
+        return json
+
+
+def _encode(item):
+    """Canonical JSON of an item, equal for equal items"""
+    return json.dumps(item, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _connect(path, readonly=False):
+    """Open the snapshot at `path`, creating its tables unless `readonly`"""
+    if readonly:
+        try:
+            connection = sqlite3.connect(
+                f"file:{path}?mode=ro", uri=True, check_same_thread=False
+            )
+        except sqlite3.OperationalError as err:
+            raise ClientError(
+                f"can't open the snapshot {path} ({err}), create it with refresh()"
+            ) from err
+    else:
+        connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS reference_data (kind TEXT NOT NULL, "
+            "id TEXT NOT NULL, iata_code TEXT, icao_code TEXT, data TEXT NOT NULL, "
+            "PRIMARY KEY (kind, id))"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS reference_data_iata "
+            "ON reference_data (kind, iata_code, id)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS reference_data_icao "
+            "ON reference_data (kind, icao_code, id)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS reference_meta "
+            "(kind TEXT PRIMARY KEY, refreshed_at REAL NOT NULL)"
+        )
+    connection.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+    return connection
+
+
+def download(client, kinds=tuple(KINDS), prefetch=2):
+    """The JSON of every item of each of `kinds`, listed from the API 200 at a time.
+
+    The kinds are listed at the same time, each by its own thread, which fetches the
+    next `prefetch` pages while the current one is read.
+    """
+    for kind in kinds:
+        if kind not in KINDS:
+            raise ClientError(f"unknown reference data: {kind}")
+
+    def list_all(kind):
+        """Every item of one kind"""
+        pages = Pagination(
+            getattr(client, kind), _RawJson, {"limit": 200}, prefetch=prefetch
+        )
+        return list(pages)
+
+    with ThreadPoolExecutor(len(kinds) or 1) as executor:
+        return dict(zip(kinds, executor.map(list_all, kinds)))
+
+
+def refresh(path, client, kinds=tuple(KINDS), max_age=None, prefetch=2):
+    """Bring the snapshot at `path` up to date, creating it if needed, and return the
+    number of items `added`, `updated` and `removed` for each kind.
+
+    Only the items that changed are written, in a single transaction, so processes
+    reading the snapshot meanwhile see either the old or the new data. Kinds
+    refreshed less than `max_age` seconds ago are left alone.
+    """
+    connection = _connect(path)
+    try:
+        if max_age is not None:
+            fresh = {
+                kind
+                for kind, refreshed_at in connection.execute(
+                    "SELECT kind, refreshed_at FROM reference_meta"
+                )
+                if refreshed_at > time.time() - max_age
+            }
+            kinds = tuple(kind for kind in kinds if kind not in fresh)
+        if not kinds:
+            return {}
+        items = download(client, kinds, prefetch)
+
+        changes = {}
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for kind, kind_items in items.items():
+                changes[kind] = _replace(connection, kind, kind_items)
+                connection.execute(
+                    "INSERT OR REPLACE INTO reference_meta VALUES (?, ?)",
+                    (kind, time.time()),
+                )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        # Lets the query planner pick the index by code over the one by ID
+        connection.execute("ANALYZE")
+        return changes
+    finally:
+        connection.close()
+
+
+def _replace(connection, kind, items):
+    """Make the items of `kind` those given, touching only what changed"""
+    stored = dict(
+        connection.execute(
+            "SELECT id, data FROM reference_data WHERE kind = ?", (kind,)
+        ).fetchall()
+    )
+    counts = {"added": 0, "updated": 0, "removed": 0}
+    seen = set()
+    for item in items:
+        seen.add(item["id"])
+        data = _encode(item)
+        previous = stored.get(item["id"])
+        if previous == data:
+            continue
+        counts["added" if previous is None else "updated"] += 1
+        connection.execute(
+            "INSERT OR REPLACE INTO reference_data VALUES (?, ?, ?, ?, ?)",
+            (kind, item["id"], item.get("iata_code"), item.get("icao_code"), data),
+        )
+    for id_ in stored.keys() - seen:
+        counts["removed"] += 1
+        connection.execute(
+            "DELETE FROM reference_data WHERE kind = ? AND id = ?", (kind, id_)
+        )
+    return counts
+
+
+class ReferenceLookup(Mapping):
+    """Read-only mapping of the items of one kind by `column` (`id`, `iata_code` or
+    `icao_code`) to their models.
+
+    When several items share a code, e.g. airlines which no longer fly, the one with
+    the smallest ID is returned.
+    """
+
+    def __init__(self, snapshot, kind, column):
+        self._snapshot = snapshot
+        self._kind = kind
+        self._column = column
+
+    def __getitem__(self, key):
+        """The model of the item whose `column` is `key`"""
+        rows = self._snapshot._query(
+            f"SELECT data FROM reference_data WHERE kind = ? AND {self._column} = ? "
+            "ORDER BY id LIMIT 1",
+            (self._kind, key),
+        )
+        if not rows:
+            raise KeyError(key)
+        return KINDS[self._kind].from_json(json.loads(rows[0][0]))
+
+    def __iter__(self):
+        """The keys, in order"""
+        rows = self._snapshot._query(
+            f"SELECT DISTINCT {self._column} FROM reference_data "
+            f"WHERE kind = ? AND {self._column} IS NOT NULL ORDER BY 1",
+            (self._kind,),
+        )
+        return iter([key for key, in rows])
+
+    def __len__(self):
+        """Number of distinct keys"""
+        return self._snapshot._query(
+            f"SELECT COUNT(DISTINCT {self._column}) FROM reference_data WHERE kind = ?",
+            (self._kind,),
+        )[0][0]
+
+
+class ReferenceTable(ReferenceLookup):
+    """The items of one kind by ID, with `by_iata` and `by_icao` mappings by code"""
+
+    def __init__(self, snapshot, kind):
+        super().__init__(snapshot, kind, "id")
+        self.by_iata = ReferenceLookup(snapshot, kind, "iata_code")
+        self.by_icao = ReferenceLookup(snapshot, kind, "icao_code")
+
+    def values(self):
+        """The models of all the items, by ID, read in a single query"""
+        rows = self._snapshot._query(
+            "SELECT data FROM reference_data WHERE kind = ? ORDER BY id", (self._kind,)
+        )
+        return [KINDS[self._kind].from_json(json.loads(data)) for data, in rows]
+
+
+class ReferenceSnapshot:
+    """Read-only view of a snapshot made by `refresh`, e.g.
+    `snapshot.airports.by_iata["LHR"]` or `snapshot.airlines["arl_00001"]`.
+
+    Opening it reads nothing: the file is mapped in memory and each lookup goes
+    through an index, building the model of the item found. Safe to share between
+    threads, and to use while another process refreshes the file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = _connect(path, readonly=True)
+        self._lock = threading.Lock()
+        self.airports = ReferenceTable(self, "airports")
+        self.airlines = ReferenceTable(self, "airlines")
+        self.aircraft = ReferenceTable(self, "aircraft")
+
+    @classmethod
+    def refreshed(cls, path, client, max_age=None):
+        """Refresh the snapshot at `path` (see `refresh`) and open it"""
+        refresh(path, client, max_age=max_age)
+        return cls(path)
+
+    def refreshed_at(self, kind):
+        """Unix timestamp of the last refresh of `kind`, `None` if never done"""
+        rows = self._query(
+            "SELECT refreshed_at FROM reference_meta WHERE kind = ?", (kind,)
+        )
+        return rows[0][0] if rows else None
+
+    def _query(self, sql, params):
+        """The rows returned by a query"""
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def close(self):
+        """Close the file"""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        """Use the snapshot as a context manager closing it on exit"""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the file"""
+        self.close()
+
+
+def main(argv=None):
+    """Command line entry point, see the module documentation"""
+    parser = argparse.ArgumentParser(prog="python -m duffel_api.reference_data")
+    commands = parser.add_subparsers(dest="command", required=True)
+    command = commands.add_parser("refresh", help="create or update a snapshot")
+    command.add_argument("path")
+    command.add_argument("--max-age", type=float, default=None)
+    command.add_argument("--kind", action="append", choices=list(KINDS))
+    args = parser.parse_args(argv)
+
+    client = Duffel()
+    try:
+        changes = refresh(
+            args.path, client, kinds=tuple(args.kind or KINDS), max_age=args.max_age
+        )
+    finally:
+        client.close()
+    for kind, counts in changes.items():
+        print(
+            f"{kind}: {counts['added']} added, {counts['updated']} updated, "
+            f"{counts['removed']} removed"
+        )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
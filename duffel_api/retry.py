@@ -0,0 +1,160 @@
+"""Retrying failed requests with exponential backoff"""
+import asyncio
+import random
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+from .http_client import ApiError
+
+
+def get_header(headers, name):
+    """Read a header from either a `requests` or an `httpx` headers mapping"""
+    if not hasattr(headers, "get"):
+        return None
+    return headers.get(name)
+
+
+def seconds_until(value, now=None):
+    """Number of seconds until the moment described by a header value.
+
+    Accepts a delay in seconds, a unix timestamp or an HTTP date.
+    """
+    if value is None:
+        return None
+    if now is None:
+        now = time.time()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return max(0.0, moment.timestamp() - now)
+
+    # Anything this large can't be a delay, it must be a timestamp
+    if seconds > 1_000_000_000:
+        seconds -= now
+    return max(0.0, seconds)
+
+
+def rate_limit_delay(headers, now=None):
+    """How long the API asked us to wait before the next request, if it did.
+
+    `Retry-After` wins when present, otherwise `ratelimit-reset` is used once
+    `ratelimit-remaining` has dropped to zero.
+    """
+    retry_after = seconds_until(get_header(headers, "retry-after"), now)
+    if retry_after is not None:
+        return retry_after
+    if get_header(headers, "ratelimit-remaining") == "0":
+        return seconds_until(get_header(headers, "ratelimit-reset"), now)
+    return None
+
+
+class RetryPolicy:
+    """When to retry a failed request and for how long to wait before doing so.
+
+    Requests failing with one of `retry_statuses`, or without a response at all, are
+    retried up to `max_attempts` times in total. Only `retry_methods` are retried,
+    unless the request carries an idempotency key, which makes any method (e.g. POST)
+    safe to retry.
+
+    The wait follows the `Retry-After`/`ratelimit-*` headers sent by the API when
+    present. Otherwise it grows exponentially from `backoff_factor` seconds up to
+    `max_backoff`, with full jitter so that concurrent clients don't retry in lockstep.
+    We give up once waiting again would take us past `max_elapsed` seconds since the
+    first attempt.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    RETRY_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+    def __init__(
+        self,
+        max_attempts=4,
+        backoff_factor=0.5,
+        max_backoff=30.0,
+        max_elapsed=60.0,
+        jitter=True,
+        retry_statuses=RETRY_STATUSES,
+        retry_methods=RETRY_METHODS,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_elapsed = max_elapsed
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+        self.retry_methods = retry_methods
+
+    def is_retryable(self, method, error, idempotency_key=None):
+        """Whether a request that failed with `error` may be sent again"""
+        if method.upper() not in self.retry_methods and not idempotency_key:
+            return False
+        if isinstance(error, ApiError):
+            return error.status_code in self.retry_statuses
+        # No response at all, e.g. the connection was reset
+        return True
+
+    def backoff(self, attempt, error=None):
+        """Seconds to wait before retry number `attempt` (starting at 0)"""
+        if isinstance(error, ApiError):
+            delay = rate_limit_delay(error.headers)
+            if delay is not None:
+                return delay
+
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+    def next_delay(self, method, error, attempt, started_at, idempotency_key=None):
+        """Seconds to wait before retrying, or `None` if we should give up"""
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if not self.is_retryable(method, error, idempotency_key):
+            return None
+        delay = self.backoff(attempt, error)
+        if time.monotonic() - started_at + delay > self.max_elapsed:
+            return None
+        return delay
+
+    def call(self, send, method, idempotency_key=None, retry_on=()):
+        """Call `send` until it succeeds or we run out of retries.
+
+        `retry_on` lists the exceptions, besides `ApiError`, that signal a failed
+        attempt rather than a bug.
+        """
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return send()
+            except (ApiError, *retry_on) as err:
+                delay = self.next_delay(
+                    method, err, attempt, started_at, idempotency_key
+                )
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, send, method, idempotency_key=None, retry_on=()):
+        """Same as `call` for a coroutine function `send`"""
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return await send()
+            except (ApiError, *retry_on) as err:
+                delay = self.next_delay(
+                    method, err, attempt, started_at, idempotency_key
+                )
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,226 @@
+"""Caching the results of identical searches (offer requests) and seat maps for a
+while
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import timezone
+
+from .utils import parse_datetime
+
+
+def client_identity(client):
+    """What tells the searches of an `HttpClient` or `AsyncHttpClient` apart from the
+    same searches of another: its access token (which also sets test or live mode),
+    API version and URL
+    """
+    headers = client._transport.session.headers
+    return [
+        headers.get("Authorization"),
+        headers.get("Duffel-Version"),
+        client._api_url,
+    ]
+
+
+def search_key(query_params, body, client=None):
+    """Canonical hash of an offer request: the same for any two requests asking for
+    the same search, whatever the order of the keys of their objects.
+
+    `client` is the `client_identity` of the client searching, so that clients of
+    different accounts or modes never get each other's results, even through a shared
+    backend. Only its hash is kept.
+    """
+    canonical = json.dumps(
+        {"client": client, "query": query_params, "body": body},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def offers_expire_at(data):
+    """Unix timestamp at which the first of the offers of an offer request expires,
+    `None` without offers
+    """
+    expiries = [
+        parse_datetime(offer["expires_at"]) for offer in data.get("offers") or ()
+    ]
+    if not expiries:
+        return None
+    return min(expiries).replace(tzinfo=timezone.utc).timestamp()
+
+
+class CacheBackend:
+    """Interface of the storages shared between `SearchCache`s, e.g. by several
+    processes.
+
+    Entries are the `data` of offer request responses along with the unix timestamp
+    at which they expire. This base class stores nothing.
+    """
+
+    def get(self, key, now):
+        """The `(data, expires_at)` of `key` unless missing or expired by `now`"""
+        return None
+
+    def set(self, key, data, expires_at):
+        """Store `data` under `key` until `expires_at`"""
+
+    def clear(self):
+        """Remove every entry"""
+
+
+class SqliteCacheBackend(CacheBackend):
+    """Backend keeping the entries in a sqlite database, to share them between the
+    processes of a machine and keep them across restarts
+    """
+
+    def __init__(self, path):
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache "
+                "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, data TEXT NOT NULL)"
+            )
+
+    def get(self, key, now):
+        """The `(data, expires_at)` of `key` unless missing or expired by `now`"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data, expires_at FROM search_cache "
+                "WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def set(self, key, data, expires_at):
+        """Store `data` under `key` until `expires_at`, dropping expired entries"""
+        encoded = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM search_cache WHERE expires_at <= ?", (time.time(),)
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?)",
+                (key, expires_at, encoded),
+            )
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._connection.execute("DELETE FROM search_cache")
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._connection.close()
+
+
+class SearchCache:
+    """In-memory LRU cache of offer requests, optionally in front of a shared
+    `backend` such as `SqliteCacheBackend`.
+
+    Pass it to `Duffel` as `search_cache` and creating an offer request identical to
+    one created less than `ttl` seconds ago returns the same offers without calling
+    the API. An entry never outlives the first of its offers to expire.
+
+    `hits` counts the searches answered from the cache (`backend_hits` of them by the
+    backend) and `misses` those sent to the API.
+    """
+
+    def __init__(self, maxsize=256, ttl=300.0, backend=None, clock=time.time):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.backend = backend
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.backend_hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """Share of the searches answered from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key):
+        """The cached `data` of the offer request `key`, `None` on a miss"""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del self._entries[key]
+
+        entry = self.backend.get(key, now) if self.backend is not None else None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.backend_hits += 1
+            self._store(key, entry)
+        return entry[0]
+
+    def set(self, key, data):
+        """Cache the `data` of the offer request `key`, unless it's already expired"""
+        expires_at = self._clock() + self.ttl
+        data_expiry = self.data_expires_at(data)
+        if data_expiry is not None:
+            expires_at = min(expires_at, data_expiry)
+        if expires_at <= self._clock():
+            return
+        with self._lock:
+            self._store(key, (data, expires_at))
+        if self.backend is not None:
+            self.backend.set(key, data, expires_at)
+
+    def data_expires_at(self, data):
+        """Unix timestamp after which `data` must not be used, whatever the `ttl`"""
+        return offers_expire_at(data)
+
+    def _store(self, key, entry):
+        """Keep `entry` in memory, evicting the least recently used ones"""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every entry, including those of the backend, and the counts"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.backend_hits = self.misses = 0
+        if self.backend is not None:
+            self.backend.clear()
+
+
+class SeatMapCache(SearchCache):
+    """In-memory LRU cache of the seat maps of offers, keyed by offer ID.
+
+    Pass one to `Duffel` as `seat_map_cache` (or to `seat_maps.get()` as `cache`) so
+    that showing the seats of an offer again within `ttl` seconds doesn't fetch them
+    again; `seat_maps.get_many()` keeps one of its own otherwise. Seats get taken,
+    keep `ttl` short.
+    """
+
+    def __init__(self, maxsize=128, ttl=300.0, backend=None, clock=time.time):
+        super().__init__(maxsize, ttl, backend, clock)
+
+    def data_expires_at(self, data):
+        """Seat maps say nothing about their expiry, only the `ttl` applies"""
+        return None
@@ -0,0 +1,310 @@
+"""Seat maps as grids of NumPy arrays, for finding seats without walking every element"""
+import dataclasses
+from decimal import Decimal
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
+
+from .http_client import ClientError
+from .models.lazy import LazyModel
+from .models.seat_map import SeatMapCabinRowSectionElement
+
+# Codes of the cells of a grid: no element, the aisle between two sections, then the
+# types of elements
+ELEMENT_TYPES = ("none", "aisle") + tuple(SeatMapCabinRowSectionElement.allowed_types)
+_CODES = {name: code for code, name in enumerate(ELEMENT_TYPES)}
+
+# Digits after the decimal point of the currencies which don't have two
+_MINOR_DIGITS = {
+    "BHD": 3,
+    "CLP": 0,
+    "IQD": 3,
+    "ISK": 0,
+    "JOD": 3,
+    "JPY": 0,
+    "KRW": 0,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "TND": 3,
+    "VND": 0,
+}
+
+
+def minor_units(amount, currency):
+    """`amount` (a string) as an integer number of the smallest unit of `currency`"""
+    return int(Decimal(amount).scaleb(_MINOR_DIGITS.get(currency, 2)))
+
+
+class SeatChoice(NamedTuple):
+    """A seat a passenger can take, with the service to add to the order for it"""
+
+    designator: str
+    passenger_id: str
+    service_id: str
+    total_amount: Decimal
+    total_currency: str
+
+
+class CabinGrid:
+    """One cabin of a seat map as arrays with a cell per element, indexed by
+    `(row, column)`.
+
+    Rows are those of the seat map, seats or not, so `wings` indices apply. The
+    sections of a row follow one another, an `aisle` column apart, each as wide as
+    its widest row. The arrays are:
+
+    - `types`: code of each cell, an index into `ELEMENT_TYPES`
+    - `designators`: designator of each seat, `None` elsewhere
+    - `available`: bitmask of the passengers (by index in `SeatGrid.passenger_ids`)
+      who can take each seat
+    - `prices`: price of each seat for each passenger, in minor units of the currency
+      (e.g. pence), -1 when they can't take it. Shaped `(rows, columns, passengers)`
+    - `services`: ID of the service to book, along the same axes as `prices`
+    - `window`: whether each cell is a window seat, i.e. the first or last element
+      of its row
+    - `exit_rows`: whether each row is an exit row: it has `exit_row` elements or
+      follows a row that has
+    """
+
+    def __init__(self, cabin_class, deck, designators, types, prices, services, window):
+        self.cabin_class = cabin_class
+        self.deck = deck
+        self.designators = designators
+        self.types = types
+        self.prices = prices
+        self.services = services
+        self.window = window
+        weights = np.left_shift(
+            np.uint64(1), np.arange(prices.shape[2], dtype=np.uint64)
+        )
+        self.available = ((prices >= 0) * weights).sum(axis=2, dtype=np.uint64)
+        exits = (types == _CODES["exit_row"]).any(axis=1)
+        self.exit_rows = exits | np.concatenate(([False], exits[:-1]))
+
+    @classmethod
+    def from_json(cls, cabin, passengers):
+        """Build the grid of the JSON of a cabin, `passengers` mapping passenger IDs
+        to their index
+        """
+        rows = cabin["rows"]
+        widths = []
+        for row in rows:
+            for index, section in enumerate(row["sections"]):
+                if index == len(widths):
+                    widths.append(0)
+                widths[index] = max(widths[index], len(section["elements"]))
+        starts = [sum(widths[:index]) + index for index in range(len(widths))]
+        shape = (len(rows), sum(widths) + max(len(widths) - 1, 0))
+
+        types = np.zeros(shape, dtype=np.int8)
+        for start in starts[1:]:
+            types[:, start - 1] = _CODES["aisle"]
+        designators = np.full(shape, None, dtype=object)
+        window = np.zeros(shape, dtype=bool)
+        prices = np.full(shape + (len(passengers),), -1, dtype=np.int64)
+        services = np.full(shape + (len(passengers),), None, dtype=object)
+
+        for row_index, row in enumerate(rows):
+            sections = row["sections"]
+            for section_index, section in enumerate(sections):
+                elements = section["elements"]
+                for element_index, element in enumerate(elements):
+                    cell = (row_index, starts[section_index] + element_index)
+                    types[cell] = _CODES[element["type"]]
+                    if element["type"] != "seat":
+                        continue
+                    designators[cell] = element.get("designator")
+                    window[cell] = (section_index == 0 and element_index == 0) or (
+                        section_index == len(sections) - 1
+                        and element_index == len(elements) - 1
+                    )
+                    for service in element.get("available_services") or ():
+                        passenger = passengers[service["passenger_id"]]
+                        prices[cell + (passenger,)] = minor_units(
+                            service["total_amount"], service["total_currency"]
+                        )
+                        services[cell + (passenger,)] = service["id"]
+
+        return cls(
+            cabin["cabin_class"],
+            cabin["deck"],
+            designators,
+            types,
+            prices,
+            services,
+            window,
+        )
+
+
+class SeatGrid:
+    """A seat map as a `CabinGrid` per cabin, answering questions such as "the
+    cheapest window seat" or "three seats side by side" with array operations.
+
+    `index` maps each designator to its `(cabin, row, column)` cell.
+    """
+
+    def __init__(self, id, passenger_ids, currency, cabins):
+        self.id = id
+        self.passenger_ids = passenger_ids
+        self.currency = currency
+        self.cabins = cabins
+        self.index = {}
+        for cabin_index, cabin in enumerate(cabins):
+            for row, column in np.argwhere(cabin.types == _CODES["seat"]).tolist():
+                designator = cabin.designators[row, column]
+                if designator is not None:
+                    self.index[designator] = (cabin_index, row, column)
+
+    @classmethod
+    def from_seat_map(cls, seat_map):
+        """Build the grid of a `SeatMap`, a `LazySeatMap` or the JSON of a seat map"""
+        if np is None:
+            raise ClientError(
+                "numpy is required for SeatGrid: pip install duffel-api[numpy]"
+            )
+        if isinstance(seat_map, LazyModel):
+            seat_map = seat_map._json
+        elif not isinstance(seat_map, dict):
+            seat_map = dataclasses.asdict(seat_map)
+
+        passengers = {}
+        currencies = set()
+        for service in _services(seat_map):
+            passengers.setdefault(service["passenger_id"], len(passengers))
+            currencies.add(service["total_currency"])
+        if len(passengers) > 64:
+            raise ClientError("a seat grid holds up to 64 passengers")
+        # Prices are compared as minor units, which only makes sense in one currency
+        if len(currencies) > 1:
+            raise ClientError(
+                f"seat services in different currencies: {sorted(currencies)}"
+            )
+        currency = currencies.pop() if currencies else None
+        cabins = [
+            CabinGrid.from_json(cabin, passengers) for cabin in seat_map["cabins"]
+        ]
+        return cls(seat_map["id"], list(passengers), currency, cabins)
+
+    def _passenger(self, passenger_id):
+        """Index of a passenger"""
+        try:
+            return self.passenger_ids.index(passenger_id)
+        except ValueError:
+            raise ClientError(f"no seat is offered to {passenger_id}") from None
+
+    def _choice(self, cabin, row, column, passenger):
+        """The seat at a cell for a passenger"""
+        grid = self.cabins[cabin]
+        exponent = Decimal(1).scaleb(-_MINOR_DIGITS.get(self.currency, 2))
+        price = Decimal(int(grid.prices[row, column, passenger])) * exponent
+        return SeatChoice(
+            grid.designators[row, column],
+            self.passenger_ids[passenger],
+            grid.services[row, column, passenger],
+            price.quantize(exponent),
+            self.currency,
+        )
+
+    def seat(self, designator, passenger_id):
+        """The seat `designator` for a passenger, `None` if they can't take it"""
+        passenger = self._passenger(passenger_id)
+        cabin, row, column = self.index[designator]
+        if self.cabins[cabin].prices[row, column, passenger] < 0:
+            return None
+        return self._choice(cabin, row, column, passenger)
+
+    def cheapest(self, passenger_id, window=False, exit_row=None):
+        """The cheapest seat a passenger can take, the frontmost one on a tie, or
+        `None` if there is none.
+
+        `window` only looks at window seats. `exit_row` only looks at exit rows when
+        true, and leaves them out when false.
+        """
+        passenger = self._passenger(passenger_id)
+        best = None
+        for cabin_index, cabin in enumerate(self.cabins):
+            prices = cabin.prices[:, :, passenger]
+            mask = (prices >= 0) & _row_mask(cabin, exit_row)[:, None]
+            if window:
+                mask &= cabin.window
+            if not mask.any():
+                continue
+            cell = np.unravel_index(
+                np.argmin(np.where(mask, prices, np.iinfo(np.int64).max)), prices.shape
+            )
+            if best is None or prices[cell] < best[0]:
+                best = (prices[cell], cabin_index, int(cell[0]), int(cell[1]))
+        if best is None:
+            return None
+        return self._choice(*best[1:], passenger)
+
+    def adjacent(self, passenger_ids, exit_row=None, limit=None):
+        """Blocks of seats side by side in a row, no aisle in between, the first for
+        the first passenger and so on, cheapest block first (frontmost on a tie).
+
+        Returns up to `limit` tuples of a `SeatChoice` per passenger. `exit_row` is
+        as for `cheapest`.
+        """
+        passengers = [self._passenger(passenger_id) for passenger_id in passenger_ids]
+        count = len(passengers)
+        found = []
+        for cabin_index, cabin in enumerate(self.cabins):
+            rows, columns = cabin.types.shape
+            starts = columns - count + 1
+            if count == 0 or starts <= 0:
+                continue
+            totals = np.zeros((rows, starts), dtype=np.int64)
+            free = np.ones((rows, starts), dtype=bool)
+            for offset, passenger in enumerate(passengers):
+                stop = offset + starts
+                prices = cabin.prices[:, offset:stop, passenger]
+                free &= prices >= 0
+                totals += prices
+            free &= _row_mask(cabin, exit_row)[:, None]
+            block_rows, block_columns = np.nonzero(free)
+            found.append(
+                (
+                    totals[block_rows, block_columns],
+                    np.full(len(block_rows), cabin_index),
+                    block_rows,
+                    block_columns,
+                )
+            )
+        if not found:
+            return []
+
+        totals, cabins, rows, columns = (np.concatenate(part) for part in zip(*found))
+        # lexsort takes the primary key last
+        order = np.lexsort((columns, rows, cabins, totals))[:limit]
+        return [
+            tuple(
+                self._choice(
+                    int(cabins[block]),
+                    int(rows[block]),
+                    int(columns[block]) + offset,
+                    passenger,
+                )
+                for offset, passenger in enumerate(passengers)
+            )
+            for block in order
+        ]
+
+
+def _row_mask(cabin, exit_row):
+    """Rows to look at given the `exit_row` filter"""
+    if exit_row is None:
+        return np.ones(len(cabin.exit_rows), dtype=bool)
+    return cabin.exit_rows if exit_row else ~cabin.exit_rows
+
+
+def _services(seat_map):
+    """Every seat service of the JSON of a seat map"""
+    for cabin in seat_map["cabins"]:
+        for row in cabin["rows"]:
+            for section in row["sections"]:
+                for element in section["elements"]:
+                    yield from element.get("available_services") or ()
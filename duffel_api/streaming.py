@@ -0,0 +1,160 @@
+"""Incremental parsing of large JSON responses, one array item at a time"""
+import codecs
+import json
+import re
+
+# Characters that matter while looking for the array: containers, strings and keys
+_STRUCTURE = re.compile(r'[{}\[\]":]')
+# Rest of a string after its opening quote, up to and including the closing one
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+# Separators between the items of the array
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+class JsonArrayParser:
+    """Parser fed with the chunks of a JSON document as they are received, returning
+    the items of the array found under `path` (e.g. `("data", "offers")`) as soon as
+    each is complete.
+
+    Only the item being received is buffered, so memory use doesn't depend on the size
+    of the document. The rest of the document is skipped without being decoded. Items
+    are parsed by the C accelerated decoder of the standard library.
+    """
+
+    def __init__(self, path):
+        self.path = tuple(path)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._text = ""
+        self._pos = 0
+        # Keys of the containers we are in, `None` for the root and array items
+        self._stack = []
+        self._key = None
+        self._last_string = None
+        self._state = "seek"
+        # Length the unparsed text must reach before trying to parse an item again
+        self._wait_for = 0
+
+    @property
+    def done(self):
+        """Whether the whole array has been read"""
+        return self._state == "done"
+
+    def feed(self, chunk):
+        """Add the next chunk of the document and return the items it completed"""
+        if self._state == "done":
+            return []
+        self._append(self._utf8.decode(chunk))
+        return self._parse(final=False)
+
+    def close(self):
+        """Mark the end of the document and return the last items.
+
+        Raises `ValueError` if the document ended in the middle of the array.
+        """
+        if self._state == "done":
+            return []
+        self._append(self._utf8.decode(b"", final=True))
+        items = self._parse(final=True)
+        if self._state == "items":
+            raise ValueError(f"the document ended inside {'.'.join(self.path)}")
+        return items
+
+    def _append(self, text):
+        """Add `text` to what is left to parse, dropping what was parsed already"""
+        pos = self._pos
+        self._text = self._text[pos:] + text
+        self._pos = 0
+
+    def _parse(self, final):
+        """Advance as far as the text received allows"""
+        if self._state == "seek":
+            self._seek()
+        if self._state == "items":
+            return self._items(final)
+        return []
+
+    def _seek(self):
+        """Skip through the document up to the opening bracket of the array"""
+        text, pos = self._text, self._pos
+        while True:
+            match = _STRUCTURE.search(text, pos)
+            if match is None:
+                self._pos = len(text)
+                return
+            start = match.start()
+            char = text[start]
+            if char == '"':
+                end = _STRING_REST.match(text, start + 1)
+                if end is None:
+                    # The string goes on in the next chunk
+                    self._pos = start
+                    return
+                self._last_string = text[start + 1 : end.end() - 1]  # noqa: E203
+                pos = end.end()
+                continue
+
+            pos = start + 1
+            if char == ":":
+                self._key = self._last_string
+            elif char in "{[":
+                self._stack.append(self._key)
+                self._key = None
+                if char == "[" and tuple(self._stack[1:]) == self.path:
+                    self._pos = pos
+                    self._state = "items"
+                    return
+            elif self._stack:
+                self._stack.pop()
+
+    def _items(self, final):
+        """Parse the complete items at the front of the text"""
+        items = []
+        text, pos = self._text, self._pos
+        while True:
+            pos = _SEPARATORS.match(text, pos).end()
+            if pos == len(text):
+                break
+            if text[pos] == "]":
+                pos += 1
+                self._state = "done"
+                break
+            if not final and len(text) - pos < self._wait_for:
+                break
+            try:
+                item, end = self._decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                # Most likely incomplete: wait for twice as much text, which keeps
+                # the number of attempts on a long item low
+                self._wait_for = 2 * (len(text) - pos)
+                break
+            if end == len(text) and not final and not isinstance(item, (dict, list)):
+                # A number may go on in the next chunk
+                break
+            items.append(item)
+            self._wait_for = 0
+            pos = end
+        self._pos = pos
+        return items
+
+
+def iter_json_array(chunks, path):
+    """Items of the array under `path` of the JSON document made of `chunks` (bytes),
+    yielded one by one as they are received
+    """
+    parser = JsonArrayParser(path)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_json_array(chunks, path):
+    """Same as `iter_json_array` for an async iterator of chunks"""
+    parser = JsonArrayParser(path)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
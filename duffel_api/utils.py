@@ -1,5 +1,7 @@
 """Assorted auxiliary functions."""
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 
@@ -29,8 +31,46 @@ def version() -> str:
     return version("duffel_api")
 
 
+DATETIME_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?Z?", re.ASCII
+)
+
+
 def parse_datetime(value: str) -> datetime:
     """Parse a datetime string regardless of having milliseconds or not."""
+    if not isinstance(value, str):
+        # Fails the way `strptime` does, e.g. for `null`, and before the cache, which
+        # can't hash lists or dicts
+        return parse_datetime_strptime(value)
+    return parse_datetime_cached(value)
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime_cached(value: str) -> datetime:
+    """`parse_datetime` of a string, cached"""
+    # Many segments share the same departure and arrival times, hence the cache. The
+    # usual shapes are parsed by hand, which is much faster than `strptime`, anything
+    # else (including invalid dates) goes through `strptime` to fail the same way.
+    match = DATETIME_PATTERN.fullmatch(value)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        try:
+            return datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                int(fraction.ljust(6, "0")) if fraction else 0,
+            )
+        except ValueError:
+            pass
+    return parse_datetime_strptime(value)
+
+
+def parse_datetime_strptime(value: str) -> datetime:
+    """Parse a datetime string with `strptime`, see `parse_datetime`"""
     # There are inconsistent formats used for the field, therefore we try to accomodate
     # instead of making an API breaking change.
     #
@@ -44,3 +84,23 @@ def parse_datetime(value: str) -> datetime:
         return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
     else:
         return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f")
+
+
+DURATION_PATTERN = re.compile(
+    r"P(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?"
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_duration(value: str) -> timedelta:
+    """Parse an ISO 8601 duration such as `PT02H26M` or `P1DT2H`.
+
+    Only days, hours, minutes and seconds are supported, which is what the API sends.
+    The same few durations come back over and over, hence the cache.
+    """
+    match = DURATION_PATTERN.fullmatch(value)
+    if match is None or value == "P" or value.endswith("T"):
+        raise ValueError(f"invalid ISO 8601 duration: {value!r}")
+    parts = {name: float(part) for name, part in match.groupdict().items() if part}
+    return timedelta(**parts)
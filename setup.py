@@ -23,4 +23,9 @@ setup(
     keywords="duffel api flights airports airlines aircraft",
     python_requires=">=3.8",
     install_requires=["requests>=2.25"],
+    extras_require={
+        "async": ["httpx>=0.23"],
+        "numpy": ["numpy"],
+        "orjson": ["orjson>=3"],
+    },
 )
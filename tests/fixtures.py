@@ -1,4 +1,5 @@
 """Auxiliary contexts for handling fixtures"""
+import copy
 import json
 from contextlib import contextmanager
 
@@ -28,3 +29,39 @@ def raw_fixture(name):
     """Yields an instance of the fixture that has been loaded as JSON."""
     with open(f"tests/fixtures/{name}.json") as fh:
         yield json.load(fh)
+
+
+def make_offer(
+    id,
+    amount=45,
+    currency="GBP",
+    carriers=("BA",),
+    flight="1",
+    departing_at="10:00",
+    duration=60,
+    to="JFK",
+):
+    """Returns the JSON of a one-way offer with a segment for each of `carriers`.
+
+    Built from the `get-offer-by-id` fixture. Segments leave at `departing_at` on
+    1 March 2100 with flight numbers `flight` followed by their position, and the last
+    one lands at `to`. A `duration` of `None` leaves it unknown."""
+    with raw_fixture("get-offer-by-id") as fixture:
+        offer = copy.deepcopy(fixture["data"])
+    slice = offer["slices"][0]
+    segment = slice["segments"][0]
+    slice["segments"] = [
+        dict(
+            segment,
+            marketing_carrier=dict(segment["marketing_carrier"], iata_code=carrier),
+            marketing_carrier_flight_number=f"{flight}{leg}",
+            departing_at=f"2100-03-01T{departing_at}:00",
+        )
+        for leg, carrier in enumerate(carriers)
+    ]
+    slice["segments"][-1]["destination"] = dict(segment["destination"], iata_code=to)
+    slice["duration"] = f"PT{duration}M" if duration is not None else None
+    offer.update(
+        id=id, total_amount=str(amount), total_currency=currency, slices=[slice]
+    )
+    return offer
@@ -0,0 +1,107 @@
+"""A minimal local HTTP server that serves fixtures over real sockets.
+
+`requests_mock` never opens a connection, which is fine for most tests but useless when
+we want to observe connection reuse, latency or concurrency. This server speaks
+HTTP/1.1 with keep-alive and counts the TCP connections it accepts.
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+def fixture_body(name):
+    """Load the fixture `name` as raw bytes"""
+    with open(f"tests/fixtures/{name}.json", "rb") as fh:
+        return fh.read()
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP server that answers with canned responses.
+
+    Routes are keyed by `(method, path)`, the query string is ignored. A route's value
+    is either a `(status_code, body)` tuple or a callable receiving the request handler
+    and returning one. `delay` adds a fixed latency (in seconds) to every response.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, routes, delay=0.0):
+        self.routes = routes
+        self.delay = delay
+        self.connections = 0
+        self.requests = []
+        self._lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), StubRequestHandler)
+
+    @property
+    def url(self):
+        """Base URL to hand to the client as `api_url`"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def verify_request(self, request, client_address):
+        """Called once per accepted connection, which is what we count"""
+        with self._lock:
+            self.connections += 1
+        return True
+
+    def record(self, method, path):
+        """Keep track of every request served"""
+        with self._lock:
+            self.requests.append((method, path))
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Resolve the route for the request and write the canned response"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, without this the client waits on
+    # delayed ACKs and every response takes ~40ms longer
+    disable_nagle_algorithm = True
+
+    def _respond(self):
+        """Shared implementation for all HTTP methods"""
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+        path = urlsplit(self.path).path
+        self.server.record(self.command, self.path)
+
+        route = self.server.routes.get((self.command, path))
+        if route is None:
+            status, body = 404, {"errors": [{"message": f"no route for {path}"}]}
+        elif callable(route):
+            status, body = route(self)
+        else:
+            status, body = route
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _respond
+
+    def log_message(self, format, *args):
+        """Keep test and benchmark output quiet"""
+
+
+@contextmanager
+def stub_server(routes, delay=0.0):
+    """Run a `StubServer` in a background thread for the duration of the block"""
+    server = StubServer(routes, delay)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
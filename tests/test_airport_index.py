@@ -0,0 +1,126 @@
+import math
+import random
+
+import pytest
+
+from duffel_api import AirportIndex, Duffel, ReferenceSnapshot
+from duffel_api.airport_index import EARTH_RADIUS_KM, haversine_km
+from duffel_api.models import Airport
+from duffel_api.reference_data import refresh
+
+from .fixtures import raw_fixture
+from .stub_server import stub_server
+
+
+def distance_km(latitude1, longitude1, latitude2, longitude2):
+    """Haversine distance, one pair of points at a time"""
+    lat1, lon1, lat2, lon2 = map(
+        math.radians, (latitude1, longitude1, latitude2, longitude2)
+    )
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def random_airports(count, seed=5):
+    """JSON of `count` airports spread evenly over the globe"""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"arp_{index}",
+            "latitude": math.degrees(math.asin(rng.uniform(-1, 1))),
+            "longitude": rng.uniform(-180, 180),
+        }
+        for index in range(count)
+    ]
+
+
+def scan(airports, latitude, longitude):
+    """Every airport with its distance to a point, nearest first"""
+    return sorted(
+        (
+            distance_km(latitude, longitude, airport["latitude"], airport["longitude"]),
+            airport["id"],
+        )
+        for airport in airports
+    )
+
+
+def test_nearest_and_within_match_a_scan():
+    airports = random_airports(2000)
+    index = AirportIndex(airports)
+    rng = random.Random(6)
+    for _ in range(100):
+        latitude, longitude = rng.uniform(-90, 90), rng.uniform(-180, 180)
+        expected = scan(airports, latitude, longitude)
+        nearest = index.nearest(latitude, longitude, k=5)
+        assert [found.airport["id"] for found in nearest] == [
+            id for _, id in expected[:5]
+        ]
+        assert [found.distance_km for found in nearest] == pytest.approx(
+            [distance for distance, _ in expected[:5]]
+        )
+        radius = rng.uniform(100, 1000)
+        assert [
+            found.airport["id"] for found in index.within(latitude, longitude, radius)
+        ] == [id for distance, id in expected if distance <= radius]
+
+
+def test_across_the_antimeridian():
+    airports = [
+        {"id": "east", "latitude": 0.0, "longitude": 179.9},
+        {"id": "west", "latitude": 0.0, "longitude": -179.9},
+        {"id": "far", "latitude": 0.0, "longitude": 170.0},
+    ]
+    index = AirportIndex(airports)
+    found = index.within(0.0, -179.95, 50)
+    assert [nearby.airport["id"] for nearby in found] == ["west", "east"]
+    assert found[1].distance_km == pytest.approx(16.68, abs=0.01)
+    assert index.nearest(0.0, 0.0, k=0) == []
+    assert len(index.nearest(0.0, 0.0, k=10)) == 3
+
+
+def test_index_of_airport_models():
+    with raw_fixture("get-airports") as fixture:
+        json = fixture["data"]
+    airports = [Airport.from_json(airport) for airport in json]
+    index = AirportIndex(airports + [dict(json[0], id="arp_nowhere", latitude=None)])
+    assert len(index) == len(airports)
+    heathrow = airports[0]
+    (nearest,) = index.nearest_many([(heathrow.latitude, heathrow.longitude)])
+    assert nearest[0].airport is heathrow
+    assert nearest[0].distance_km == pytest.approx(0.0, abs=1e-6)
+
+
+def test_index_from_snapshot(tmp_path):
+    path = str(tmp_path / "reference.sqlite")
+    empty = {"meta": {"after": None, "limit": 200}, "data": []}
+    with raw_fixture("get-airports") as fixture:
+        fixture["meta"]["after"] = None
+        routes = {
+            ("GET", "/air/airports"): (200, fixture),
+            ("GET", "/air/airlines"): (200, empty),
+            ("GET", "/air/aircraft"): (200, empty),
+        }
+    with stub_server(routes) as server:
+        refresh(path, Duffel(access_token="some_token", api_url=server.url))
+    with ReferenceSnapshot(path) as snapshot:
+        index = AirportIndex.from_snapshot(snapshot)
+    assert [airport.iata_code for airport in index.airports] == ["LHR"]
+
+
+def test_haversine_km():
+    pytest.importorskip("numpy")
+    airports = random_airports(50)
+    latitudes = [airport["latitude"] for airport in airports]
+    longitudes = [airport["longitude"] for airport in airports]
+    distances = haversine_km(51.47, -0.45, latitudes, longitudes)
+    assert distances.shape == (50,)
+    assert distances.tolist() == pytest.approx(
+        [
+            distance_km(51.47, -0.45, latitude, longitude)
+            for latitude, longitude in zip(latitudes, longitudes)
+        ]
+    )
@@ -0,0 +1,307 @@
+import asyncio
+import json
+from datetime import date
+from decimal import Decimal
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from duffel_api import ApiError, AsyncDuffel, RetryPolicy
+from duffel_api.api import AsyncOrderCreate
+
+from .stub_server import fixture_body, stub_server
+
+pytest.importorskip("httpx")
+
+
+def run(coroutine):
+    """Run `coroutine` to completion in a fresh event loop"""
+    return asyncio.run(coroutine)
+
+
+def paginated_airports(handler):
+    """Serve the airports fixture and then an empty last page"""
+    query = parse_qs(urlsplit(handler.path).query)
+    if "after" in query:
+        return 200, {"meta": {"after": None}, "data": []}
+    return 200, fixture_body("get-airports")
+
+
+def test_async_get_offer():
+    routes = {("GET", "/air/offers/id"): (200, fixture_body("get-offer-by-id"))}
+
+    async def scenario(url):
+        async with AsyncDuffel(access_token="some_token", api_url=url) as client:
+            return await client.offers.get("id")
+
+    with stub_server(routes) as server:
+        offer = run(scenario(server.url))
+        assert offer.id == "off_00009htYpSCXrwaB9DnUm0"
+        assert offer.owner.name == "British Airways"
+
+
+def test_async_create_offer_request():
+    seen = {}
+
+    def create(handler):
+        seen["query"] = urlsplit(handler.path).query
+        seen["body"] = json.loads(handler.body)
+        return 201, fixture_body("create-offer-request")
+
+    routes = {("POST", "/air/offer_requests"): create}
+
+    async def scenario(url):
+        async with AsyncDuffel(access_token="some_token", api_url=url) as client:
+            return (
+                await client.offer_requests.create()
+                .passengers([{"type": "adult"}])
+                .slices(
+                    [
+                        {
+                            "origin": "LHR",
+                            "destination": "STN",
+                            "departure_date": "2022-12-01",
+                        }
+                    ]
+                )
+                .return_offers()
+                .execute()
+            )
+
+    with stub_server(routes) as server:
+        offer_request = run(scenario(server.url))
+        assert offer_request.id == "orq_00009hjdomFOCJyxHG7k7k"
+        assert len(offer_request.offers) == 1
+        assert seen["query"] == "return_offers=true"
+        assert seen["body"]["data"]["cabin_class"] == "economy"
+
+
+def test_async_create_many_offer_requests():
+    def create(handler):
+        if json.loads(handler.body)["data"]["slices"][0]["origin"] == "XXX":
+            return 422, {
+                "meta": {"status": 422, "request_id": "FmXeZifDA60QOlgAAODB"},
+                "errors": [
+                    {
+                        "type": "validation_error",
+                        "title": "Invalid data",
+                        "message": "Field 'origin' is invalid",
+                    }
+                ],
+            }
+        return 201, fixture_body("create-offer-request")
+
+    routes = {("POST", "/air/offer_requests"): create}
+
+    async def scenario(url):
+        async with AsyncDuffel(access_token="some_token", api_url=url) as client:
+            searches = [
+                client.offer_requests.create()
+                .passengers([{"type": "adult"}])
+                .slices(
+                    [{"origin": origin, "destination": "JFK", "departure_date": day}]
+                )
+                for origin in ("LHR", "XXX")
+                for day in ("2100-02-27", "2100-02-28")
+            ]
+            batch = client.offer_requests.create_many(searches, max_concurrency=2)
+            return sorted([result async for result in batch])
+
+    with stub_server(routes, delay=0.02) as server:
+        results = run(scenario(server.url))
+        assert [result.ok for result in results] == [True, True, False, False]
+        assert results[0].result.id == "orq_00009hjdomFOCJyxHG7k7k"
+        assert results[3].error.status_code == 422
+
+
+def test_async_get_many_seat_maps():
+    routes = {("GET", "/air/seat_maps"): (200, fixture_body("get-seat-maps"))}
+
+    async def scenario(url):
+        async with AsyncDuffel(access_token="some_token", api_url=url) as client:
+            offer_ids = ["off_1", "off_2", "off_3"]
+            batch = client.seat_maps.get_many(offer_ids, max_concurrency=3)
+            results = sorted([result async for result in batch])
+            cached = [result async for result in client.seat_maps.get_many(["off_1"])]
+            fetched = await client.seat_maps.get("off_1", lazy=True)
+            return results, cached[0].result, fetched
+
+    with stub_server(routes, delay=0.02) as server:
+        results, cached, fetched = run(scenario(server.url))
+        # Only get() fetched again, get_many() cached the seat maps
+        assert len(server.requests) == 4
+    assert [result.request for result in results] == ["off_1", "off_2", "off_3"]
+    assert results[0].result[0].cabins[0].aisles == 2
+    assert cached == fetched == results[0].result
+
+
+def test_async_calendar():
+    def create(handler):
+        slices = json.loads(handler.body)["data"]["slices"]
+        response = json.loads(fixture_body("create-offer-request"))
+        day = int(slices[0]["departure_date"][-2:])
+        response["data"]["offers"][0]["total_amount"] = f"{100 + day}.00"
+        return 201, response
+
+    routes = {("POST", "/air/offer_requests"): create}
+
+    async def scenario(url):
+        async with AsyncDuffel(access_token="some_token", api_url=url) as client:
+            return await client.offer_requests.calendar(
+                "LHR",
+                "JFK",
+                [{"type": "adult"}],
+                [date(2100, 3, 1), date(2100, 3, 2)],
+                max_concurrency=2,
+            )
+
+    with stub_server(routes) as server:
+        calendar = run(scenario(server.url))
+        assert calendar.complete
+        assert calendar.matrix() == [[Decimal("101.00")], [Decimal("102.00")]]
+
+
+def test_async_calendar_stops_early():
+    routes = {
+        ("POST", "/air/offer_requests"): (201, fixture_body("create-offer-request"))
+    }
+
+    async def scenario(url):
+        async with AsyncDuffel(access_token="some_token", api_url=url) as client:
+            return await client.offer_requests.calendar(
+                "LHR",
+                "JFK",
+                [{"type": "adult"}],
+                [date(2100, 3, 1), date(2100, 3, 2), date(2100, 3, 3)],
+                max_concurrency=1,
+                stop_when=lambda calendar: bool(calendar.fares),
+            )
+
+    with stub_server(routes) as server:
+        calendar = run(scenario(server.url))
+        assert len(server.requests) == 1
+    assert list(calendar.fares) == [(date(2100, 3, 1), None)]
+
+
+def test_async_stream_offers():
+    routes = {
+        ("POST", "/air/offer_requests"): (201, fixture_body("create-offer-request"))
+    }
+
+    async def scenario(url):
+        async with AsyncDuffel(access_token="some_token", api_url=url) as client:
+            offers = (
+                client.offer_requests.create()
+                .passengers([{"type": "adult"}])
+                .slices(
+                    [
+                        {
+                            "origin": "LHR",
+                            "destination": "STN",
+                            "departure_date": "2022-12-01",
+                        }
+                    ]
+                )
+                .stream()
+            )
+            return [offer async for offer in offers]
+
+    with stub_server(routes) as server:
+        offers = run(scenario(server.url))
+        assert [offer.id for offer in offers] == ["off_00009htYpSCXrwaB9DnUm0"]
+        assert server.requests == [("POST", "/air/offer_requests?return_offers=true")]
+
+
+def test_async_pagination():
+    routes = {("GET", "/air/airports"): paginated_airports}
+
+    async def scenario(url):
+        async with AsyncDuffel(access_token="some_token", api_url=url) as client:
+            return [airport async for airport in client.airports.list()]
+
+    with stub_server(routes) as server:
+        airports = run(scenario(server.url))
+        assert [airport.iata_code for airport in airports] == ["LHR"]
+        assert len(server.requests) == 2
+
+
+def test_async_clients_share_one_transport():
+    routes = {
+        ("GET", "/air/aircraft/id"): (200, fixture_body("get-aircraft-by-id")),
+        ("GET", "/air/airlines/id"): (200, fixture_body("get-airline-by-id")),
+    }
+
+    async def scenario(url):
+        async with AsyncDuffel(access_token="some_token", api_url=url) as client:
+            assert client.aircraft._transport is client.airlines._transport
+            return await asyncio.gather(
+                client.aircraft.get("id"),
+                client.airlines.get("id"),
+                client.aircraft.get("id"),
+            )
+
+    with stub_server(routes) as server:
+        aircraft, airline, _ = run(scenario(server.url))
+        assert aircraft.name == "Airbus Industries A380"
+        assert airline.name == "British Airways"
+
+
+def test_async_api_error():
+    error = {
+        "meta": {"status": 500, "request_id": "FmXeZifDA60QOlgAAODB"},
+        "errors": [
+            {
+                "type": "airline_error",
+                "title": "Unexpected Airline Error",
+                "message": "The airline responded with an unexpected error.",
+                "code": "airline_unknown",
+            }
+        ],
+    }
+    routes = {("GET", "/air/orders/id"): (500, error)}
+
+    async def scenario(url):
+        async with AsyncDuffel(access_token="some_token", api_url=url) as client:
+            return await client.orders.get("id")
+
+    with stub_server(routes) as server:
+        with pytest.raises(ApiError) as excinfo:
+            run(scenario(server.url))
+        assert excinfo.value.meta["request_id"] == "FmXeZifDA60QOlgAAODB"
+
+
+def test_async_create_order_validates_before_sending():
+    async def scenario():
+        async with AsyncDuffel(access_token="some_token") as client:
+            await client.orders.create().execute()
+
+    with pytest.raises(AsyncOrderCreate.InvalidNumberOfPassengers):
+        run(scenario())
+
+
+def test_async_retry():
+    attempts = []
+
+    def flaky(handler):
+        attempts.append(handler.path)
+        if len(attempts) == 1:
+            return 503, {
+                "meta": {"status": 503, "request_id": "FmXeZifDA60QOlgAAODB"},
+                "errors": [{"type": "api_error", "title": "Down", "message": "Down"}],
+            }
+        return 200, fixture_body("get-airline-by-id")
+
+    routes = {("GET", "/air/airlines/id"): flaky}
+
+    async def scenario(url):
+        async with AsyncDuffel(
+            access_token="some_token",
+            api_url=url,
+            retry=RetryPolicy(backoff_factor=0.01),
+        ) as client:
+            return await client.airlines.get("id")
+
+    with stub_server(routes) as server:
+        airline = run(scenario(server.url))
+        assert airline.name == "British Airways"
+        assert len(attempts) == 2
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from duffel_api import ApiError, BatchResult, ClientError, Duffel
+from duffel_api.batch import run_batch, run_batch_async
+
+from .stub_server import fixture_body, stub_server
+
+ERROR = {
+    "meta": {"status": 422, "request_id": "FmXeZifDA60QOlgAAODB"},
+    "errors": [
+        {
+            "type": "validation_error",
+            "title": "Invalid data",
+            "message": "Field 'origin' is invalid",
+        }
+    ],
+}
+
+
+class Tracker:
+    """Counts how many calls run at the same time"""
+
+    def __init__(self):
+        self.running = 0
+        self.most_running = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        """A call starts"""
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+
+    def __exit__(self, *exc_info):
+        """A call ends"""
+        with self.lock:
+            self.running -= 1
+
+
+def test_run_batch():
+    tracker = Tracker()
+
+    def send(value):
+        with tracker:
+            time.sleep(0.01)
+            if value == 3:
+                raise ValueError("three")
+            return value * 2
+
+    results = list(run_batch(range(10), send, max_concurrency=4))
+    assert sorted(result.position for result in results) == list(range(10))
+    assert tracker.most_running == 4
+
+    failed = [result for result in results if not result.ok]
+    assert len(failed) == 1
+    assert (failed[0].position, failed[0].request) == (3, 3)
+    assert str(failed[0].error) == "three"
+    assert BatchResult(5, 5, result=10) in results
+
+
+def test_run_batch_yields_as_requests_finish():
+    results = run_batch([0.2, 0.01], time.sleep, max_concurrency=2)
+    assert [result.request for result in results] == [0.01, 0.2]
+
+
+def test_run_batch_stops_taking_requests():
+    taken = []
+
+    def requests():
+        for index in range(100):
+            taken.append(index)
+            yield index
+
+    results = run_batch(requests(), lambda value: value, max_concurrency=2)
+    next(results)
+    results.close()
+    assert len(taken) <= 3
+
+
+def test_run_batch_validates_concurrency():
+    with pytest.raises(ClientError):
+        run_batch([], print, max_concurrency=0)
+
+
+def test_run_batch_async():
+    tracker = Tracker()
+
+    async def send(value):
+        with tracker:
+            await asyncio.sleep(0.01)
+            if value == 3:
+                raise ValueError("three")
+            return value * 2
+
+    async def scenario():
+        return [result async for result in run_batch_async(range(10), send, 3)]
+
+    results = asyncio.run(scenario())
+    assert sorted(result.position for result in results) == list(range(10))
+    assert tracker.most_running == 3
+    assert [result.position for result in results if not result.ok] == [3]
+
+
+def test_create_many():
+    def create(handler):
+        body = json.loads(handler.body)
+        if body["data"]["slices"][0]["origin"] == "XXX":
+            return 422, ERROR
+        return 201, fixture_body("create-offer-request")
+
+    routes = {("POST", "/air/offer_requests"): create}
+    with stub_server(routes, delay=0.05) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        searches = [
+            client.offer_requests.create()
+            .passengers([{"type": "adult"}])
+            .slices([{"origin": origin, "destination": "JFK", "departure_date": day}])
+            for origin in ("LHR", "XXX")
+            for day in ("2100-02-27", "2100-02-28", "2100-03-01")
+        ]
+        started = time.perf_counter()
+        results = list(client.offer_requests.create_many(searches, max_concurrency=6))
+        elapsed = time.perf_counter() - started
+
+    assert len(results) == 6
+    assert elapsed < 0.05 * 6
+    by_index = sorted(results)
+    for result in by_index[:3]:
+        assert result.result.id == "orq_00009hjdomFOCJyxHG7k7k"
+    for result in by_index[3:]:
+        assert isinstance(result.error, ApiError)
+        assert result.error.status_code == 422
+    assert [result.request for result in by_index] == searches
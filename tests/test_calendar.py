@@ -0,0 +1,149 @@
+import json
+from datetime import date
+from decimal import Decimal
+
+from duffel_api import ApiError, BatchResult, CalendarFare, Duffel, FareCalendar
+from duffel_api.calendar import date_window
+
+from .stub_server import fixture_body, stub_server
+
+
+def priced_offer_requests(handler):
+    """Answer offer requests with two offers priced after their dates, and fail
+    those departing on 2100-03-02
+    """
+    slices = json.loads(handler.body)["data"]["slices"]
+    dates = [date.fromisoformat(slice["departure_date"]) for slice in slices]
+    if dates[0] == date(2100, 3, 2):
+        return 422, {
+            "meta": {"status": 422, "request_id": "FmXeZifDA60QOlgAAODB"},
+            "errors": [
+                {
+                    "type": "validation_error",
+                    "title": "Invalid data",
+                    "message": "No flights on this day",
+                }
+            ],
+        }
+
+    response = json.loads(fixture_body("create-offer-request"))
+    offer = response["data"]["offers"][0]
+    price = 100 + sum(day.day for day in dates)
+    response["data"]["offers"] = [
+        dict(offer, id=f"off_{price + extra}", total_amount=f"{price + extra}.50")
+        for extra in (30, 0)
+    ]
+    return 201, response
+
+
+def test_date_window():
+    assert date_window(date(2100, 3, 1), 1) == [
+        date(2100, 2, 28),
+        date(2100, 3, 1),
+        date(2100, 3, 2),
+    ]
+
+
+def test_fare_calendar_cells():
+    calendar = FareCalendar(
+        [date(2100, 3, 2), date(2100, 3, 1)], [date(2100, 3, 1), date(2100, 3, 5)]
+    )
+    assert calendar.cells == [
+        (date(2100, 3, 1), date(2100, 3, 1)),
+        (date(2100, 3, 1), date(2100, 3, 5)),
+        (date(2100, 3, 2), date(2100, 3, 5)),
+    ]
+    assert FareCalendar([date(2100, 3, 1)]).cells == [(date(2100, 3, 1), None)]
+    assert FareCalendar.slices("LHR", "JFK", calendar.cells[0])[1] == {
+        "origin": "JFK",
+        "destination": "LHR",
+        "departure_date": "2100-03-01",
+    }
+
+
+def test_calendar():
+    routes = {("POST", "/air/offer_requests"): priced_offer_requests}
+    with stub_server(routes) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        calendar = client.offer_requests.calendar(
+            "LHR",
+            "JFK",
+            [{"type": "adult"}],
+            departure_dates=date_window(date(2100, 3, 1), 1),
+            return_dates=[date(2100, 3, 1), date(2100, 3, 10)],
+            max_concurrency=3,
+        )
+        assert len(server.requests) == 5
+
+    assert calendar.complete
+    assert calendar.cheapest(date(2100, 2, 28), date(2100, 3, 10)) == CalendarFare(
+        "off_138", Decimal("138.50"), "GBP"
+    )
+    assert calendar.matrix() == [
+        [Decimal("129.50"), Decimal("138.50")],
+        [Decimal("102.50"), Decimal("111.50")],
+        [None, None],
+    ]
+    (cell, error), *_ = calendar.errors.items()
+    assert cell == (date(2100, 3, 2), date(2100, 3, 10))
+    assert isinstance(error, ApiError)
+
+
+def test_one_way_calendar():
+    routes = {("POST", "/air/offer_requests"): priced_offer_requests}
+    with stub_server(routes) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        calendar = client.offer_requests.calendar(
+            "LHR", "JFK", [{"type": "adult"}], [date(2100, 3, 1), date(2100, 3, 3)]
+        )
+    assert calendar.matrix() == [[Decimal("101.50")], [Decimal("103.50")]]
+
+
+def test_calendar_stops_early():
+    routes = {("POST", "/air/offer_requests"): priced_offer_requests}
+    with stub_server(routes) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        calendar = client.offer_requests.calendar(
+            "LHR",
+            "JFK",
+            [{"type": "adult"}],
+            date_window(date(2100, 3, 10), 3),
+            max_concurrency=1,
+            stop_when=lambda calendar: len(calendar.fares) >= 2,
+        )
+        assert len(server.requests) == 2
+    assert not calendar.complete
+    assert len(calendar.fares) == 2
+
+
+def test_fare_calendar_compares_one_currency():
+    class Offer:
+        """The fields of an offer the calendar reads"""
+
+        def __init__(self, id, total_amount, total_currency):
+            self.id = id
+            self.total_amount = total_amount
+            self.total_currency = total_currency
+
+    class Search:
+        """An offer request with its offers"""
+
+        def __init__(self, *offers):
+            self.offers = [Offer(*offer) for offer in offers]
+
+    cell = (date(2100, 3, 1), None)
+    search = Search(("off_1", "120.00", "GBP"), ("off_2", "90.00", "USD"))
+    calendar = FareCalendar([date(2100, 3, 1)])
+    calendar.add(BatchResult(0, cell, result=search))
+    assert calendar.currency == "GBP"
+    assert calendar.cheapest(*cell) == CalendarFare("off_1", Decimal("120.00"), "GBP")
+    assert calendar.skipped == 1
+
+    calendar = FareCalendar([date(2100, 3, 1)], currency="USD")
+    calendar.add(BatchResult(0, cell, result=search))
+    assert calendar.cheapest(*cell).offer_id == "off_2"
+
+    calendar = FareCalendar([date(2100, 3, 1)], currency="EUR")
+    calendar.add(BatchResult(0, cell, result=search))
+    assert calendar.cheapest(*cell) is None
+    assert calendar.skipped == 2
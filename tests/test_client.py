@@ -0,0 +1,57 @@
+from duffel_api import Duffel, SearchCache, SeatMapCache
+
+from .stub_server import fixture_body, stub_server
+
+
+def test_clients_share_one_transport():
+    client = Duffel(access_token="some_token", api_url="http://someaddress")
+    assert client.offers._transport is client.transport
+    assert client.orders._transport is client.transport
+    assert client.seat_maps.http_session is client.airports.http_session
+
+
+def test_transport_settings_are_not_passed_to_requests():
+    client = Duffel(
+        access_token="some_token",
+        api_url="http://someaddress",
+        timeout=5,
+        pool_maxsize=4,
+        keep_alive=False,
+    )
+    assert client.offers._settings == {"timeout": 5}
+    adapter = client.transport.session.get_adapter("http://someaddress")
+    assert adapter._pool_maxsize == 4
+
+
+def test_caches_are_only_given_to_their_clients():
+    search_cache, seat_map_cache = SearchCache(), SeatMapCache()
+    client = Duffel(
+        access_token="some_token",
+        api_url="http://someaddress",
+        timeout=5,
+        search_cache=search_cache,
+        seat_map_cache=seat_map_cache,
+    )
+    assert client.offer_requests._search_cache is search_cache
+    assert client.seat_maps._seat_map_cache is seat_map_cache
+    for other in (client.offer_requests, client.seat_maps, client.airports):
+        assert other._settings == {"timeout": 5}
+    assert not hasattr(client.airports, "_search_cache")
+    assert not hasattr(client.airports, "_seat_map_cache")
+
+
+def test_clients_reuse_connections():
+    routes = {
+        ("GET", "/air/aircraft/id"): (200, fixture_body("get-aircraft-by-id")),
+        ("GET", "/air/airlines/id"): (200, fixture_body("get-airline-by-id")),
+        ("GET", "/air/airports/id"): (200, fixture_body("get-airport-by-id")),
+    }
+    with stub_server(routes) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        for _ in range(3):
+            client.aircraft.get("id")
+            client.airlines.get("id")
+            client.airports.get("id")
+        client.close()
+        assert len(server.requests) == 9
+        assert server.connections == 1
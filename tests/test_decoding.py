@@ -0,0 +1,195 @@
+from dataclasses import field
+from datetime import date, datetime
+from typing import Optional, Sequence
+
+import pytest
+
+from duffel_api.models import Airport, City, LazyOffer, Offer, OfferRequest, Order
+from duffel_api.models.decoding import (
+    JsonModel,
+    datetime_format,
+    from_json_with,
+    json_metadata,
+    projection,
+)
+from duffel_api.models.offer import OFFER_DECODERS
+from duffel_api.models.offer_request import OfferRequestSlice
+from duffel_api.models.slotted import slotted_dataclass
+
+from .fixtures import raw_fixture
+
+
+@slotted_dataclass
+class Leaf(JsonModel):
+    code: str
+
+
+@slotted_dataclass
+class Tree(JsonModel):
+    id: str
+    name: Optional[str]
+    leaf: Optional[Leaf]
+    leaves: Sequence[Leaf]
+    created_at: datetime
+    planted_on: Optional[date]
+
+
+@slotted_dataclass
+class Overridden(JsonModel):
+    fare: Optional[str] = field(metadata=json_metadata(key="fare_basis"))
+    count: int = field(metadata=json_metadata(decode=int))
+    updated_at: datetime = field(
+        metadata=json_metadata(decode=datetime_format("%Y-%m-%dT%H:%M:%SZ"))
+    )
+    note: str = field(default="none", metadata=json_metadata(required=False))
+
+
+TREE = {
+    "id": "tre_1",
+    "name": "oak",
+    "leaf": {"code": "a"},
+    "leaves": [{"code": "b"}, {"code": "c"}],
+    "created_at": "2020-01-17T10:12:14.545Z",
+    "planted_on": "2019-03-01",
+}
+
+
+def test_from_json_follows_the_annotations():
+    tree = Tree.from_json(TREE)
+    assert tree == Tree(
+        id="tre_1",
+        name="oak",
+        leaf=Leaf("a"),
+        leaves=[Leaf("b"), Leaf("c")],
+        created_at=datetime(2020, 1, 17, 10, 12, 14, 545000),
+        planted_on=date(2019, 3, 1),
+    )
+
+
+def test_from_json_is_compiled_once():
+    Tree.from_json(TREE)
+    decoder = vars(Tree)["from_json"]
+    Tree.from_json(TREE)
+    assert vars(Tree)["from_json"] is decoder
+    assert "from_json" in vars(Leaf)
+
+
+def test_missing_and_null_values():
+    minimal = {"id": "tre_1", "created_at": "2020-01-17T10:12:14Z"}
+    tree = Tree.from_json(minimal)
+    assert (tree.name, tree.leaf, tree.planted_on) == (None, None, None)
+    assert tree.leaves == []
+    # Every instance gets its own list
+    assert Tree.from_json(minimal).leaves is not tree.leaves
+
+    tree = Tree.from_json(dict(minimal, leaf=None, leaves=None, planted_on=None))
+    assert (tree.leaf, tree.leaves, tree.planted_on) == (None, None, None)
+
+    with pytest.raises(KeyError):
+        Tree.from_json({"id": "tre_1"})
+
+
+def test_key_error_in_optional_values_gives_the_default():
+    tree = Tree.from_json(dict(TREE, leaf={}, leaves=[{"code": "b"}, {}]))
+    assert tree.leaf is None
+    assert tree.leaves == []
+
+
+def test_json_field_overrides():
+    value = Overridden.from_json(
+        {"fare_basis": "Y20", "count": "3", "updated_at": "2022-05-10T09:00:00Z"}
+    )
+    assert value == Overridden(
+        fare="Y20", count=3, updated_at=datetime(2022, 5, 10, 9), note="none"
+    )
+    assert Overridden.from_json(
+        {"count": 1, "note": "hi", "updated_at": "2022-05-10T09:00:00Z"}
+    ) == Overridden(fare=None, count=1, note="hi", updated_at=datetime(2022, 5, 10, 9))
+
+    with pytest.raises(ValueError):
+        Overridden.from_json({"count": 1, "updated_at": "2022-05-10T09:00:00.123Z"})
+
+
+def test_lazy_decoders_match_from_json():
+    with raw_fixture("get-offer-by-id") as fixture:
+        json = fixture["data"]
+    offer = Offer.from_json(json)
+    for name, decode in OFFER_DECODERS.items():
+        assert decode(json) == getattr(offer, name)
+
+
+def test_projection():
+    record = projection(Tree, ["leaves", "id"])
+    assert record.__name__ == "TreeRecord"
+    assert projection(Tree, ("leaves", "id")) is record
+
+    tree = record.from_json(dict(TREE, created_at="not parsed", leaf={}))
+    assert tree == ([Leaf("b"), Leaf("c")], "tre_1")
+    assert tree.id == "tre_1"
+    assert record.from_json({"id": "tre_2"}).leaves == []
+
+    with pytest.raises(ValueError, match="Tree has no field 'code'"):
+        projection(Tree, ["id", "code"])
+    with pytest.raises(ValueError):
+        projection(Tree, [])
+
+
+def test_projection_of_offers():
+    with raw_fixture("get-offer-by-id") as fixture:
+        json = fixture["data"]
+    offer = Offer.from_json(json)
+    record = projection(Offer, ["id", "owner", "slices"]).from_json(json)
+    assert record == (offer.id, offer.owner, offer.slices)
+
+
+def test_null_required_values_fail_as_the_hand_written_decoders_did():
+    with raw_fixture("get-offer-by-id") as fixture:
+        json = fixture["data"]
+    slice = json["slices"][0]
+    segment = dict(slice["segments"][0], origin=None)
+    # Nested models read their keys from `null`, datetimes call its `endswith`
+    with pytest.raises(TypeError, match="not subscriptable"):
+        Offer.from_json(dict(json, owner=None))
+    with pytest.raises(TypeError, match="not subscriptable"):
+        Offer.from_json(dict(json, slices=[dict(slice, segments=[segment])]))
+    with pytest.raises(AttributeError, match="endswith"):
+        Offer.from_json(dict(json, created_at=None))
+    with pytest.raises(AttributeError, match="endswith"):
+        Offer.from_json(dict(json, updated_at=[]))
+
+    with raw_fixture("get-order-by-id") as fixture:
+        json = fixture["data"]
+    with pytest.raises(AttributeError, match="endswith"):
+        Order.from_json(dict(json, created_at=None))
+
+
+def test_offer_request_decoders():
+    with raw_fixture("create-offer-request") as fixture:
+        json = fixture["data"]
+    offer_request = OfferRequest.from_json(json)
+    assert isinstance(offer_request.slices[0].origin, Airport)
+    assert isinstance(offer_request.offers[0], Offer)
+    lazy = OfferRequest.from_json(json, lazy_offers=True)
+    assert isinstance(lazy.offers[0], LazyOffer)
+    assert lazy.offers[0].id == offer_request.offers[0].id
+
+    # The type of a place picks its model, unknown types keep the JSON
+    city = {"id": "cit_lon_gb", "name": "London", "iata_code": "LON"}
+    city["iata_country_code"] = "GB"
+    slice = dict(json["slices"][0], destination_type="city", destination=city)
+    slice.update(origin_type="region", origin={"id": "reg_1"})
+    offer_request = OfferRequest.from_json(dict(json, slices=[slice]))
+    assert offer_request.slices[0].destination == City.from_json(city)
+    assert offer_request.slices[0].origin == {"id": "reg_1"}
+    del slice["origin_type"]
+    with pytest.raises(KeyError):
+        OfferRequestSlice.from_json(slice)
+    # As with `get_and_transform`, a `KeyError` in a list leaves the default
+    assert OfferRequest.from_json(dict(json, slices=[slice])).slices == []
+
+
+def test_from_json_with():
+    decode = from_json_with(Tree, leaves=lambda json: json["code"])
+    tree = decode(Tree, TREE)
+    assert tree.leaves == ["b", "c"]
+    assert tree.leaf == Leaf("a")
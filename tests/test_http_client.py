@@ -1,6 +1,12 @@
 import pytest
 
-from duffel_api.http_client import HttpClient, ApiError
+from duffel_api.http_client import (
+    ApiError,
+    ClientError,
+    HttpClient,
+    HttpTransport,
+    Pagination,
+)
 
 
 def test_http_client(requests_mock):
@@ -30,3 +36,99 @@ def test_http_client_error(requests_mock):
     ) as excinfo:
         client.do_get("/api/stuff")
     assert excinfo.value.meta["request_id"] == "FmXeZifDA60QOlgAAODB"
+
+
+def test_http_client_builds_its_own_transport():
+    client = HttpClient("some_token", "http://someaddress", "v1")
+    assert isinstance(client._transport, HttpTransport)
+    assert client.http_session is client._transport.session
+    assert client.http_session.headers["Authorization"] == "Bearer some_token"
+    assert client.http_session.headers["Duffel-Version"] == "v1"
+
+
+def test_http_client_uses_given_transport(requests_mock):
+    requests_mock.get("http://someaddress/api/stuff", json={})
+    transport = HttpTransport("some_token")
+    client = HttpClient(api_url="http://someaddress", transport=transport)
+    assert client.http_session is transport.session
+    assert client.do_get("/api/stuff") == {}
+    assert requests_mock.last_request.headers["Authorization"] == "Bearer some_token"
+
+
+def test_http_transport_pool_settings():
+    transport = HttpTransport(
+        "some_token", pool_connections=2, pool_maxsize=32, keep_alive=False
+    )
+    adapter = transport.session.get_adapter("https://api.duffel.com")
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+    assert transport.session.headers["Connection"] == "close"
+
+
+def test_http_transport_requires_access_token(monkeypatch):
+    monkeypatch.delenv("DUFFEL_ACCESS_TOKEN", raising=False)
+    with pytest.raises(ClientError):
+        HttpTransport()
+
+
+class Entry:
+    @staticmethod
+    def from_json(json):
+        return json["id"]
+
+
+def mock_pages(requests_mock, pages):
+    """Register `pages` lists of ids as consecutive pages of /api/stuff"""
+    for index, ids in enumerate(pages):
+        after = str(index + 1) if index + 1 < len(pages) else None
+        query = "limit=50" if index == 0 else f"limit=50&after={index}"
+        requests_mock.get(
+            f"http://someaddress/api/stuff?{query}",
+            complete_qs=True,
+            json={"meta": {"after": after}, "data": [{"id": id_} for id_ in ids]},
+        )
+
+
+def paginate(prefetch):
+    client = HttpClient("some_token", "http://someaddress", "v1")
+    client._url = "/api/stuff"
+    return Pagination(client, Entry, {"limit": 50}, prefetch=prefetch)
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_pagination(requests_mock, prefetch):
+    mock_pages(requests_mock, [[1, 2], [3], [4, 5, 6], []])
+    assert list(paginate(prefetch)) == [1, 2, 3, 4, 5, 6]
+    assert requests_mock.call_count == 4
+
+
+def test_pagination_prefetch_stops_when_consumer_stops(requests_mock):
+    mock_pages(requests_mock, [[1], [2], [3], [4], [5], [6]])
+    entries = iter(paginate(1))
+    assert next(entries) == 1
+    entries.close()
+    # The fetcher may be one page ahead plus the one waiting for room in the buffer
+    assert requests_mock.call_count <= 3
+
+
+def test_pagination_prefetch_raises_api_errors(requests_mock):
+    mock_pages(requests_mock, [[1], [2]])
+    error = {
+        "meta": {"status": 500, "request_id": "FmXeZifDA60QOlgAAODB"},
+        "errors": [{"type": "api_error", "title": "Boom", "message": "Boom"}],
+    }
+    requests_mock.get(
+        "http://someaddress/api/stuff?limit=50&after=1",
+        complete_qs=True,
+        json=error,
+        status_code=500,
+    )
+    entries = iter(paginate(2))
+    assert next(entries) == 1
+    with pytest.raises(ApiError, match="Boom"):
+        next(entries)
+
+
+def test_pagination_rejects_negative_prefetch():
+    with pytest.raises(ClientError):
+        paginate(-1)
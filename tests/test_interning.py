@@ -0,0 +1,94 @@
+import dataclasses
+import threading
+
+import pytest
+
+from duffel_api.models import REFERENCE_POOL, Airline, Airport, Offer, ReferencePool
+
+from .fixtures import raw_fixture
+
+
+def test_offers_share_reference_models():
+    REFERENCE_POOL.clear()
+    with raw_fixture("get-offers") as fixture:
+        first = Offer.from_json(fixture["data"][0])
+    with raw_fixture("get-offers") as fixture:
+        second = Offer.from_json(fixture["data"][0])
+    assert first is not second
+    assert first.owner is second.owner
+    segment = first.slices[0].segments[0]
+    assert segment.origin is second.slices[0].segments[0].origin
+    assert segment.aircraft is second.slices[0].segments[0].aircraft
+
+
+def test_reference_models_are_frozen():
+    with raw_fixture("get-airline-by-id") as fixture:
+        airline = Airline.from_json(fixture["data"])
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        airline.name = "Other Airways"
+
+
+def test_changed_reference_data_is_not_shared():
+    REFERENCE_POOL.clear()
+    with raw_fixture("get-airport-by-id") as fixture:
+        airport = Airport.from_json(fixture["data"])
+        renamed = Airport.from_json(dict(fixture["data"], name="Renamed"))
+    assert renamed.name == "Renamed"
+    assert airport.name != "Renamed"
+
+
+def test_reference_pool_is_bounded():
+    pool = ReferencePool(maxsize=2)
+    built = []
+
+    def build(cls, json):
+        built.append(json["id"])
+        return cls(json["id"], json["id"], None)
+
+    for id_ in ("a", "b", "a", "c", "b", "a"):
+        pool.get(Airline, {"id": id_}, build)
+    assert built == ["a", "b", "c", "b", "a"]
+    assert len(pool) == 2
+
+
+def test_reference_pool_disabled():
+    pool = ReferencePool(maxsize=0)
+    json = {"id": "a", "name": "A", "iata_code": None}
+
+    def build(cls, value):
+        return cls(**value)
+
+    assert pool.get(Airline, json, build) is not pool.get(Airline, json, build)
+    assert len(pool) == 0
+
+
+def test_reference_pool_leaves_invalid_json_to_the_decoder():
+    with raw_fixture("get-offer-by-id") as fixture:
+        json = fixture["data"]
+    # A null model fails as without the pool, IDs which aren't strings aren't pooled
+    with pytest.raises(TypeError, match="not subscriptable"):
+        Offer.from_json(dict(json, owner=None))
+    owner = Offer.from_json(dict(json, owner=dict(json["owner"], id=["arl_1"]))).owner
+    assert owner.id == ["arl_1"]
+
+
+def test_reference_pool_is_thread_safe():
+    pool = ReferencePool(maxsize=8)
+    json = [{"id": str(i), "name": str(i), "iata_code": None} for i in range(16)]
+    results = []
+
+    def parse():
+        for _ in range(200):
+            results.extend(
+                pool.get(Airline, entry, lambda cls, value: cls(**value))
+                for entry in json
+            )
+
+    threads = [threading.Thread(target=parse) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 4 * 200 * 16
+    assert all(result.id == result.name for result in results)
+    assert len(pool) == 8
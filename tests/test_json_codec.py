@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from duffel_api import ApiError, Duffel, JsonCodec, OrjsonCodec
+from duffel_api.http_client import HttpClient
+from duffel_api.json_codec import default_codec
+
+from .stub_server import fixture_body
+
+
+class CountingCodec(JsonCodec):
+    def __init__(self):
+        self.loaded = []
+        self.dumped = []
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+    def dumps(self, value):
+        self.dumped.append(value)
+        return super().dumps(value)
+
+
+def test_json_codec_round_trip():
+    codec = JsonCodec()
+    value = {"name": "Zürich", "amount": "12.50", "list": [1, None, True]}
+    encoded = codec.dumps(value)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == value
+
+
+def test_orjson_codec_matches_stdlib():
+    pytest.importorskip("orjson")
+    body = fixture_body("get-offers")
+    assert OrjsonCodec().loads(body) == json.loads(body)
+    assert isinstance(default_codec(), OrjsonCodec)
+
+
+def test_http_client_decodes_and_encodes_with_codec(requests_mock):
+    requests_mock.post("http://someaddress/api/stuff", json={"data": {"id": "x"}})
+    codec = CountingCodec()
+    client = HttpClient("some_token", "http://someaddress", "v1", json_codec=codec)
+    assert client.do_post("/api/stuff", body={"data": {"a": 1}}) == {
+        "data": {"id": "x"}
+    }
+    assert codec.dumped == [{"data": {"a": 1}}]
+    # Decoded straight from the raw bytes
+    assert codec.loaded == [b'{"data": {"id": "x"}}']
+    request = requests_mock.last_request
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.body == b'{"data":{"a":1}}'
+
+
+def test_http_client_decodes_errors_with_codec(requests_mock):
+    error = {
+        "meta": {"status": 422, "request_id": "FmXeZifDA60QOlgAAODB"},
+        "errors": [{"type": "validation_error", "title": "Invalid", "message": "bad"}],
+    }
+    requests_mock.get("http://someaddress/api/stuff", json=error, status_code=422)
+    codec = CountingCodec()
+    client = HttpClient("some_token", "http://someaddress", "v1", json_codec=codec)
+    with pytest.raises(ApiError, match="bad") as excinfo:
+        client.do_get("/api/stuff")
+    assert excinfo.value.status_code == 422
+    assert len(codec.loaded) == 1
+
+
+def test_duffel_passes_codec_to_every_client(requests_mock):
+    requests_mock.get(
+        "http://someaddress/air/aircraft/arc_00009UhD4ongolulWd91Ky",
+        content=fixture_body("get-aircraft-by-id"),
+    )
+    codec = CountingCodec()
+    client = Duffel(
+        access_token="some_token", api_url="http://someaddress", json_codec=codec
+    )
+    client.aircraft.get("arc_00009UhD4ongolulWd91Ky")
+    assert client.offers._json_codec is codec
+    assert len(codec.loaded) == 1
@@ -1,4 +1,6 @@
-from duffel_api.models import Offer
+import pytest
+
+from duffel_api.models import LazyOffer, Offer
 
 from .fixtures import raw_fixture
 
@@ -13,3 +15,35 @@ def test_offer_model_parsing_with_nullable_payment_requirements():
     name = "get-offer-by-id-with-null-payment-requirements"
     with raw_fixture(name) as fixture:
         assert Offer.from_json(fixture["data"])
+
+
+def test_lazy_offer_builds_fields_on_first_access():
+    with raw_fixture("get-offer-by-id") as fixture:
+        offer = LazyOffer.from_json(fixture["data"])
+        # Nothing is decoded upfront
+        assert list(vars(offer)) == ["_json"]
+
+        assert offer.total_amount == "45.00"
+        assert offer.owner.name == "British Airways"
+        assert set(vars(offer)) == {"_json", "total_amount", "owner"}
+        # Decoded fields are kept
+        assert offer.owner is offer.owner
+
+
+def test_lazy_offer_matches_offer():
+    with raw_fixture("get-offer-by-id") as fixture:
+        offer = Offer.from_json(fixture["data"])
+        lazy_offer = LazyOffer.from_json(fixture["data"])
+        assert lazy_offer.slices == offer.slices
+        assert lazy_offer.to_model() == offer
+        assert lazy_offer == offer
+        assert offer == lazy_offer
+        assert "total_amount" in dir(lazy_offer)
+        assert repr(lazy_offer) == "LazyOffer(id='off_00009htYpSCXrwaB9DnUm0')"
+
+
+def test_lazy_offer_unknown_attribute():
+    with raw_fixture("get-offer-by-id") as fixture:
+        offer = LazyOffer.from_json(fixture["data"])
+        with pytest.raises(AttributeError, match="no attribute 'price'"):
+            offer.price
@@ -0,0 +1,113 @@
+import random
+from datetime import time, timedelta
+
+import pytest
+
+from duffel_api import ClientError, OfferIndex
+from duffel_api.models import LazyOffer, Offer, OfferRequest
+
+from .fixtures import make_offer, raw_fixture
+
+
+def offers():
+    """A handful of offers differing on every indexed field"""
+    return [
+        make_offer("off_a"),
+        make_offer("off_b", carriers=("BA", "AA"), departing_at="23:30", duration=300),
+        make_offer("off_c", carriers=("AA",), departing_at="05:45", to="EWR"),
+        make_offer("off_d", carriers=("LH", "LH", "BA"), duration=None),
+    ]
+
+
+def matches(offer, airlines, max_stops, max_duration, start, end):
+    """Whether a one-way offer passes the filters, found by looking at it"""
+    slice = offer["slices"][0]
+    segments = slice["segments"]
+    departing_at = segments[0]["departing_at"]
+    minute = int(departing_at[11:13]) * 60 + int(departing_at[14:16])
+    return (
+        {segment["marketing_carrier"]["iata_code"] for segment in segments} <= airlines
+        and len(segments) - 1 <= max_stops
+        and slice["duration"] is not None
+        and int(slice["duration"][2:-1]) <= max_duration
+        and start <= minute <= end
+    )
+
+
+def test_offer_index_filters():
+    index = OfferIndex(offers())
+    assert len(index) == 4
+    assert index.ids() == ["off_a", "off_b", "off_c", "off_d"]
+    assert index.ids(airlines="BA") == ["off_a"]
+    assert index.ids(airlines=("BA", "AA")) == ["off_a", "off_b", "off_c"]
+    assert index.ids(max_stops=0) == ["off_a", "off_c"]
+    assert index.ids(max_stops=1) == ["off_a", "off_b", "off_c"]
+    assert index.ids(max_duration=60) == ["off_a", "off_c"]
+    assert index.ids(max_duration=timedelta(hours=5)) == ["off_a", "off_b", "off_c"]
+    assert index.ids(departing_between=(time(6), time(12))) == ["off_a", "off_d"]
+    assert index.ids(departing_between=(time(22), time(6))) == ["off_b", "off_c"]
+    assert index.ids(arriving_at="EWR") == ["off_c"]
+    assert index.ids(arriving_at=("JFK", "EWR"), airlines="AA") == ["off_c"]
+    assert index.ids(arriving_at="JFK", on_slice=1) == []
+    assert index.count(max_stops=1, departing_between=(time(23), time(23, 59))) == 1
+    assert index.ids(departing_between=("22:00", "06:00")) == ["off_b", "off_c"]
+    for bounds in (("10:30", "12"), ("25:00", "06:00"), (time(6), 12)):
+        with pytest.raises(ClientError):
+            index.query(departing_between=bounds)
+    with pytest.raises(ClientError):
+        index.query(departing_between=("1030", "12:00"), on_slice=3)
+
+
+def test_offer_index_of_models():
+    json = offers()
+    models = OfferIndex([Offer.from_json(offer) for offer in json])
+    lazy = OfferIndex([LazyOffer.from_json(offer) for offer in json])
+    filters = {"airlines": ("BA", "AA"), "departing_between": (time(5), time(11))}
+    assert models.ids(**filters) == lazy.ids(**filters) == ["off_a", "off_c"]
+    assert [offer.id for offer in models.filter(**filters)] == ["off_a", "off_c"]
+
+
+def test_offer_index_from_offer_request():
+    with raw_fixture("create-offer-request") as fixture:
+        json = fixture["data"]
+    ids = [offer["id"] for offer in json["offers"]]
+    assert OfferIndex.from_offer_request(json).ids() == ids
+    assert OfferIndex.from_offer_request(OfferRequest.from_json(json)).ids() == ids
+
+
+def test_offer_index_matches_a_scan():
+    rng = random.Random(3)
+    carriers = ["BA", "AA", "LH", "AF"]
+    json = [
+        make_offer(
+            f"off_{position}",
+            carriers=rng.choices(carriers, k=rng.randint(1, 3)),
+            departing_at=f"{rng.randint(0, 23):02}:{rng.randint(0, 59):02}",
+            duration=rng.choice([None, rng.randint(60, 900)]),
+            to=rng.choice(["JFK", "EWR", "LGA"]),
+        )
+        for position in range(500)
+    ]
+    index = OfferIndex(json)
+    for _ in range(50):
+        airlines = set(rng.sample(carriers, 2))
+        max_stops = rng.randint(0, 2)
+        max_duration = rng.randint(60, 900)
+        start, end = sorted([rng.randint(0, 1439), rng.randint(0, 1439)])
+        expected = [
+            offer["id"]
+            for offer in json
+            if matches(offer, airlines, max_stops, max_duration, start, end)
+        ]
+        assert (
+            index.ids(
+                airlines=airlines,
+                max_stops=max_stops,
+                max_duration=max_duration,
+                departing_between=(
+                    time(start // 60, start % 60),
+                    time(end // 60, end % 60),
+                ),
+            )
+            == expected
+        )
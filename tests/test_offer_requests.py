@@ -1,6 +1,7 @@
 import pytest
 
 from duffel_api.api import OfferRequestCreate
+from duffel_api.models import LazyOffer
 
 from .fixtures import fixture
 
@@ -16,6 +17,15 @@ def test_get_offer_request_by_id(requests_mock):
         assert slice.origin_type == "airport"
 
 
+def test_get_offer_request_by_id_fields(requests_mock):
+    url = "air/offer_requests/id"
+    with fixture("get-offer-request-by-id", url, requests_mock.get, 200) as client:
+        offer_request = client.offer_requests.get("id", fields=["id", "slices"])
+        assert offer_request.id == "orq_00009hjdomFOCJyxHG7k7k"
+        assert offer_request.slices[0].origin_type == "airport"
+        assert offer_request._fields == ("id", "slices")
+
+
 def test_get_offer_requests(requests_mock):
     # We need a way to ensure pagination finished in a mocking environment
     end_pagination_url = (
@@ -59,6 +69,30 @@ def test_create_offer_request(requests_mock):
         assert offer.id == "off_00009htYpSCXrwaB9DnUm0"
 
 
+def test_create_offer_request_with_lazy_offers(requests_mock):
+    url = "air/offer_requests?return_offers=true"
+    with fixture("create-offer-request", url, requests_mock.post, 201) as client:
+        offer_request = (
+            client.offer_requests.create()
+            .passengers([{"type": "adult"}])
+            .slices(
+                [
+                    {
+                        "departure_date": "2100-02-27",
+                        "destination": "LGW",
+                        "origin": "LIS",
+                    }
+                ]
+            )
+            .return_offers()
+            .lazy_offers()
+            .execute()
+        )
+        offer = offer_request.offers[0]
+        assert isinstance(offer, LazyOffer)
+        assert offer.id == "off_00009htYpSCXrwaB9DnUm0"
+
+
 def test_create_offer_request_with_invalid_data(requests_mock):
     url = "air/offer_requests?return_offers=false"
     with fixture("create-offer-request", url, requests_mock.post, 422) as client:
@@ -0,0 +1,134 @@
+import copy
+import random
+
+import pytest
+
+from duffel_api import ClientError, deduplicate_offers, pareto_front
+from duffel_api.models import LazyOffer, Offer
+from duffel_api.offer_selection import itinerary_key
+
+from .fixtures import make_offer, raw_fixture
+
+
+def dominated(offer, others):
+    """Whether another offer is at least as good on every criterion and better on one"""
+
+    def criteria(offer):
+        """Price, duration and stops"""
+        slice = offer["slices"][0]
+        return (
+            float(offer["total_amount"]),
+            int(slice["duration"][2:-1]),
+            len(slice["segments"]) - 1,
+        )
+
+    mine = criteria(offer)
+    return any(
+        all(a <= b for a, b in zip(criteria(other), mine)) and criteria(other) != mine
+        for other in others
+    )
+
+
+def test_itinerary_key():
+    with raw_fixture("get-offer-by-id") as fixture:
+        json = fixture["data"]
+    other_brand = dict(json, id="off_2", total_amount="1.00")
+    assert itinerary_key(json) == itinerary_key(other_brand)
+    assert itinerary_key(json) == itinerary_key(Offer.from_json(json))
+    assert itinerary_key(json) == itinerary_key(LazyOffer.from_json(json))
+    assert itinerary_key(make_offer("a", 1)) != itinerary_key(
+        make_offer("a", 1, flight="2")
+    )
+    assert hash(itinerary_key(json))
+
+
+def test_deduplicate_offers_given_models_and_json():
+    with raw_fixture("get-offer-by-id") as fixture:
+        json = fixture["data"]
+    model = Offer.from_json(dict(json, total_amount="500.00"))
+    # The same departure, written with a UTC marker and with fractional seconds
+    variants = []
+    for id_, departing_at, amount in (
+        ("off_z", "2020-06-13T16:38:02Z", "400.00"),
+        ("off_fraction", "2020-06-13T16:38:02.000", "300.00"),
+    ):
+        variant = copy.deepcopy(json)
+        variant.update(id=id_, total_amount=amount)
+        for slice in variant["slices"]:
+            for segment in slice["segments"]:
+                if segment["departing_at"] == "2020-06-13T16:38:02":
+                    segment["departing_at"] = departing_at
+        variants.append(variant)
+    lazy = LazyOffer.from_json(dict(variants[0], id="off_lazy", total_amount="350.00"))
+
+    kept = deduplicate_offers([model, variants[0], lazy, variants[1]])
+    assert [offer["id"] for offer in kept] == ["off_fraction"]
+    assert itinerary_key(model) == itinerary_key(variants[0])
+
+
+def test_itinerary_key_without_carrier_code():
+    offer = make_offer("a", 1)
+    del offer["slices"][0]["segments"][0]["marketing_carrier"]["iata_code"]
+    key = itinerary_key(offer)
+    assert key[0][0] is None
+
+
+def test_deduplicate_offers():
+    offers = [
+        make_offer("a", 100),
+        make_offer("b", 90, flight="2"),
+        make_offer("c", 80),
+        make_offer("d", 80),
+    ]
+    assert [offer["id"] for offer in deduplicate_offers(offers)] == ["b", "c"]
+
+
+def test_pareto_front():
+    offers = [
+        make_offer("slow", 100, duration=300),
+        make_offer("fast", 200, duration=60, flight="2"),
+        make_offer("dominated", 250, duration=90, flight="3"),
+        make_offer("cheap_stop", 50, carriers=("BA", "BA"), duration=400, flight="4"),
+        make_offer("slow_too", 100, duration=300),
+    ]
+    front = pareto_front(offers)
+    assert [offer["id"] for offer in front] == [
+        "slow",
+        "fast",
+        "cheap_stop",
+        "slow_too",
+    ]
+    assert pareto_front(deduplicate_offers(offers)) == front[:3]
+
+
+def test_pareto_front_matches_brute_force():
+    rng = random.Random(7)
+    offers = [
+        make_offer(
+            str(index),
+            rng.randint(50, 80),
+            duration=rng.randint(60, 90),
+            carriers=("BA",) * rng.randint(1, 3),
+            flight=str(index),
+        )
+        for index in range(300)
+    ]
+    expected = [offer for offer in offers if not dominated(offer, offers)]
+    assert pareto_front(offers) == expected
+
+
+def test_pareto_front_of_offers():
+    with raw_fixture("get-offer-by-id") as fixture:
+        json = fixture["data"]
+    offers = [
+        Offer.from_json(dict(json, id=f"off_{amount}", total_amount=f"{amount}.00"))
+        for amount in (30, 10, 20)
+    ]
+    assert [offer.id for offer in pareto_front(offers)] == ["off_10"]
+    assert [offer.id for offer in deduplicate_offers(offers)] == ["off_10"]
+
+
+def test_mixed_currencies():
+    offers = [make_offer("a", 1), make_offer("b", 1, currency="EUR")]
+    with pytest.raises(ClientError):
+        pareto_front(offers)
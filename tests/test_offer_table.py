@@ -0,0 +1,105 @@
+import copy
+
+import pytest
+
+from duffel_api import OfferTable
+from duffel_api.models import LazyOffer
+
+from .fixtures import raw_fixture
+
+np = pytest.importorskip("numpy")
+
+
+def offers():
+    with raw_fixture("get-offers") as fixture:
+        offer = fixture["data"][0]
+    variants = [
+        ("off_a", "45.00", "PT02H26M", 1, "2020-06-13T16:38:02"),
+        ("off_b", "30.50", "PT05H00M", 2, "2020-06-13T09:00:00"),
+        ("off_c", "30.50", "PT01H10M", 1, "2020-06-14T07:15:00"),
+        ("off_d", "120.00", None, 1, "2020-06-12T22:00:00"),
+    ]
+    result = []
+    for id_, amount, duration, segments, departing_at in variants:
+        variant = copy.deepcopy(offer)
+        variant.update(id=id_, total_amount=amount)
+        slice = variant["slices"][0]
+        slice["duration"] = duration
+        slice["segments"] = slice["segments"] * segments
+        slice["segments"][0] = dict(slice["segments"][0], departing_at=departing_at)
+        result.append(variant)
+    return result
+
+
+def test_offer_table_columns():
+    table = OfferTable.from_json(offers())
+    assert len(table) == 4
+    assert table.ids == ["off_a", "off_b", "off_c", "off_d"]
+    assert table["total_amount"].tolist() == [45.0, 30.5, 30.5, 120.0]
+    assert table["total_currency"].tolist() == ["GBP"] * 4
+    assert table["owner"].tolist() == ["BA"] * 4
+    assert table["slice_durations"].tolist() == [
+        [146, 146],
+        [300, 146],
+        [70, 146],
+        [-1, 146],
+    ]
+    assert table["duration"].tolist() == [292, 446, 216, 146]
+    assert table["stops"].tolist() == [0, 1, 0, 0]
+    assert table["departing_at"][1] == np.datetime64("2020-06-13T09:00:00")
+    assert table["total_emissions_kg"].tolist() == [460.0] * 4
+
+
+def test_offer_table_filter_sort_and_top():
+    table = OfferTable.from_json(offers())
+    direct = table.filter(table["stops"] == 0)
+    assert direct.ids == ["off_a", "off_c", "off_d"]
+    assert direct["position"].tolist() == [0, 2, 3]
+
+    assert table.sort("total_amount", "duration").ids == [
+        "off_c",
+        "off_b",
+        "off_a",
+        "off_d",
+    ]
+    assert table.sort("departing_at", descending=True).ids == [
+        "off_c",
+        "off_a",
+        "off_b",
+        "off_d",
+    ]
+    assert table.top(2).ids == ["off_b", "off_c"]
+    assert table.top(1, "duration", largest=True).ids == ["off_b"]
+    assert table.top(10, "duration").ids == ["off_d", "off_c", "off_a", "off_b"]
+    assert len(table.top(0)) == 0
+
+
+def test_offer_table_descending_sort_is_stable():
+    table = OfferTable.from_json(offers())
+    # off_b and off_c cost the same, and keep their order
+    assert table.sort("total_amount", descending=True).ids == [
+        "off_d",
+        "off_a",
+        "off_b",
+        "off_c",
+    ]
+    assert table.sort("total_currency", descending=True).ids == table.ids
+    assert table.sort("owner", "total_amount", descending=True).ids == [
+        "off_d",
+        "off_a",
+        "off_b",
+        "off_c",
+    ]
+    assert table.top(3, largest=True).ids == ["off_d", "off_a", "off_b"]
+
+
+def test_offer_table_from_lazy_offers():
+    data = offers()
+    table = OfferTable.from_json([LazyOffer.from_json(offer) for offer in data])
+    assert table.ids == [offer["id"] for offer in data]
+
+
+def test_offer_table_empty():
+    table = OfferTable.from_json([])
+    assert len(table) == 0
+    assert table.top(3).ids == []
@@ -2,6 +2,7 @@ import pytest
 from .fixtures import fixture
 
 from duffel_api.api import OfferClient
+from duffel_api.models import LazyOffer
 
 
 def test_get_offer_by_id(requests_mock):
@@ -140,3 +141,20 @@ def test_offer_update_passenger_with_invalid_data(requests_mock):
                 "Amelia",
                 [{"account_number": "", "airline_iata_code": "BA"}],
             )
+
+
+def test_get_offers_lazy(requests_mock):
+    url = "air/offers?limit=50&offer_request_id=offer_request_id"
+    with fixture("get-offers", url, requests_mock.get, 200) as client:
+        requests_mock.get(
+            "http://someaddress/air/offers?limit=50"
+            + "&offer_request_id=offer_request_id"
+            + "&after=g2wAAAACbQAAABBBZXJvbWlzdC1LaGFya2l2bQAAAB%3D",
+            complete_qs=True,
+            json={"meta": {"after": None}, "data": []},
+        )
+        offers = list(client.offers.list("offer_request_id", lazy=True))
+        assert len(offers) == 1
+        assert isinstance(offers[0], LazyOffer)
+        assert offers[0].id == "off_00009htYpSCXrwaB9DnUm0"
+        assert offers[0].slices[0].segments[0].id == "seg_00009htYpSCXrwaB9Dn456"
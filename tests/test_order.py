@@ -1,4 +1,4 @@
-from duffel_api.models import Order
+from duffel_api.models import LazyOrder, Order
 
 from .fixtures import raw_fixture
 
@@ -7,3 +7,11 @@ def test_order_model_parsing():
     name = "get-order-by-id"
     with raw_fixture(name) as fixture:
         assert Order.from_json(fixture["data"])
+
+
+def test_lazy_order_matches_order():
+    name = "get-order-by-id"
+    with raw_fixture(name) as fixture:
+        order = LazyOrder.from_json(fixture["data"])
+        assert order.booking_reference == "RZPNX8"
+        assert order == Order.from_json(fixture["data"])
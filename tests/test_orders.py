@@ -72,6 +72,28 @@ def test_get_orders(requests_mock):
         assert order.synced_at == datetime(2020, 4, 11, 15, 48, 11)
 
 
+def test_get_orders_fields(requests_mock):
+    requests_mock.get(
+        "http://someaddress/air/orders?limit=50"
+        + "&after=g2wAAAACbQAAABBBZXJvbWlzdC1LaGFya2l2bQAAAB%3D",
+        complete_qs=True,
+        json={"meta": {"after": None}, "data": []},
+    )
+
+    url = "air/orders?limit=50"
+    with fixture("get-orders", url, requests_mock.get, 200) as client:
+        fields = ("id", "booking_reference", "total_amount", "payment_status")
+        orders = list(client.orders.list(fields=fields))
+        assert len(orders) == 1
+        order = orders[0]
+        assert type(order).__name__ == "OrderRecord"
+        assert order._fields == fields
+        assert order.id == "ord_00009hthhsUZ8W4LxQgkjo"
+        assert order.booking_reference == "RZPNX8"
+        assert order.payment_status.awaiting_payment is True
+        assert not hasattr(order, "slices")
+
+
 def test_create_instant_order(requests_mock):
     url = "air/orders"
     with fixture("create-instant-order", url, requests_mock.post, 201) as client:
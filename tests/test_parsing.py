@@ -0,0 +1,99 @@
+"""Parse every fixture with its model, making sure parsing has no side effects.
+
+The time each fixture takes to parse is recorded as a test property, which ends up in
+the JUnit XML report (`pytest --junitxml=report.xml`), so that regressions in the
+`from_json` path can be spotted.
+"""
+import os
+import time
+
+import pytest
+
+from duffel_api.models import (
+    Aircraft,
+    Airline,
+    Airport,
+    Offer,
+    OfferPassenger,
+    OfferRequest,
+    Order,
+    OrderCancellation,
+    OrderChange,
+    OrderChangeOffer,
+    OrderChangeRequest,
+    Payment,
+    PaymentIntent,
+    Refund,
+    SeatMap,
+    Webhook,
+)
+
+from .fixtures import raw_fixture
+
+# Model each fixture is parsed with, `None` for responses the client doesn't parse
+MODELS = {
+    "confirm-order-cancellation": OrderCancellation,
+    "confirm-order-change": OrderChange,
+    "confirm-payment-intent": PaymentIntent,
+    "create-hold-order": Order,
+    "create-instant-order": Order,
+    "create-offer-request": OfferRequest,
+    "create-order-cancellation": OrderCancellation,
+    "create-order-change-request": OrderChangeRequest,
+    "create-order-change": OrderChange,
+    "create-partial-offer-request": OfferRequest,
+    "create-payment-intent": PaymentIntent,
+    "create-payment": Payment,
+    "create-webhook": Webhook,
+    "get-aircraft-by-id": Aircraft,
+    "get-aircraft": Aircraft,
+    "get-airline-by-id": Airline,
+    "get-airline-without-iata-code": Airline,
+    "get-airlines": Airline,
+    "get-airport-by-id": Airport,
+    "get-airports": Airport,
+    "get-offer-by-id-with-null-payment-requirements": Offer,
+    "get-offer-by-id": Offer,
+    "get-offer-request-by-id": OfferRequest,
+    "get-offer-requests": OfferRequest,
+    "get-offers": Offer,
+    "get-order-by-id": Order,
+    "get-order-cancellation-by-id": OrderCancellation,
+    "get-order-cancellations": OrderCancellation,
+    "get-order-change-by-id": OrderChange,
+    "get-order-change-offer-by-id": OrderChangeOffer,
+    "get-order-change-offers-by-order-change-request-id": OrderChangeOffer,
+    "get-order-change-request-by-id": OrderChangeRequest,
+    "get-orders": Order,
+    "get-partial-offer-request-by-id": OfferRequest,
+    "get-partial-offer-request-fares-by-id": OfferRequest,
+    "get-payment-intent-by-id": PaymentIntent,
+    "get-refund-by-id": Refund,
+    "get-seat-maps": SeatMap,
+    "ping-webhook": None,
+    "update-offer-passenger-by-id": OfferPassenger,
+    "update-order-by-id": Order,
+    "update-webhook": Webhook,
+}
+
+
+def test_every_fixture_has_a_model():
+    fixtures = {name[:-5] for name in os.listdir("tests/fixtures")}
+    assert fixtures == set(MODELS)
+
+
+@pytest.mark.parametrize("name", sorted(MODELS))
+def test_parsing_has_no_side_effects(name, capfd, record_property):
+    model = MODELS[name]
+    if model is None:
+        pytest.skip("the response isn't parsed")
+    with raw_fixture(name) as fixture:
+        data = fixture["data"]
+    entries = data if isinstance(data, list) else [data]
+
+    start = time.perf_counter()
+    models = [model.from_json(entry) for entry in entries]
+    record_property("parse_seconds", time.perf_counter() - start)
+
+    assert all(isinstance(parsed, model) for parsed in models)
+    assert capfd.readouterr() == ("", "")
@@ -0,0 +1,169 @@
+import pytest
+
+from duffel_api import ClientError, Duffel, PlaceIndex, ReferenceSnapshot
+from duffel_api.models import Airport, Place
+from duffel_api.place_index import _one_edit_apart, normalise
+from duffel_api.reference_data import refresh
+
+from .fixtures import raw_fixture
+from .stub_server import stub_server
+
+
+def airports():
+    """JSON of Heathrow (the fixture), Gatwick, Charles de Gaulle and Zürich, which
+    belongs to no city
+    """
+    with raw_fixture("get-airports") as fixture:
+        heathrow = fixture["data"][0]
+    paris = {"iata_code": "PAR", "iata_country_code": "FR", "id": "cit_par_fr"}
+    return [
+        heathrow,
+        dict(
+            heathrow, id="arp_lgw_gb", name="Gatwick", iata_code="LGW", icao_code="EGKK"
+        ),
+        dict(
+            heathrow,
+            id="arp_cdg_fr",
+            name="Aéroport Paris-Charles de Gaulle",
+            iata_code="CDG",
+            icao_code="LFPG",
+            iata_country_code="FR",
+            city=dict(paris, name="Paris"),
+        ),
+        dict(
+            heathrow,
+            id="arp_zrh_ch",
+            name="Zürich Airport",
+            iata_code="ZRH",
+            icao_code="LSZH",
+            iata_country_code="CH",
+            city=None,
+        ),
+    ]
+
+
+def codes(places):
+    """IATA codes of cities and airports"""
+    return [place.iata_code for place in places]
+
+
+def test_lookups_by_code():
+    index = PlaceIndex(airports())
+    assert index.airports_by_iata["LGW"].name == "Gatwick"
+    assert index.airports_by_icao["LFPG"].iata_code == "CDG"
+    assert index.cities["LON"].name == "London"
+    assert codes(index.airports_by_city["LON"]) == ["LHR", "LGW"]
+    assert codes(index.airports_by_country["FR"]) == ["CDG"]
+    assert codes(index.expand("LON")) == ["LHR", "LGW"]
+    assert codes(index.expand("ZRH")) == ["ZRH"]
+    assert index.expand("XXX") == []
+    assert index.city_of("EGKK").iata_code == "LON"
+    assert index.city_of("ZRH") is None
+    assert index.city_of("XXX") is None
+
+
+def test_index_of_models_and_places():
+    json = airports()
+    city = {
+        "type": "city",
+        "id": "cit_lon_gb",
+        "name": "London",
+        "iata_city_code": "LON",
+        "iata_country_code": "GB",
+        "airports": json[:2],
+    }
+    for items in (
+        [Airport.from_json(airport) for airport in json],
+        [Place.from_json(city)] + json[2:],
+        [city] + json[2:],
+    ):
+        index = PlaceIndex(items)
+        assert codes(index.airports_by_iata.values()) == ["LHR", "LGW", "CDG", "ZRH"]
+    # A city without its airports adds none
+    bare = {key: value for key, value in city.items() if key != "airports"}
+    for items in ([bare], [dict(city, airports=None)], [Place.from_json(bare)]):
+        assert len(PlaceIndex(items).airports_by_iata) == 0
+    with pytest.raises(ClientError):
+        PlaceIndex([Place.from_json(dict(json[0], type="airport"))])
+
+
+def test_index_of_a_city_whose_airports_name_no_city():
+    json = [dict(airport, city=None) for airport in airports()[:2]]
+    city = {
+        "type": "city",
+        "id": "cit_lon_gb",
+        "name": "London",
+        "iata_city_code": "LON",
+        "iata_country_code": "GB",
+        "airports": json,
+    }
+    for item in (city, Place.from_json(city)):
+        index = PlaceIndex([item])
+        assert index.cities["LON"].name == "London"
+        assert codes(index.expand("LON")) == ["LHR", "LGW"]
+        assert index.city_of("LGW").iata_code == "LON"
+        assert codes(index.search("london")) == ["LON", "LHR", "LGW"]
+
+
+def test_search():
+    index = PlaceIndex(airports())
+    # Cities first, then their airports
+    assert codes(index.search("lon")) == ["LON", "LHR", "LGW"]
+    assert codes(index.search("London Gat")) == ["LGW"]
+    assert codes(index.search("par")) == ["PAR", "CDG"]
+    assert codes(index.search("LFPG")) == ["CDG"]
+    assert codes(index.search("lon", limit=1)) == ["LON"]
+    # Accents are optional
+    assert codes(index.search("zurich")) == ["ZRH"]
+    assert codes(index.search("aeroport charles")) == ["CDG"]
+    # An exact word ranks above a prefix
+    assert codes(index.search("paris")) == ["PAR", "CDG"]
+    assert index.search("  ") == []
+    assert index.search("lon zzz") == []
+
+
+def test_search_forgives_a_typo_per_word():
+    index = PlaceIndex(airports())
+    assert codes(index.search("heatrow")) == ["LHR"]
+    assert codes(index.search("Heathorw")) == ["LHR"]
+    assert codes(index.search("gatwik london")) == ["LGW"]
+    assert codes(index.search("zurichh")) == ["ZRH"]
+    assert codes(index.search("lodnon")) == ["LON", "LHR", "LGW"]
+    # Too short to guess
+    assert index.search("lgx") == []
+    # Two typos in a word
+    assert index.search("hetarow") == []
+    # Typos rank after exact matches, rather than being left out
+    field = dict(
+        airports()[0], id="arp_ldf", name="Londn Field", iata_code="LDF", city=None
+    )
+    index = PlaceIndex(airports() + [dict(field, icao_code="XLDF")])
+    assert codes(index.search("london")) == ["LON", "LHR", "LGW", "LDF"]
+
+
+def test_one_edit_apart():
+    assert _one_edit_apart("london", "london")
+    assert _one_edit_apart("london", "londn")
+    assert _one_edit_apart("londn", "london")
+    assert _one_edit_apart("london", "lomdon")
+    assert _one_edit_apart("london", "lodnon")
+    assert not _one_edit_apart("london", "ldonno")
+    assert not _one_edit_apart("london", "lond")
+    assert normalise("Zürich-Kloten  Airport") == ["zurich", "kloten", "airport"]
+
+
+def test_index_from_snapshot(tmp_path):
+    path = str(tmp_path / "reference.sqlite")
+    empty = {"meta": {"after": None, "limit": 200}, "data": []}
+    with raw_fixture("get-airports") as fixture:
+        fixture["meta"]["after"] = None
+        routes = {
+            ("GET", "/air/airports"): (200, fixture),
+            ("GET", "/air/airlines"): (200, empty),
+            ("GET", "/air/aircraft"): (200, empty),
+        }
+    with stub_server(routes) as server:
+        refresh(path, Duffel(access_token="some_token", api_url=server.url))
+    with ReferenceSnapshot(path) as snapshot:
+        index = PlaceIndex.from_snapshot(snapshot)
+    assert codes(index.search("heathrow")) == ["LHR"]
@@ -0,0 +1,115 @@
+import threading
+
+import pytest
+
+from duffel_api import Duffel, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_bursts_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    # The next callers queue up behind each other
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, clock=clock)
+    for _ in range(10):
+        bucket.reserve()
+    clock.now = 0.5
+    assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.1)
+
+
+def test_token_bucket_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_token_bucket_adapts_to_remaining_quota():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, clock=clock)
+    bucket.update({"ratelimit-remaining": "10", "ratelimit-reset": "5"})
+    assert bucket.rate == 2
+    assert [bucket.reserve() for _ in range(10)] == [0] * 10
+    assert bucket.reserve() == 0.5
+
+    # Once the quota is exhausted the next request waits for the reset
+    bucket.update({"ratelimit-remaining": "0", "ratelimit-reset": "30"})
+    assert bucket.rate == pytest.approx(1 / 30)
+
+    # and it never goes faster than the configured rate
+    bucket.update({"ratelimit-remaining": "1000", "ratelimit-reset": "1"})
+    assert bucket.rate == 100
+
+
+def test_token_bucket_ignores_missing_headers():
+    bucket = TokenBucket(rate=5)
+    bucket.update({})
+    bucket.update({"ratelimit-remaining": "abc", "ratelimit-reset": "10"})
+    assert bucket.rate == 5
+
+
+def test_token_bucket_is_thread_safe():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, capacity=1, clock=clock)
+    bucket.reserve()
+    delays = []
+    lock = threading.Lock()
+
+    def reserve_many():
+        for _ in range(50):
+            delay = bucket.reserve()
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=reserve_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every caller got its own slot, none were handed out twice
+    assert sorted(round(delay * 100) for delay in delays) == list(range(1, 401))
+
+
+def test_rate_limiter_is_shared_by_all_clients(requests_mock):
+    calls = []
+
+    class RecordingLimiter(RateLimiter):
+        def reserve(self, tokens=1):
+            calls.append("reserve")
+            return 0.0
+
+        def update(self, headers):
+            calls.append(headers.get("ratelimit-remaining"))
+
+    requests_mock.get(
+        "http://someaddress/air/airlines/id",
+        json={"data": {"id": "id", "name": "Duffel Airways"}},
+        headers={"ratelimit-remaining": "41", "ratelimit-reset": "10"},
+    )
+    requests_mock.get(
+        "http://someaddress/air/aircraft/id",
+        json={"data": {"id": "id", "iata_code": "380", "name": "A380"}},
+        headers={"ratelimit-remaining": "40", "ratelimit-reset": "10"},
+    )
+    limiter = RecordingLimiter()
+    client = Duffel(
+        access_token="some_token", api_url="http://someaddress", rate_limiter=limiter
+    )
+    assert client.airlines._rate_limiter is client.aircraft._rate_limiter
+    client.airlines.get("id")
+    client.aircraft.get("id")
+    assert calls == ["reserve", "41", "reserve", "40"]
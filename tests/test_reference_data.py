@@ -0,0 +1,114 @@
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from duffel_api import ClientError, Duffel, ReferenceSnapshot
+from duffel_api.reference_data import main, refresh
+
+from .stub_server import fixture_body, stub_server
+
+
+def paginated(name, change=None):
+    """Route serving the list fixture `name`, with `change` applied to its items,
+    and then an empty last page
+    """
+
+    def serve(handler):
+        """Answer one page"""
+        query = parse_qs(urlsplit(handler.path).query)
+        assert query["limit"] == ["200"]
+        if "after" in query:
+            return 200, {"meta": {"after": None, "limit": 200}, "data": []}
+        body = json.loads(fixture_body(name))
+        if change is not None:
+            body["data"] = change(body["data"])
+        return 200, body
+
+    return serve
+
+
+def routes(change_airports=None):
+    """Routes of the three lists of reference data"""
+    return {
+        ("GET", "/air/airports"): paginated("get-airports", change_airports),
+        ("GET", "/air/airlines"): paginated("get-airlines"),
+        ("GET", "/air/aircraft"): paginated("get-aircraft"),
+    }
+
+
+def test_refresh_and_lookups(tmp_path):
+    path = str(tmp_path / "reference.sqlite")
+    with stub_server(routes()) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        changes = refresh(path, client)
+        assert len(server.requests) == 6
+
+    assert changes["airports"] == {"added": 1, "updated": 0, "removed": 0}
+    with ReferenceSnapshot(path) as snapshot:
+        heathrow = snapshot.airports["arp_lhr_gb"]
+        assert heathrow.name == "Heathrow"
+        assert snapshot.airports.by_iata["LHR"] == heathrow
+        assert snapshot.airports.by_icao["EGLL"] == heathrow
+        assert snapshot.airports.get("arp_xxx") is None
+        assert "LHR" in snapshot.airports.by_iata
+        assert list(snapshot.airports) == ["arp_lhr_gb"]
+        assert len(snapshot.airlines) == len(
+            json.loads(fixture_body("get-airlines"))["data"]
+        )
+        assert snapshot.airlines.by_iata["BA"].name == "British Airways"
+        assert snapshot.aircraft.by_iata["380"].name == "Airbus Industries A380"
+        assert snapshot.refreshed_at("airports") is not None
+
+
+def test_incremental_refresh(tmp_path):
+    path = str(tmp_path / "reference.sqlite")
+
+    def renamed(airports):
+        """Heathrow renamed, plus a new airport"""
+        new = dict(airports[0], id="arp_lgw_gb", iata_code="LGW", icao_code="EGKK")
+        return [dict(airports[0], name="London Heathrow"), new]
+
+    with stub_server(routes()) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        refresh(path, client)
+        snapshot = ReferenceSnapshot(path)
+        # Nothing is downloaded while the snapshot is fresh
+        assert refresh(path, client, max_age=3600) == {}
+        assert len(server.requests) == 6
+
+    with stub_server(routes(change_airports=renamed)) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        changes = refresh(path, client)
+
+    assert changes["airports"] == {"added": 1, "updated": 1, "removed": 0}
+    assert changes["airlines"] == {"added": 0, "updated": 0, "removed": 0}
+    # An open snapshot sees the new data
+    assert snapshot.airports.by_iata["LHR"].name == "London Heathrow"
+    assert snapshot.airports.by_icao["EGKK"].id == "arp_lgw_gb"
+
+    with stub_server(routes(change_airports=lambda airports: [])) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        assert refresh(path, client, kinds=("airports",)) == {
+            "airports": {"added": 0, "updated": 0, "removed": 2}
+        }
+    assert len(snapshot.airports) == 0
+    snapshot.close()
+
+
+def test_snapshot_errors(tmp_path):
+    with pytest.raises(ClientError):
+        ReferenceSnapshot(str(tmp_path / "missing.sqlite"))
+    with pytest.raises(ClientError):
+        refresh(str(tmp_path / "reference.sqlite"), None, kinds=("hotels",))
+
+
+def test_refresh_command(tmp_path, monkeypatch, capsys):
+    path = str(tmp_path / "reference.sqlite")
+    with stub_server(routes()) as server:
+        monkeypatch.setattr(
+            "duffel_api.reference_data.Duffel",
+            lambda: Duffel(access_token="some_token", api_url=server.url),
+        )
+        assert main(["refresh", path, "--kind", "airports"]) == 0
+    assert capsys.readouterr().out == "airports: 1 added, 0 updated, 0 removed\n"
@@ -0,0 +1,199 @@
+import time
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from duffel_api import ApiError, Duffel, RetryPolicy
+from duffel_api.retry import rate_limit_delay
+
+from .fixtures import raw_fixture
+
+ERROR = {
+    "meta": {"status": 503, "request_id": "FmXeZifDA60QOlgAAODB"},
+    "errors": [
+        {
+            "type": "api_error",
+            "title": "Service unavailable",
+            "message": "Try again later",
+        }
+    ],
+}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the sleeps instead of waiting"""
+    recorded = []
+    monkeypatch.setattr(time, "sleep", recorded.append)
+    return recorded
+
+
+def client(**kwargs):
+    return Duffel(
+        access_token="some_token",
+        api_url="http://someaddress",
+        retry=RetryPolicy(**kwargs),
+    )
+
+
+def test_rate_limit_delay():
+    assert rate_limit_delay({"retry-after": "3"}) == 3
+    assert rate_limit_delay({"retry-after": "Thu, 01 Jan 1970 00:00:10 GMT"}, 4) == 6
+    assert (
+        rate_limit_delay(
+            {"ratelimit-remaining": "0", "ratelimit-reset": "1700000010"}, 1700000000
+        )
+        == 10
+    )
+    assert (
+        rate_limit_delay(
+            {
+                "ratelimit-remaining": "0",
+                "ratelimit-reset": "Tue, 14 Nov 2023 22:13:30 GMT",
+            },
+            1700000000,
+        )
+        == 10
+    )
+    assert (
+        rate_limit_delay({"ratelimit-remaining": "5", "ratelimit-reset": "10"}) is None
+    )
+    assert rate_limit_delay([]) is None
+
+
+def test_backoff_grows_exponentially_up_to_max():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.backoff(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_backoff_with_jitter_stays_within_bounds():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+    for attempt in range(5):
+        assert 0 <= policy.backoff(attempt) <= min(5, 2**attempt)
+
+
+def test_retries_get_until_success(requests_mock, sleeps):
+    requests_mock.get(
+        "http://someaddress/air/airlines/id",
+        [
+            {"json": ERROR, "status_code": 503},
+            {"exc": ConnectionError},
+            {"json": {"data": {"id": "id", "name": "Duffel Airways"}}},
+        ],
+    )
+    airline = client(jitter=False).airlines.get("id")
+    assert airline.name == "Duffel Airways"
+    assert requests_mock.call_count == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_follows_rate_limit_headers(requests_mock, sleeps):
+    requests_mock.get(
+        "http://someaddress/air/airlines/id",
+        [
+            {"json": ERROR, "status_code": 429, "headers": {"Retry-After": "7"}},
+            {"json": {"data": {"id": "id", "name": "Duffel Airways"}}},
+        ],
+    )
+    client().airlines.get("id")
+    assert sleeps == [7]
+
+
+def test_gives_up_after_max_attempts(requests_mock, sleeps):
+    requests_mock.get("http://someaddress/air/airlines/id", json=ERROR, status_code=503)
+    with pytest.raises(ApiError) as excinfo:
+        client(max_attempts=3).airlines.get("id")
+    assert excinfo.value.status_code == 503
+    assert requests_mock.call_count == 3
+    assert len(sleeps) == 2
+
+
+def test_gives_up_when_wait_exceeds_max_elapsed(requests_mock, sleeps):
+    requests_mock.get(
+        "http://someaddress/air/airlines/id",
+        json=ERROR,
+        status_code=429,
+        headers={"Retry-After": "120"},
+    )
+    with pytest.raises(ApiError):
+        client(max_elapsed=60).airlines.get("id")
+    assert requests_mock.call_count == 1
+    assert sleeps == []
+
+
+def test_does_not_retry_client_errors(requests_mock, sleeps):
+    requests_mock.get("http://someaddress/air/airlines/id", json=ERROR, status_code=422)
+    with pytest.raises(ApiError):
+        client().airlines.get("id")
+    assert requests_mock.call_count == 1
+
+
+def test_post_is_only_retried_with_an_idempotency_key(requests_mock, sleeps):
+    with raw_fixture("create-payment") as created_payment:
+        pass
+    requests_mock.post(
+        "http://someaddress/air/payments",
+        [
+            {"json": ERROR, "status_code": 503},
+            {"json": ERROR, "status_code": 503},
+            {"json": created_payment, "status_code": 201},
+        ],
+    )
+    payment = {"amount": "30.20", "currency": "GBP", "type": "balance"}
+    duffel = client(jitter=False)
+
+    with pytest.raises(ApiError):
+        duffel.payments.create().order("ord_id").payment(payment).execute()
+    assert requests_mock.call_count == 1
+
+    created = (
+        duffel.payments.create()
+        .order("ord_id")
+        .payment(payment)
+        .idempotency_key("pay-ord_id")
+        .execute()
+    )
+    assert created.id == created_payment["data"]["id"]
+    assert requests_mock.call_count == 3
+    assert requests_mock.last_request.headers["Idempotency-Key"] == "pay-ord_id"
+
+
+def test_pagination_resumes_from_last_cursor(requests_mock, sleeps):
+    airport = {
+        "id": "arp_lhr_gb",
+        "name": "Heathrow",
+        "iata_country_code": "GB",
+        "latitude": 51.470311,
+        "longitude": -0.458118,
+        "time_zone": "Europe/London",
+    }
+    requests_mock.get(
+        "http://someaddress/air/airports?limit=50",
+        complete_qs=True,
+        json={"meta": {"after": "page2"}, "data": [airport]},
+    )
+    requests_mock.get(
+        "http://someaddress/air/airports?limit=50&after=page2",
+        complete_qs=True,
+        response_list=[
+            {"json": ERROR, "status_code": 503},
+            {"json": ERROR, "status_code": 503},
+            {"json": {"meta": {"after": None}, "data": [airport, airport]}},
+        ],
+    )
+
+    airports = client(max_attempts=2).airports.list()
+    seen = []
+    with pytest.raises(ApiError):
+        for airport_ in airports:
+            seen.append(airport_)
+    assert len(seen) == 1
+
+    seen.extend(airports)
+    assert len(seen) == 3
+    first_page_calls = [
+        request
+        for request in requests_mock.request_history
+        if "after" not in request.qs
+    ]
+    assert len(first_page_calls) == 1
@@ -0,0 +1,210 @@
+from datetime import datetime, timezone
+
+from duffel_api import Duffel, SearchCache, SeatMapCache, SqliteCacheBackend
+from duffel_api.http_client import HttpClient
+from duffel_api.search_cache import client_identity, offers_expire_at, search_key
+
+from .fixtures import raw_fixture
+
+# An hour before the offers of the fixtures expire
+NOW = datetime(2020, 1, 17, 9, 42, 14, tzinfo=timezone.utc).timestamp()
+
+
+class Clock:
+    """Clock which only moves when told to"""
+
+    def __init__(self, now=NOW):
+        self.now = now
+
+    def __call__(self):
+        """The current time"""
+        return self.now
+
+
+def offer_request(*expiries):
+    """Data of an offer request whose offers expire at `expiries`"""
+    return {
+        "id": "orq_1",
+        "offers": [
+            {"id": f"off_{i}", "expires_at": at} for i, at in enumerate(expiries)
+        ],
+    }
+
+
+def test_search_key():
+    body = {"data": {"cabin_class": "economy", "passengers": [{"type": "adult"}]}}
+    same = {"data": {"passengers": [{"type": "adult"}], "cabin_class": "economy"}}
+    other = {"data": {"cabin_class": "first", "passengers": [{"type": "adult"}]}}
+    query = {"return_offers": "true"}
+    assert search_key(query, body) == search_key(query, same)
+    assert search_key(query, body) != search_key(query, other)
+    assert search_key(query, body) != search_key({"return_offers": "false"}, body)
+
+    client = Duffel(access_token="some_token").offer_requests
+    other = Duffel(access_token="other_token").offer_requests
+    assert client_identity(client) == ["Bearer some_token", "v1", HttpClient.URL]
+    assert search_key(query, body, client_identity(client)) != search_key(
+        query, body, client_identity(other)
+    )
+
+
+def test_offers_expire_at():
+    data = offer_request("2020-01-17T10:42:14.545Z", "2020-01-17T10:42:14Z")
+    assert offers_expire_at(data) == NOW + 3600
+    assert offers_expire_at({"offers": []}) is None
+
+
+def test_search_cache():
+    clock = Clock()
+    cache = SearchCache(maxsize=2, ttl=60, clock=clock)
+    data = offer_request("2020-01-17T10:42:14Z")
+
+    assert cache.get("a") is None
+    cache.set("a", data)
+    assert cache.get("a") is data
+    assert (cache.hits, cache.misses, cache.hit_rate) == (1, 1, 0.5)
+
+    clock.now += 61
+    assert cache.get("a") is None
+
+    # The offers expire before the TTL
+    cache.ttl = 7200
+    cache.set("a", data)
+    clock.now += 3600
+    assert cache.get("a") is None
+    # Already expired
+    cache.set("a", data)
+    clock.now -= 3600
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert cache.hits == cache.misses == 0
+
+
+def test_search_cache_evicts_least_recently_used():
+    cache = SearchCache(maxsize=2, clock=Clock())
+    for key in "abc":
+        cache.set(key, {"id": key})
+        cache.get("a")
+    assert cache.get("a") == {"id": "a"}
+    assert cache.get("b") is None
+    assert cache.get("c") == {"id": "c"}
+
+
+def test_sqlite_backend(tmp_path):
+    path = tmp_path / "searches.db"
+    data = offer_request("2020-01-17T10:42:14Z")
+    first = SearchCache(backend=SqliteCacheBackend(str(path)), clock=Clock())
+    first.set("a", data)
+
+    second = SearchCache(backend=SqliteCacheBackend(str(path)), clock=Clock())
+    assert second.get("a") == data
+    assert second.get("a") == data
+    assert (second.hits, second.backend_hits) == (2, 1)
+
+    later = SearchCache(backend=SqliteCacheBackend(str(path)), clock=Clock(NOW + 301))
+    assert later.get("a") is None
+
+    second.clear()
+    assert first.backend.get("a", NOW) is None
+
+
+def test_create_offer_request_is_cached(requests_mock):
+    with raw_fixture("create-offer-request") as response:
+        requests_mock.post(
+            "http://someaddress/air/offer_requests?return_offers=true",
+            complete_qs=True,
+            json=response,
+            status_code=201,
+        )
+    cache = SearchCache(clock=Clock())
+    client = Duffel(
+        access_token="some_token", api_url="http://someaddress", search_cache=cache
+    )
+
+    def search(origin):
+        return (
+            client.offer_requests.create()
+            .passengers([{"type": "adult"}])
+            .slices(
+                [
+                    {
+                        "origin": origin,
+                        "destination": "LGW",
+                        "departure_date": "2100-02-27",
+                    }
+                ]
+            )
+            .return_offers()
+            .execute()
+        )
+
+    first = search("LIS")
+    assert search("LIS") == first
+    assert requests_mock.call_count == 1
+
+    search("OPO")
+    assert requests_mock.call_count == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_clients_sharing_a_backend_only_get_their_own_searches(tmp_path, requests_mock):
+    with raw_fixture("create-offer-request") as response:
+        # Still valid by the clock of the backend, which drops expired entries
+        for offer in response["data"]["offers"]:
+            offer["expires_at"] = "2100-01-17T10:42:14.545Z"
+        requests_mock.post(
+            "http://someaddress/air/offer_requests?return_offers=true",
+            complete_qs=True,
+            json=response,
+            status_code=201,
+        )
+    backend = SqliteCacheBackend(str(tmp_path / "searches.db"))
+
+    def search(access_token):
+        """Search the same flights with a client of its own"""
+        client = Duffel(
+            access_token=access_token,
+            api_url="http://someaddress",
+            search_cache=SearchCache(backend=backend),
+        )
+        return (
+            client.offer_requests.create()
+            .passengers([{"type": "adult"}])
+            .slices(
+                [
+                    {
+                        "origin": "LIS",
+                        "destination": "LGW",
+                        "departure_date": "2100-02-27",
+                    }
+                ]
+            )
+            .return_offers()
+            .execute()
+        )
+
+    search("duffel_test_one")
+    search("duffel_live_one")
+    search("duffel_test_two")
+    assert requests_mock.call_count == 3
+    search("duffel_test_one")
+    assert requests_mock.call_count == 3
+    tokens = [
+        request.headers["Authorization"] for request in requests_mock.request_history
+    ]
+    assert tokens == [
+        "Bearer duffel_test_one",
+        "Bearer duffel_live_one",
+        "Bearer duffel_test_two",
+    ]
+
+
+def test_seat_map_cache():
+    clock = Clock()
+    cache = SeatMapCache(maxsize=2, ttl=60, clock=clock)
+    cache.set("off_1", [{"id": "sea_1"}])
+    assert cache.get("off_1") == [{"id": "sea_1"}]
+    clock.now += 61
+    assert cache.get("off_1") is None
+    assert (cache.hits, cache.misses) == (1, 1)
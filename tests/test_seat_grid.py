@@ -0,0 +1,136 @@
+import copy
+from decimal import Decimal
+
+import pytest
+
+from duffel_api import ClientError, SeatGrid
+from duffel_api.models import LazySeatMap, SeatMap
+from duffel_api.seat_grid import ELEMENT_TYPES, minor_units
+
+from .fixtures import raw_fixture
+
+np = pytest.importorskip("numpy")
+
+ADULT = "pas_00009hj8USM7Ncg31cAAA"
+CHILD = "pas_child"
+
+
+def seat_map():
+    """The seat map fixture, where a second passenger can take the seats of rows 3
+    and 4 for 5.00 more
+    """
+    with raw_fixture("get-seat-maps") as fixture:
+        json = copy.deepcopy(fixture["data"][0])
+    for row in json["cabins"][0]["rows"][3:5]:
+        for section in row["sections"]:
+            for element in section["elements"]:
+                for service in list(element.get("available_services") or ()):
+                    amount = Decimal(service["total_amount"]) + 5
+                    element["available_services"].append(
+                        dict(
+                            service,
+                            id=service["id"] + "_child",
+                            passenger_id=CHILD,
+                            total_amount=f"{amount:.2f}",
+                        )
+                    )
+    return json
+
+
+def test_seat_grid_arrays():
+    grid = SeatGrid.from_seat_map(seat_map())
+    assert grid.passenger_ids == [ADULT, CHILD]
+    assert grid.currency == "GBP"
+    cabin = grid.cabins[0]
+    assert cabin.types.shape == (7, 12)
+    assert [ELEMENT_TYPES[code] for code in cabin.types[0, :4]] == [
+        "seat",
+        "seat",
+        "seat",
+        "aisle",
+    ]
+    assert ELEMENT_TYPES[cabin.types[5, 0]] == "lavatory"
+    assert cabin.exit_rows.tolist() == [False, True, True, False, False, False, False]
+    assert grid.index["1K"] == (0, 0, 11)
+    assert cabin.window[grid.index["2K"][1:]]
+    assert not cabin.window[grid.index["2C"][1:]]
+    assert cabin.prices[0, 0].tolist() == [3000, -1]
+    assert cabin.available[3, 0] == 0b11
+    assert cabin.available[grid.index["1F"][1:]] == 0
+    assert cabin.services[3, 0, 1] == "ase_00009UhD4ongolulWAAA3A_child"
+
+
+def test_seat_grid_of_models():
+    json = seat_map()
+    grid = SeatGrid.from_seat_map(json)
+    for other in (SeatMap.from_json(json), LazySeatMap.from_json(json)):
+        other = SeatGrid.from_seat_map(other)
+        assert other.index == grid.index
+        assert (other.cabins[0].prices == grid.cabins[0].prices).all()
+
+
+def test_cheapest_seat():
+    grid = SeatGrid.from_seat_map(seat_map())
+    cheapest = grid.cheapest(ADULT)
+    assert cheapest.designator == "3A"
+    assert cheapest.service_id == "ase_00009UhD4ongolulWAAA3A"
+    assert cheapest.total_amount == Decimal("10.00")
+    assert grid.cheapest(CHILD).total_amount == Decimal("15.00")
+    assert grid.cheapest(ADULT, exit_row=True).designator == "2A"
+    assert grid.cheapest(ADULT, window=True, exit_row=True).designator == "2A"
+    assert grid.cheapest(CHILD, exit_row=True) is None
+    with pytest.raises(ClientError):
+        grid.cheapest("pas_unknown")
+
+
+def test_seat():
+    grid = SeatGrid.from_seat_map(seat_map())
+    assert grid.seat("1F", ADULT) is None
+    assert grid.seat("4K", CHILD).total_amount == Decimal("15.00")
+
+
+def test_adjacent_seats():
+    grid = SeatGrid.from_seat_map(seat_map())
+    blocks = grid.adjacent([ADULT, CHILD], limit=3)
+    assert [[seat.designator for seat in block] for block in blocks] == [
+        ["3D", "3E"],
+        ["3E", "3F"],
+        ["3H", "3J"],
+    ]
+    assert [seat.passenger_id for seat in blocks[0]] == [ADULT, CHILD]
+    assert sum(seat.total_amount for seat in blocks[0]) == Decimal("25.00")
+    # Four seats in a row only fit in the middle section, never across an aisle
+    four = grid.adjacent([ADULT] * 4)
+    assert [[seat.designator for seat in block] for block in four] == [
+        ["4D", "4E", "4F", "4G"]
+    ]
+    assert grid.adjacent([ADULT] * 3, exit_row=True) == [
+        tuple(grid.seat(designator, ADULT) for designator in ("2A", "2B", "2C"))
+    ]
+    assert grid.adjacent([ADULT] * 13) == []
+
+
+def test_minor_units():
+    assert minor_units("30.00", "GBP") == 3000
+    assert minor_units("1200", "JPY") == 1200
+    assert minor_units("1.250", "KWD") == 1250
+
+
+def test_seat_grid_currencies():
+    json = seat_map()
+    services = [
+        service
+        for row in json["cabins"][0]["rows"]
+        for section in row["sections"]
+        for element in section["elements"]
+        for service in element.get("available_services") or ()
+    ]
+    assert str(SeatGrid.from_seat_map(json).cheapest(ADULT).total_amount) == "10.00"
+    for service in services:
+        service["total_currency"] = "JPY"
+    grid = SeatGrid.from_seat_map(json)
+    assert grid.currency == "JPY"
+    assert str(grid.cheapest(ADULT).total_amount) == "10"
+    services[-1]["total_currency"] = "EUR"
+    with pytest.raises(ClientError):
+        SeatGrid.from_seat_map(json)
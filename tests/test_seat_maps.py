@@ -1,4 +1,22 @@
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from duffel_api import Duffel, SeatMapCache
+from duffel_api.models import LazySeatMap
+
 from .fixtures import fixture
+from .stub_server import fixture_body, stub_server
+
+NOT_FOUND = {
+    "meta": {"status": 404, "request_id": "FmXeZifDA60QOlgAAODB"},
+    "errors": [
+        {
+            "type": "invalid_request_error",
+            "title": "Not found",
+            "message": "The resource you are trying to access does not exist.",
+        }
+    ],
+}
 
 
 def test_get_seat_maps(requests_mock):
@@ -15,3 +33,53 @@ def test_get_seat_maps(requests_mock):
         assert element.type == "seat"
         assert element.available_services[0].id == "ase_00009UhD4ongolulWAAA1A"
         assert element.available_services[0].total_amount == "30.00"
+
+
+def test_get_seat_maps_cached(requests_mock):
+    url = "air/seat_maps?offer_id=offer-id"
+    with fixture("get-seat-maps", url, requests_mock.get, 200) as client:
+        client.seat_maps.get("offer-id")
+        client.seat_maps.get("offer-id")
+        assert requests_mock.call_count == 2
+        cache = SeatMapCache()
+        seat_maps = client.seat_maps.get("offer-id", cache=cache)
+        client.seat_maps.get("offer-id", cache=cache)
+        assert requests_mock.call_count == 3
+
+    cache = SeatMapCache()
+    client = Duffel(
+        access_token="some_token", api_url="http://someaddress", seat_map_cache=cache
+    )
+    client.seat_maps.get("offer-id")
+    lazy_seat_maps = client.seat_maps.get("offer-id", lazy=True)
+    assert requests_mock.call_count == 4
+    assert isinstance(lazy_seat_maps[0], LazySeatMap)
+    assert lazy_seat_maps == seat_maps
+    assert cache.hits == 1
+
+
+def test_get_many_seat_maps():
+    def get(handler):
+        offer_id = parse_qs(urlsplit(handler.path).query)["offer_id"][0]
+        if offer_id == "off_missing":
+            return 404, NOT_FOUND
+        return 200, fixture_body("get-seat-maps")
+
+    routes = {("GET", "/air/seat_maps"): get}
+    offer_ids = [f"off_{index}" for index in range(5)] + ["off_missing"]
+    with stub_server(routes, delay=0.05) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        started = time.perf_counter()
+        results = sorted(client.seat_maps.get_many(offer_ids, max_concurrency=6))
+        elapsed = time.perf_counter() - started
+        again = sorted(client.seat_maps.get_many(offer_ids[:5], lazy=True))
+        client.seat_maps.get("off_0")
+
+    assert elapsed < 0.05 * 6
+    assert [result.request for result in results] == offer_ids
+    assert [result.ok for result in results] == [True] * 5 + [False]
+    assert results[5].error.status_code == 404
+    assert results[0].result[0].cabins[0].aisles == 2
+    # The second batch was answered from the cache, unlike a lone get()
+    assert len(server.requests) == 7
+    assert all(isinstance(result.result[0], LazySeatMap) for result in again)
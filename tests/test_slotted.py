@@ -0,0 +1,69 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from duffel_api.models import Airline, Offer, SeatMap
+from duffel_api.models.slotted import slotted_dataclass
+
+from .fixtures import raw_fixture
+
+
+@slotted_dataclass
+class Point:
+    x: int
+    y: int
+
+    def norm(self):
+        return abs(self.x) + abs(self.y)
+
+
+@slotted_dataclass
+class Label:
+    text: str
+    size: int = 12
+
+
+@slotted_dataclass(frozen=True)
+class FrozenPoint:
+    x: int
+    y: int
+
+
+def test_slotted_dataclass():
+    point = Point(1, -2)
+    assert Point.__slots__ == ("x", "y")
+    assert not hasattr(point, "__dict__")
+    assert point == Point(1, -2)
+    assert point != Point(2, -2)
+    assert repr(point) == "Point(x=1, y=-2)"
+    assert point.norm() == 3
+    point.x = 3
+    assert dataclasses.astuple(point) == (3, -2)
+    with pytest.raises(AttributeError):
+        point.z = 0
+
+
+def test_slotted_dataclass_with_defaults():
+    assert Label("a") == Label("a", 12)
+    assert Label("a", size=8).size == 8
+
+
+def test_frozen_slotted_dataclass():
+    point = FrozenPoint(1, 2)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        point.x = 3
+    assert hash(point) == hash(FrozenPoint(1, 2))
+    assert pickle.loads(pickle.dumps(point)) == point
+    assert dataclasses.replace(point, x=3) == FrozenPoint(3, 2)
+
+
+def test_models_are_slotted():
+    with raw_fixture("get-offer-by-id") as fixture:
+        offer = Offer.from_json(fixture["data"])
+    with raw_fixture("get-seat-maps") as fixture:
+        seat_map = SeatMap.from_json(fixture["data"][0])
+    for model in (offer, offer.slices[0].segments[0], offer.owner, seat_map):
+        assert not hasattr(model, "__dict__")
+    assert pickle.loads(pickle.dumps(offer)) == offer
+    assert isinstance(offer.owner, Airline)
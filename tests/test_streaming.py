@@ -0,0 +1,131 @@
+import json
+import random
+
+import pytest
+
+from duffel_api import ApiError, Duffel
+from duffel_api.models import LazyOffer, Offer
+from duffel_api.streaming import JsonArrayParser, iter_json_array
+
+from .stub_server import fixture_body, stub_server
+
+PATH = ("data", "offers")
+
+
+def offer_request_body(count):
+    """Body of an offer request response with `count` copies of the fixture's offer"""
+    document = json.loads(fixture_body("create-offer-request"))
+    offer = document["data"]["offers"][0]
+    document["data"]["offers"] = [
+        dict(offer, id=f"off_{index}", total_amount=f"{100 + index}.00")
+        for index in range(count)
+    ]
+    return document, json.dumps(document, ensure_ascii=False).encode()
+
+
+def split(body, count):
+    """`body` cut at `count` random places"""
+    cuts = sorted(random.sample(range(1, len(body)), count))
+    return [body[start:end] for start, end in zip([0] + cuts, cuts + [len(body)])]
+
+
+def test_iter_json_array():
+    document, body = offer_request_body(20)
+    for count in (0, 1, 10, 500):
+        assert (
+            list(iter_json_array(split(body, count), PATH))
+            == document["data"]["offers"]
+        )
+
+
+def test_iter_json_array_byte_by_byte():
+    body = '{"a": [1], "data": {"x": "\\"]\\\\", "offers": [{"é": "[{"}, [2, 3], 45]}}'
+    chunks = [bytes([byte]) for byte in body.encode()]
+    assert list(iter_json_array(chunks, PATH)) == [{"é": "[{"}, [2, 3], 45]
+
+
+def test_iter_json_array_only_follows_path():
+    body = b'{"offers": [1], "data": {"meta": {"offers": [2]}, "offers": []}}'
+    assert list(iter_json_array([body], PATH)) == []
+    assert list(iter_json_array([b'{"data": {"id": 1}}'], PATH)) == []
+
+
+def test_json_array_parser_keeps_only_the_current_item():
+    _, body = offer_request_body(50)
+    parser = JsonArrayParser(PATH)
+    largest = 0
+    for start in range(0, len(body), 4096):
+        chunk = body[start : start + 4096]  # noqa: E203
+        parser.feed(chunk)
+        largest = max(largest, len(parser._text))
+    assert parser.done
+    assert largest < len(body) / 5
+
+
+def test_json_array_parser_truncated():
+    parser = JsonArrayParser(PATH)
+    assert parser.feed(b'{"data": {"offers": [{"id": 1}, {"id"') == [{"id": 1}]
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_stream_offers():
+    document, body = offer_request_body(30)
+    routes = {("POST", "/air/offer_requests"): (201, body)}
+    with stub_server(routes) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        creation = (
+            client.offer_requests.create()
+            .passengers([{"type": "adult"}])
+            .slices(
+                [
+                    {
+                        "origin": "LHR",
+                        "destination": "JFK",
+                        "departure_date": "2100-03-01",
+                    }
+                ]
+            )
+        )
+        offers = list(creation.stream())
+        lazy_offers = list(creation.lazy_offers().stream())
+        (_, path), _ = server.requests
+
+    assert path == "/air/offer_requests?return_offers=true"
+    assert offers == [Offer.from_json(offer) for offer in document["data"]["offers"]]
+    assert isinstance(lazy_offers[0], LazyOffer)
+    assert lazy_offers[29].total_amount == "129.00"
+
+
+def test_stream_offers_error():
+    error = {
+        "meta": {"status": 422, "request_id": "FmXeZifDA60QOlgAAODB"},
+        "errors": [
+            {
+                "type": "validation_error",
+                "title": "Invalid data",
+                "message": "Field 'origin' is invalid",
+            }
+        ],
+    }
+    routes = {("POST", "/air/offer_requests"): (422, error)}
+    with stub_server(routes) as server:
+        client = Duffel(access_token="some_token", api_url=server.url)
+        offers = (
+            client.offer_requests.create()
+            .passengers([{"type": "adult"}])
+            .slices(
+                [
+                    {
+                        "origin": "XXX",
+                        "destination": "JFK",
+                        "departure_date": "2100-03-01",
+                    }
+                ]
+            )
+            .stream()
+        )
+        assert server.requests == []
+        with pytest.raises(ApiError) as err:
+            next(offers)
+        assert err.value.status_code == 422
@@ -1,8 +1,14 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 
-from duffel_api.utils import parse_datetime, version
+from duffel_api.utils import (
+    parse_datetime,
+    parse_datetime_cached,
+    parse_datetime_strptime,
+    parse_duration,
+    version,
+)
 
 
 def test_version():
@@ -21,3 +27,42 @@ def test_parse_datetime():
         match="time data '2022-11-02T-2:24:52Z' does not match format '%Y-%m-%dT%H:%M:%SZ'",  # noqa: E501
     ):
         parse_datetime("2022-11-02T-2:24:52Z")
+
+
+def test_parse_datetime_matches_strptime():
+    for value in (
+        "2022-11-02T12:24:52.5Z",
+        "2022-11-02T12:24:52.123456Z",
+        "2022-11-02T12:24:52.012",
+        "2022-1-02T12:24:52.012",
+    ):
+        assert parse_datetime(value) == parse_datetime_strptime(value)
+    # Invalid dates are left to strptime, so that the error doesn't change
+    with pytest.raises(ValueError, match="day is out of range for month"):
+        parse_datetime("2022-11-31T12:24:52.0123")
+    with pytest.raises(ValueError) as excinfo:
+        parse_datetime("2022-13-02T12:24:52Z")
+    with pytest.raises(ValueError) as expected:
+        parse_datetime_strptime("2022-13-02T12:24:52Z")
+    assert str(excinfo.value) == str(expected.value)
+    # Values that aren't strings fail as in strptime, not in the cache
+    for value in (None, [], 1):
+        with pytest.raises(AttributeError, match="endswith"):
+            parse_datetime(value)
+
+
+def test_parse_datetime_is_cached():
+    parse_datetime_cached.cache_clear()
+    first = parse_datetime("2022-11-02T12:24:52Z")
+    assert parse_datetime("2022-11-02T12:24:52Z") is first
+    assert parse_datetime_cached.cache_info().hits == 1
+
+
+def test_parse_duration():
+    assert parse_duration("PT02H26M") == timedelta(hours=2, minutes=26)
+    assert parse_duration("P1DT2H") == timedelta(days=1, hours=2)
+    assert parse_duration("PT45S") == timedelta(seconds=45)
+    assert parse_duration("P2D") == timedelta(days=2)
+    for value in ("P", "PT", "P1DT", "2H", "PT1H2X"):
+        with pytest.raises(ValueError, match="invalid ISO 8601 duration"):
+            parse_duration(value)
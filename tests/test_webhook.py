@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from duffel_api.models import Webhook
 
 
@@ -12,4 +14,6 @@ def test_webhook_model_parsing():
         "created_at": "2020-04-11T15:48:11.642Z",
         "active": "true",
     }
-    assert Webhook.from_json(json)
+    webhook = Webhook.from_json(json)
+    assert webhook.created_at == datetime(2020, 4, 11, 15, 48, 11, 642000)
+    assert webhook.updated_at == webhook.created_at